@@ -15,27 +15,44 @@ A comprehensive harness for optimizing Claude Code sessions with:
 __version__ = "1.2.0"
 __author__ = "Morten Elmstroem Hansen"
 
-# Lazy imports for optional modules
-from .lazy_loader import (
-    LazyContextLoader,
-    FilePriority,
-    PrioritizedFile,
-    get_lazy_loader,
-)
-from .exploration_cache import (
-    ExplorationCache,
-    CachedExploration,
-    get_exploration_cache,
-)
-from .file_filter import (
-    FileFilter,
-    FilterResult,
-)
-from .output_compressor import (
-    OutputCompressor,
-    CompressionRule,
-    CompressionResult,
-)
+# Public names re-exported from submodules, imported on first access so that
+# "import claude_harness.<module>" doesn't load every optional module
+_LAZY_EXPORTS = {
+    # Lazy loading
+    "LazyContextLoader": "lazy_loader",
+    "FilePriority": "lazy_loader",
+    "PrioritizedFile": "lazy_loader",
+    "get_lazy_loader": "lazy_loader",
+    # Exploration cache
+    "ExplorationCache": "exploration_cache",
+    "CachedExploration": "exploration_cache",
+    "get_exploration_cache": "exploration_cache",
+    # File filtering
+    "FileFilter": "file_filter",
+    "FilterResult": "file_filter",
+    # Output compression
+    "OutputCompressor": "output_compressor",
+    "CompressionRule": "output_compressor",
+    "CompressionResult": "output_compressor",
+}
+
+
+def __getattr__(name):
+    """Import re-exported names from their submodule on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __all__ = [
     # Lazy loading
@@ -6,6 +6,7 @@ Commands:
 - feature: Manage features (add, start, complete, list)
 - progress: Manage session progress
 - e2e: E2E testing commands
+- daemon: Serve hook events over a Unix socket
 """
 
 import json
@@ -208,6 +209,8 @@ def refresh(ctx, path: str, update_claude_md: bool):
             start_command=config_data.get("startup", {}).get("start_command", "python main.py"),
             protected_branches=config_data.get("git", {}).get("protected_branches", ["main", "master"]),
             branch_prefixes=config_data.get("git", {}).get("branch_prefixes", ["feat/", "fix/", "chore/", "docs/", "refactor/"]),
+            git_huge_repo_threshold=config_data.get("git", {}).get("huge_repo_threshold", 100000),
+            git_auto_tune=config_data.get("git", {}).get("auto_tune", True),
             e2e_enabled=config_data.get("e2e", {}).get("enabled", False),
             e2e_base_url=config_data.get("e2e", {}).get("base_url", f"http://localhost:{config_data.get('startup', {}).get('port', 8000)}"),
             # Testing config
@@ -245,9 +248,9 @@ def refresh(ctx, path: str, update_claude_md: bool):
         initializer._write_hooks()
         console.print("  [green]Refreshed:[/green] .claude-harness/hooks/")
 
-        # Regenerate PowerShell init if on Windows or if it exists
+        # Regenerate PowerShell init if it exists or PowerShell is available
         ps_init = project_path / "scripts" / "init.ps1"
-        if ps_init.exists() or sys.platform == "win32":
+        if ps_init.exists() or config.generate_powershell:
             initializer._write_init_powershell()
             console.print("  [green]Refreshed:[/green] scripts/init.ps1")
 
@@ -1248,6 +1251,17 @@ def context_track_file(ctx, filepath: str, chars: int, write: bool):
         console.print(f"[dim]Tracked file read: {filepath} ({chars} chars)[/dim]")
 
 
+@context.command("flush")
+@click.pass_context
+def context_flush(ctx):
+    """Record events queued by the tracking hooks (for hooks)."""
+    project_path = ctx.obj["project_path"]
+    ct = ContextTracker(project_path)
+
+    count = ct.flush_pending_events()
+    console.print(f"[dim]Recorded {count} queued event(s)[/dim]")
+
+
 @context.command("track-command")
 @click.argument("command")
 @click.option("--output-chars", "-o", default=0, type=int, help="Output character count")
@@ -2205,6 +2219,38 @@ def run_init(ctx):
         sys.exit(e.returncode)
 
 
+@main.command()
+@click.pass_context
+def daemon(ctx):
+    """Serve hook events over a Unix socket until interrupted.
+
+    While the daemon runs, the tracking hooks send their events to
+    .claude-harness/harness.sock instead of starting claude-harness
+    for every tool call. Run it in the background for a session.
+    """
+    import signal
+
+    from .hook_daemon import HookDaemon
+
+    project_path = ctx.obj["project_path"]
+    hook_daemon = HookDaemon(project_path)
+
+    try:
+        hook_daemon.bind()
+    except (RuntimeError, OSError) as e:
+        console.print(f"[red]Cannot start hook daemon: {e}[/red]")
+        sys.exit(1)
+
+    # Exit through serve_forever's cleanup (removing the socket) on kill
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+
+    console.print(f"[green]Hook daemon listening on {hook_daemon.socket_path}[/green]")
+    try:
+        hook_daemon.serve_forever()
+    except KeyboardInterrupt:
+        console.print("[dim]Hook daemon stopped[/dim]")
+
+
 # --- Orchestration Commands ---
 
 
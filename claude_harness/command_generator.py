@@ -1,5 +1,6 @@
 """Generate Claude Code slash commands for claude-harness integration."""
 
+import functools
 from pathlib import Path
 from typing import Dict, Optional
 
@@ -649,16 +650,36 @@ def generate_command_file(name: str, description: str, content: str) -> str:
 """
 
 
-def write_commands_to_directory(commands_dir: Path, commands: Optional[Dict] = None) -> list:
+def _write_if_changed(path: Path, content: str) -> bool:
+    """Write content to path unless the file already holds it.
+
+    Returns:
+        True if the file was written
+    """
+    try:
+        if path.read_text() == content:
+            return False
+    except (OSError, UnicodeDecodeError):
+        pass
+    path.write_text(content)
+    return True
+
+
+def write_commands_to_directory(
+    commands_dir: Path, commands: Optional[Dict] = None, *, only_changed: bool = False
+) -> list:
     """
     Write all harness commands to the .claude/commands directory.
 
+    Files that already hold the command content are left untouched.
+
     Args:
         commands_dir: Path to .claude/commands directory
         commands: Optional dict of commands (defaults to HARNESS_COMMANDS)
+        only_changed: Return only the files actually written
 
     Returns:
-        List of created command file paths
+        List of command file paths (all of them, or the written ones)
     """
     if commands is None:
         commands = HARNESS_COMMANDS
@@ -673,8 +694,8 @@ def write_commands_to_directory(commands_dir: Path, commands: Optional[Dict] = N
             description=cmd_data["description"],
             content=cmd_data["content"]
         )
-        file_path.write_text(content)
-        created_files.append(str(file_path))
+        if _write_if_changed(file_path, content) or not only_changed:
+            created_files.append(str(file_path))
 
     return created_files
 
@@ -687,9 +708,7 @@ def get_command_list() -> list:
     ]
 
 
-def generate_commands_readme(commands_dir: Path) -> str:
-    """Generate a README for the commands directory."""
-    readme_content = """# Claude Harness Commands
+_README_HEADER = """# Claude Harness Commands
 
 These slash commands integrate claude-harness with Claude Code.
 
@@ -698,10 +717,8 @@ These slash commands integrate claude-harness with Claude Code.
 | Command | Description |
 |---------|-------------|
 """
-    for name, data in sorted(HARNESS_COMMANDS.items()):
-        readme_content += f"| `/{name}` | {data['description']} |\n"
 
-    readme_content += """
+_README_FOOTER = """
 ## Usage
 
 Type any command in Claude Code, e.g.:
@@ -724,6 +741,30 @@ claude-harness init
 ```
 """
 
+
+@functools.lru_cache(maxsize=None)
+def _commands_readme() -> str:
+    """README content for HARNESS_COMMANDS, which is fixed per process."""
+    rows = [
+        f"| `/{name}` | {data['description']} |\n"
+        for name, data in sorted(HARNESS_COMMANDS.items())
+    ]
+    return "".join([_README_HEADER, *rows, _README_FOOTER])
+
+
+def generate_commands_readme(
+    commands_dir: Path, *, only_changed: bool = False
+) -> Optional[str]:
+    """Generate a README for the commands directory.
+
+    Args:
+        commands_dir: Path to .claude/commands directory
+        only_changed: Return None when the README was already current
+
+    Returns:
+        Path of the README (None if only_changed and it was not written)
+    """
     readme_path = commands_dir / "README.md"
-    readme_path.write_text(readme_content)
+    if not _write_if_changed(readme_path, _commands_readme()) and only_changed:
+        return None
     return str(readme_path)
@@ -11,6 +11,7 @@ The goal is to provide awareness and help optimize context usage.
 """
 
 import json
+import os
 import time
 from pathlib import Path
 from datetime import datetime, timezone
@@ -26,6 +27,16 @@ from rich.progress import Progress, BarColumn, TextColumn
 console = Console()
 
 
+# Context events queued by the tracking hooks when no hook daemon is running,
+# one hook daemon event line each (e.g. "track-read<TAB>path<TAB>chars"); also
+# hardcoded in the generated hooks/send.sh
+PENDING_EVENTS_FILE = ".pending-events"
+
+# Reads queued by hooks from before the events queue, one "path<TAB>chars"
+# line each; still drained so a refresh doesn't drop them
+PENDING_READS_FILE = ".pending-reads"
+
+
 # Approximate token ratios (these are rough estimates)
 CHARS_PER_TOKEN = 4  # English text averages ~4 chars per token
 CODE_CHARS_PER_TOKEN = 3.5  # Code tends to be slightly more token-dense
@@ -160,8 +171,11 @@ class ContextTracker:
         self.project_path = Path(project_path).resolve()
         self.metrics_file = self.project_path / ".claude-harness" / "context_metrics.json"
         self.config_file = self.project_path / ".claude-harness" / "config.json"
+        self.pending_events_file = self.project_path / ".claude-harness" / PENDING_EVENTS_FILE
+        self.pending_reads_file = self.project_path / ".claude-harness" / PENDING_READS_FILE
         self._metrics: Optional[ContextMetrics] = None
         self._start_time = time.time()
+        self._ingested_events = 0
 
     def _load_config(self) -> dict:
         """Load harness config."""
@@ -177,6 +191,7 @@ class ContextTracker:
         - If previous session was marked closed, starts fresh session
         - Archives previous session metrics before reset
         - Respects auto_reset_session config setting
+        - Ingests events queued by the tracking hooks
         """
         if self._metrics is not None:
             return self._metrics
@@ -218,8 +233,79 @@ class ContextTracker:
             self._metrics.context_warning_threshold = context_config.get("warning_threshold", 0.7)
             self._metrics.context_critical_threshold = context_config.get("critical_threshold", 0.9)
 
+        if self._ingest_pending_events(record=context_config.get("enabled", True)):
+            self._save_metrics()
+
         return self._metrics
 
+    def _claim_queue(self, queue_file: Path) -> List[str]:
+        """Take the lines of a hook queue file, removing it.
+
+        The queue is renamed before it is read, so hooks appending meanwhile
+        start a new one instead of losing lines.
+        """
+        claimed = queue_file.with_name(f"{queue_file.name}.{os.getpid()}")
+        try:
+            os.replace(queue_file, claimed)
+        except OSError:
+            return []
+
+        try:
+            return claimed.read_text(encoding="utf-8", errors="replace").splitlines()
+        except OSError:
+            return []
+        finally:
+            claimed.unlink(missing_ok=True)
+
+    def _ingest_pending_events(self, record: bool = True) -> int:
+        """Move events queued by the tracking hooks into the loaded metrics.
+
+        Args:
+            record: Whether to count the events (False just drains the queues)
+
+        Returns:
+            Number of events recorded
+        """
+        lines = [
+            f"track-read\t{line}" for line in self._claim_queue(self.pending_reads_file)
+        ]
+        lines += self._claim_queue(self.pending_events_file)
+
+        if not record:
+            return 0
+
+        handlers = {
+            "track-read": lambda args: self._record_file_read(args[0], int(args[1])),
+            "track-write": lambda args: self._record_file_write(args[0], int(args[1])),
+            "track-command": lambda args: self._record_command(args[0]),
+        }
+        recorded = 0
+        for line in lines:
+            name, *args = line.split("\t")
+            handler = handlers.get(name)
+            if handler is None or not args or not args[0]:
+                continue
+            try:
+                handler(args)
+            except (ValueError, IndexError):
+                continue
+            recorded += 1
+
+        self._ingested_events += recorded
+        return recorded
+
+    def flush_pending_events(self) -> int:
+        """Ingest events queued by the tracking hooks and save the metrics.
+
+        Returns:
+            Number of queued events recorded by this tracker
+        """
+        self._load_metrics()
+        # Anything queued after the metrics were first loaded
+        if self.is_enabled() and self._ingest_pending_events():
+            self._save_metrics()
+        return self._ingested_events
+
     def _archive_session(self, metrics: ContextMetrics):
         """Archive a closed session's metrics to session history.
 
@@ -348,7 +434,13 @@ class ContextTracker:
         if not self.is_enabled():
             return
 
-        metrics = self._load_metrics()
+        self._load_metrics()
+        self._record_file_read(filepath, content_length)
+        self._save_metrics()
+
+    def _record_file_read(self, filepath: str, content_length: int):
+        """Add a file read to the loaded metrics without saving."""
+        metrics = self._metrics
 
         if filepath not in metrics.files_read:
             metrics.files_read.append(filepath)
@@ -369,14 +461,18 @@ class ContextTracker:
             task["files_read"] += 1
             task["tokens"] += tokens
 
-        self._save_metrics()
-
     def track_file_write(self, filepath: str, content_length: int):
         """Track a file write operation."""
         if not self.is_enabled():
             return
 
-        metrics = self._load_metrics()
+        self._load_metrics()
+        self._record_file_write(filepath, content_length)
+        self._save_metrics()
+
+    def _record_file_write(self, filepath: str, content_length: int):
+        """Add a file write to the loaded metrics without saving."""
+        metrics = self._metrics
 
         if filepath not in metrics.files_written:
             metrics.files_written.append(filepath)
@@ -388,14 +484,18 @@ class ContextTracker:
         metrics.estimated_total_tokens += tokens
         metrics.tool_calls += 1
 
-        self._save_metrics()
-
     def track_command(self, command: str, output_length: int = 0):
         """Track a command execution."""
         if not self.is_enabled():
             return
 
-        metrics = self._load_metrics()
+        self._load_metrics()
+        self._record_command(command, output_length)
+        self._save_metrics()
+
+    def _record_command(self, command: str, output_length: int = 0):
+        """Add a command execution to the loaded metrics without saving."""
+        metrics = self._metrics
         metrics.commands_executed += 1
         metrics.tool_calls += 1
 
@@ -407,8 +507,6 @@ class ContextTracker:
         metrics.estimated_output_tokens += out_tokens
         metrics.estimated_total_tokens += cmd_tokens + out_tokens
 
-        self._save_metrics()
-
     def track_conversation(self, user_message_length: int, assistant_response_length: int):
         """Track a conversation turn."""
         if not self.is_enabled():
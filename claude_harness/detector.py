@@ -9,6 +9,7 @@ Automatically detects:
 - Existing structure
 """
 
+import functools
 import os
 import json
 from pathlib import Path
@@ -16,7 +17,24 @@ from dataclasses import dataclass, field
 from typing import Optional
 
 
-@dataclass
+@functools.lru_cache(maxsize=64)
+def _read_lower_cached(path: str, mtime_ns: int, size: int) -> str:
+    """Read a file as lowercase text, memoized on its stat signature."""
+    return Path(path).read_text().lower()
+
+
+def _read_lower(path: Path) -> str:
+    """Read a file as lowercase text, reusing earlier reads of an unchanged file.
+
+    The detector scans the same dependency file for frameworks, databases
+    and test tools, and repeated detections in one process (retries, batch
+    inits) see the same manifests; both are served from one read.
+    """
+    st = path.stat()
+    return _read_lower_cached(str(path), st.st_mtime_ns, st.st_size)
+
+
+@dataclass(slots=True)
 class DetectedStack:
     """Detected project stack information."""
 
@@ -278,7 +296,7 @@ class StackDetector:
     def _detect_python_framework(self, requirements_path: Path):
         """Detect Python framework from requirements file."""
         try:
-            content = requirements_path.read_text().lower()
+            content = _read_lower(requirements_path)
 
             for indicator, framework in self.PYTHON_FRAMEWORKS.items():
                 if indicator in content:
@@ -366,7 +384,7 @@ class StackDetector:
             env_path = self.project_path / env_file
             if env_path.exists():
                 try:
-                    content = env_path.read_text().lower()
+                    content = _read_lower(env_path)
                     if "postgresql" in content or "postgres" in content:
                         self.detected.database = "PostgreSQL"
                     elif "mysql" in content:
@@ -389,7 +407,7 @@ class StackDetector:
             dep_path = self.project_path / self.detected.dependency_file
             if dep_path.exists():
                 try:
-                    content = dep_path.read_text().lower()
+                    content = _read_lower(dep_path)
                     for indicator, db in self.DATABASE_INDICATORS.items():
                         if indicator in content:
                             self.detected.database = db.split("/")[0]
@@ -413,7 +431,7 @@ class StackDetector:
             dep_path = self.project_path / self.detected.dependency_file
             if dep_path.exists():
                 try:
-                    content = dep_path.read_text().lower()
+                    content = _read_lower(dep_path)
                     for indicator, framework in self.TEST_FRAMEWORKS.items():
                         if indicator in content:
                             self.detected.test_framework = framework
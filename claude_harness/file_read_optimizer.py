@@ -12,15 +12,71 @@ Strategies:
 - head: Show first N lines (useful for data files)
 """
 
+import asyncio
+import functools
+import io
 import json
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, List, Union, Callable
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, fall back to the stdlib parser
+    orjson = None
 
 
 # Approximate token ratio
 CHARS_PER_TOKEN = 4
 
+# Leading bytes of common binary formats (gzip, zip, ELF, PNG, bzip2, xz)
+_BINARY_MAGICS = (
+    b"\x1f\x8b",
+    b"PK\x03\x04",
+    b"\x7fELF",
+    b"\x89PNG",
+    b"BZh",
+    b"\xfd7zXZ",
+)
+
+# Number of bytes sniffed from the start of a file
+_SNIFF_BYTES = 16
+
+# Precomputed two-space indentation strings for structure summaries
+_MAX_INDENT = 32
+_INDENTS = tuple("  " * i for i in range(_MAX_INDENT))
+
+# Files below this size are always read fully
+SMALL_FILE_THRESHOLD = 1000  # bytes
+
+# Size classes for memoized read recommendations
+_BUCKET_SMALL = 0  # below SMALL_FILE_THRESHOLD
+_BUCKET_STANDARD = 1  # below FileReadOptimizer.LARGE_FILE_THRESHOLD
+_BUCKET_LARGE = 2
+
+# Below this many files, process pool startup costs more than it saves
+PARALLEL_MIN_FILES = 4
+
+
+def _loads_json(content: Union[str, bytes]) -> Any:
+    """Parse JSON, preferring orjson when it is installed.
+
+    orjson parses ``bytes`` directly without a decode round trip. It is
+    stricter than the stdlib (no NaN/Infinity, 64-bit integers only), so
+    anything it rejects is retried with ``json.loads`` before giving up.
+
+    Raises:
+        json.JSONDecodeError: If the content is not valid JSON
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(content)
+
 
 class FileReadOptimizer:
     """Optimize file reads to reduce token usage.
@@ -46,7 +102,11 @@ class FileReadOptimizer:
 
     def __init__(self):
         """Initialize the optimizer."""
-        pass
+        # One summarizer per suffix, with its strategy settings bound up front
+        self._dispatch: Dict[str, Callable[[str], str]] = {
+            suffix: self._build_summarizer(suffix, strategy)
+            for suffix, strategy in self.SUMMARIZABLE.items()
+        }
 
     def should_summarize(self, filepath: str, size_bytes: int) -> bool:
         """Determine if a file should be summarized instead of fully read.
@@ -90,136 +150,253 @@ class FileReadOptimizer:
         """
         original_tokens = len(content) // CHARS_PER_TOKEN
 
-        strategy = self.get_summary_strategy(filepath)
-        if strategy is None:
+        summarizer = self._dispatch.get(Path(filepath).suffix.lower())
+        if summarizer is None:
             # No strategy available, return as-is
             return content, 0
 
-        strategy_name = strategy.get("strategy", "truncate")
-
-        if strategy_name == "structure":
-            max_depth = strategy.get("max_depth", 2)
-            summarized = self._summarize_structured(filepath, content, max_depth)
-        elif strategy_name == "headings":
-            summarized = self.extract_markdown_headings(content)
-        elif strategy_name == "tail":
-            lines = strategy.get("lines", 100)
-            summarized = self._extract_tail(content, lines)
-        elif strategy_name == "head":
-            lines = strategy.get("lines", 20)
-            summarized = self._extract_head(content, lines)
-        else:  # truncate is the default
-            max_lines = strategy.get("max_lines", 50)
-            summarized = self.truncate_with_indicator(content, max_lines)
+        summarized = summarizer(content)
 
         summarized_tokens = len(summarized) // CHARS_PER_TOKEN
         tokens_saved = max(0, original_tokens - summarized_tokens)
 
         return summarized, tokens_saved
 
-    def _summarize_structured(self, filepath: str, content: str, max_depth: int) -> str:
-        """Summarize structured files (JSON/YAML).
+    def summarize_batch(
+        self, items: List[Tuple[str, str]], parallel: bool = True
+    ) -> List[Tuple[str, int]]:
+        """Summarize several files, optionally across a process pool.
+
+        Summarization is CPU-bound and independent per file, so larger
+        batches are spread over all cores. Small batches (fewer than
+        PARALLEL_MIN_FILES) always run in-process.
 
         Args:
-            filepath: Path to determine file type
-            content: File content
-            max_depth: Maximum depth to extract
+            items: List of (filepath, content) tuples
+            parallel: Use a process pool for large batches (default: True)
 
         Returns:
-            Structure summary string
+            List of (summarized_content, estimated_tokens_saved) tuples,
+            in the same order as items
         """
-        suffix = Path(filepath).suffix.lower()
+        if not parallel or len(items) < PARALLEL_MIN_FILES:
+            return [self.summarize_file(path, content) for path, content in items]
 
-        if suffix == ".json":
-            return self.extract_json_structure(content, max_depth)
-        elif suffix in (".yaml", ".yml"):
-            return self._extract_yaml_structure(content, max_depth)
-        else:
-            return self.truncate_with_indicator(content, 50)
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            return list(executor.map(_summarize_one, items, chunksize=4))
+
+    async def summarize_files_async(self, paths: List[str]) -> List[Tuple[str, int]]:
+        """Read and summarize files with reads overlapping summarization.
+
+        Each file is read and then summarized in the default thread pool,
+        so reading one file proceeds while another is being parsed.
 
-    def extract_json_structure(self, content: str, max_depth: int = 2) -> str:
+        Args:
+            paths: Paths of files to summarize
+
+        Returns:
+            List of (summarized_content, estimated_tokens_saved) tuples,
+            in the same order as paths
+        """
+
+        async def _read_and_summarize(path: str) -> Tuple[str, int]:
+            content = await asyncio.to_thread(
+                Path(path).read_text, encoding="utf-8", errors="replace"
+            )
+            return await asyncio.to_thread(self.summarize_file, path, content)
+
+        return list(
+            await asyncio.gather(*(_read_and_summarize(path) for path in paths))
+        )
+
+    def _build_summarizer(
+        self, suffix: str, strategy: Dict[str, Any]
+    ) -> Callable[[str], str]:
+        """Bind the summarization method and settings for one file type.
+
+        Args:
+            suffix: Lowercase file suffix (e.g. ".json")
+            strategy: Strategy configuration from SUMMARIZABLE
+
+        Returns:
+            Callable taking file content and returning its summary
+        """
+        strategy_name = strategy.get("strategy", "truncate")
+        bind = functools.partial
+
+        if strategy_name == "structure":
+            max_depth = strategy.get("max_depth", 2)
+            if suffix == ".json":
+                return bind(self.extract_json_structure, max_depth=max_depth)
+            elif suffix in (".yaml", ".yml"):
+                return bind(self._extract_yaml_structure, max_depth=max_depth)
+            else:
+                return bind(self.truncate_with_indicator, max_lines=50)
+        elif strategy_name == "headings":
+            return self.extract_markdown_headings
+        elif strategy_name == "tail":
+            return bind(self._extract_tail, num_lines=strategy.get("lines", 100))
+        elif strategy_name == "head":
+            return bind(self._extract_head, num_lines=strategy.get("lines", 20))
+        else:  # truncate is the default
+            max_lines = strategy.get("max_lines", 50)
+            return bind(self.truncate_with_indicator, max_lines=max_lines)
+
+    def extract_json_structure(
+        self, content: Union[str, bytes], max_depth: int = 2
+    ) -> str:
         """Extract JSON structure showing keys at each level.
 
         Args:
-            content: JSON string
+            content: JSON string, or raw bytes as read from disk
             max_depth: Maximum depth to show (default: 2)
 
         Returns:
             Human-readable structure representation
         """
         try:
-            data = json.loads(content)
-        except json.JSONDecodeError as e:
+            data = _loads_json(content)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            if isinstance(content, bytes):
+                content = content.decode("utf-8", errors="replace")
             return f"[JSON Parse Error: {e}]\n{self.truncate_with_indicator(content, 20)}"
 
-        lines = ["[JSON Structure]"]
-        self._extract_structure_recursive(data, lines, depth=0, max_depth=max_depth)
+        buf = io.StringIO()
+        buf.write("[JSON Structure]")
+        self._extract_structure_recursive(data, buf, depth=0, max_depth=max_depth)
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
     def _extract_structure_recursive(
         self,
         data: Any,
-        lines: list,
+        buf: io.StringIO,
         depth: int,
         max_depth: int,
         prefix: str = "",
     ):
         """Recursively extract structure from nested data.
 
+        Each emitted line is written to ``buf`` preceded by a newline, so
+        the caller only needs to write the header line first. Nodes are
+        dispatched on their exact type; anything that is not a dict or
+        list is rendered as a scalar.
+
         Args:
             data: Data to extract from
-            lines: List to append lines to
+            buf: Buffer to write lines to
             depth: Current depth
             max_depth: Maximum depth to traverse
             prefix: Indentation prefix
         """
-        indent = "  " * depth
+        indent = _INDENTS[depth] if depth < _MAX_INDENT else "  " * depth
 
         if depth >= max_depth:
-            if isinstance(data, dict):
-                lines.append(f"{indent}{prefix}{{...}} ({len(data)} keys)")
-            elif isinstance(data, list):
-                lines.append(f"{indent}{prefix}[...] ({len(data)} items)")
+            buf.write("\n")
+            buf.write(indent)
+            buf.write(prefix)
+            unit = self._COLLAPSED_UNITS.get(type(data))
+            if unit is not None:
+                buf.write(unit.format(len(data)))
             else:
                 # Show truncated value
                 value_str = str(data)
                 if len(value_str) > 50:
                     value_str = value_str[:47] + "..."
-                lines.append(f"{indent}{prefix}{value_str}")
+                buf.write(value_str)
             return
 
-        if isinstance(data, dict):
-            if prefix:
-                lines.append(f"{indent}{prefix}{{")
-            for key, value in list(data.items())[:20]:  # Limit to first 20 keys
-                key_str = f'"{key}": ' if isinstance(key, str) else f"{key}: "
-                self._extract_structure_recursive(
-                    value, lines, depth + 1, max_depth, key_str
-                )
-            if len(data) > 20:
-                lines.append(f"{indent}  ... and {len(data) - 20} more keys")
-            if prefix:
-                lines.append(f"{indent}}}")
-        elif isinstance(data, list):
-            if prefix:
-                lines.append(f"{indent}{prefix}[")
-            if len(data) > 0:
-                # Show structure of first item
-                lines.append(f"{indent}  [0]:")
-                self._extract_structure_recursive(
-                    data[0], lines, depth + 2, max_depth, ""
-                )
-                if len(data) > 1:
-                    lines.append(f"{indent}  ... ({len(data) - 1} more items)")
-            if prefix:
-                lines.append(f"{indent}]")
-        else:
-            # Scalar value
-            value_str = str(data)
-            if len(value_str) > 80:
-                value_str = value_str[:77] + "..."
-            lines.append(f"{indent}{prefix}{value_str}")
+        handler = self._STRUCTURE_HANDLERS.get(
+            type(data), FileReadOptimizer._write_scalar
+        )
+        handler(self, data, buf, indent, depth, max_depth, prefix)
+
+    def _write_dict(
+        self,
+        data: Dict[Any, Any],
+        buf: io.StringIO,
+        indent: str,
+        depth: int,
+        max_depth: int,
+        prefix: str,
+    ):
+        """Write the structure of a dict node (see _extract_structure_recursive)."""
+        write = buf.write
+        if prefix:
+            write("\n")
+            write(indent)
+            write(prefix)
+            write("{")
+        for key, value in list(data.items())[:20]:  # Limit to first 20 keys
+            key_str = f'"{key}": ' if isinstance(key, str) else f"{key}: "
+            self._extract_structure_recursive(
+                value, buf, depth + 1, max_depth, key_str
+            )
+        if len(data) > 20:
+            write("\n")
+            write(indent)
+            write(f"  ... and {len(data) - 20} more keys")
+        if prefix:
+            write("\n")
+            write(indent)
+            write("}")
+
+    def _write_list(
+        self,
+        data: List[Any],
+        buf: io.StringIO,
+        indent: str,
+        depth: int,
+        max_depth: int,
+        prefix: str,
+    ):
+        """Write the structure of a list node (see _extract_structure_recursive)."""
+        write = buf.write
+        if prefix:
+            write("\n")
+            write(indent)
+            write(prefix)
+            write("[")
+        if len(data) > 0:
+            # Show structure of first item
+            write("\n")
+            write(indent)
+            write("  [0]:")
+            self._extract_structure_recursive(
+                data[0], buf, depth + 2, max_depth, ""
+            )
+            if len(data) > 1:
+                write("\n")
+                write(indent)
+                write(f"  ... ({len(data) - 1} more items)")
+        if prefix:
+            write("\n")
+            write(indent)
+            write("]")
+
+    def _write_scalar(
+        self,
+        data: Any,
+        buf: io.StringIO,
+        indent: str,
+        depth: int,
+        max_depth: int,
+        prefix: str,
+    ):
+        """Write a scalar leaf value (see _extract_structure_recursive)."""
+        value_str = str(data)
+        if len(value_str) > 80:
+            value_str = value_str[:77] + "..."
+        buf.write("\n")
+        buf.write(indent)
+        buf.write(prefix)
+        buf.write(value_str)
+
+    # Per-type handlers for _extract_structure_recursive
+    _STRUCTURE_HANDLERS = {dict: _write_dict, list: _write_list}
+
+    # Container summaries shown once max_depth is reached
+    _COLLAPSED_UNITS = {dict: "{{...}} ({} keys)", list: "[...] ({} items)"}
 
     def _extract_yaml_structure(self, content: str, max_depth: int) -> str:
         """Extract YAML structure using regex-based heuristics.
@@ -233,7 +410,9 @@ class FileReadOptimizer:
         Returns:
             Structure summary
         """
-        lines = ["[YAML Structure]"]
+        buf = io.StringIO()
+        write = buf.write
+        write("[YAML Structure]")
         content_lines = content.split("\n")
 
         # Track current depth based on indentation
@@ -242,7 +421,7 @@ class FileReadOptimizer:
 
         for line in content_lines:
             if shown_lines >= max_shown:
-                lines.append(f"... ({len(content_lines) - shown_lines} more lines)")
+                write(f"\n... ({len(content_lines) - shown_lines} more lines)")
                 break
 
             stripped = line.lstrip()
@@ -254,40 +433,48 @@ class FileReadOptimizer:
             depth = indent // 2
 
             if depth <= max_depth:
+                write("\n")
+                write(_INDENTS[depth] if depth < _MAX_INDENT else "  " * depth)
+
                 # Show the key (up to colon) and indicate if there's a value
-                if ":" in stripped:
-                    key_part = stripped.split(":")[0]
-                    value_part = stripped.split(":", 1)[1].strip() if ":" in stripped else ""
+                key_part, sep, value_part = stripped.partition(":")
+                if sep:
+                    value_part = value_part.strip()
+                    write(key_part)
 
                     if value_part:
                         # Has inline value
                         if len(value_part) > 50:
                             value_part = value_part[:47] + "..."
-                        lines.append(f"{'  ' * depth}{key_part}: {value_part}")
+                        write(": ")
+                        write(value_part)
                     else:
                         # Nested structure
-                        lines.append(f"{'  ' * depth}{key_part}:")
+                        write(":")
                 else:
                     # List item or other
                     if len(stripped) > 60:
                         stripped = stripped[:57] + "..."
-                    lines.append(f"{'  ' * depth}{stripped}")
+                    write(stripped)
 
                 shown_lines += 1
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
-    def extract_markdown_headings(self, content: str) -> str:
+    def extract_markdown_headings(
+        self, content: str, lines: Optional[List[str]] = None
+    ) -> str:
         """Extract Markdown headings and first paragraph under each.
 
         Args:
             content: Markdown string
+            lines: Pre-split lines of content (split here if not given)
 
         Returns:
             Summary with headings and brief content
         """
+        content_lines = lines if lines is not None else content.split("\n")
         lines = ["[Markdown Summary]"]
-        content_lines = content.split("\n")
 
         i = 0
         while i < len(content_lines):
@@ -324,27 +511,34 @@ class FileReadOptimizer:
 
         if len(lines) == 1:
             # No headings found, show truncated content
-            return self.truncate_with_indicator(content, 30)
+            return self.truncate_with_indicator(content, 30, lines=content_lines)
 
         return "\n".join(lines)
 
-    def truncate_with_indicator(self, content: str, max_lines: int) -> str:
+    def truncate_with_indicator(
+        self, content: str, max_lines: int, lines: Optional[List[str]] = None
+    ) -> str:
         """Truncate content to max lines with clear indicator.
 
         Args:
             content: Content to truncate
             max_lines: Maximum number of lines to include
+            lines: Pre-split lines of content, if the caller already has them
 
         Returns:
             Truncated content with indicator
         """
-        lines = content.split("\n")
+        total = len(lines) if lines is not None else content.count("\n") + 1
 
-        if len(lines) <= max_lines:
+        if total <= max_lines:
             return content
 
-        truncated = lines[:max_lines]
-        remaining = len(lines) - max_lines
+        if lines is not None:
+            truncated = lines[:max_lines]
+        else:
+            # Only materialize the lines that are kept
+            truncated = content.split("\n", max_lines)[:max_lines]
+        remaining = total - max_lines
 
         truncated.append("")
         truncated.append(f"[... {remaining} more lines truncated ...]")
@@ -361,17 +555,55 @@ class FileReadOptimizer:
         Returns:
             Tail content with indicator
         """
-        lines = content.split("\n")
+        total = content.count("\n") + 1
 
-        if len(lines) <= num_lines:
+        if total <= num_lines:
             return content
 
-        skipped = len(lines) - num_lines
+        skipped = total - num_lines
         result = [f"[... {skipped} lines skipped ...]", ""]
-        result.extend(lines[-num_lines:])
+        # Only materialize the lines that are kept
+        result.extend(content.rsplit("\n", num_lines)[-num_lines:])
 
         return "\n".join(result)
 
+    def tail_path(self, filepath: str, num_lines: int, chunk: int = 65536) -> str:
+        """Extract last N lines of a file without reading all of it.
+
+        Reads the file backwards in chunks until enough newlines have been
+        seen, so the cost depends on the tail size rather than the file size.
+        Produces the same output as ``_extract_tail`` when the whole file
+        ends up being read; otherwise the skipped line count is unknown and
+        the header says so.
+
+        Args:
+            filepath: Path to the file
+            num_lines: Number of lines to show
+            chunk: Number of bytes to read per backwards step
+
+        Returns:
+            Tail content with indicator
+        """
+        with open(filepath, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            pos = f.tell()
+            buf = b""
+            while pos > 0:
+                read_size = min(chunk, pos)
+                pos -= read_size
+                f.seek(pos)
+                buf = f.read(read_size) + buf
+                if buf.count(b"\n") >= num_lines:
+                    break
+
+        if pos == 0:
+            return self._extract_tail(buf.decode("utf-8", errors="replace"), num_lines)
+
+        tail = b"\n".join(buf.split(b"\n")[-num_lines:])
+        return "[... earlier lines skipped ...]\n\n" + tail.decode(
+            "utf-8", errors="replace"
+        )
+
     def _extract_head(self, content: str, num_lines: int) -> str:
         """Extract first N lines of content.
 
@@ -382,18 +614,38 @@ class FileReadOptimizer:
         Returns:
             Head content with indicator
         """
-        lines = content.split("\n")
+        total = content.count("\n") + 1
 
-        if len(lines) <= num_lines:
+        if total <= num_lines:
             return content
 
-        result = lines[:num_lines]
-        remaining = len(lines) - num_lines
+        # Only materialize the lines that are kept
+        result = content.split("\n", num_lines)[:num_lines]
+        remaining = total - num_lines
         result.append("")
         result.append(f"[... {remaining} more lines ...]")
 
         return "\n".join(result)
 
+    def is_binary_file(self, filepath: str) -> bool:
+        """Check whether a file looks binary from its first few bytes.
+
+        Args:
+            filepath: Path to the file
+
+        Returns:
+            True if the file starts with a known binary magic number or
+            contains NUL bytes in its header, False otherwise (including
+            when the file cannot be read)
+        """
+        try:
+            with open(filepath, "rb") as f:
+                head = f.read(_SNIFF_BYTES)
+        except OSError:
+            return False
+
+        return head.startswith(_BINARY_MAGICS) or b"\x00" in head[:8]
+
     def get_read_recommendation(
         self, filepath: str, size_bytes: int
     ) -> Dict[str, Any]:
@@ -410,47 +662,90 @@ class FileReadOptimizer:
         """
         estimated_tokens = size_bytes // CHARS_PER_TOKEN
 
-        # Very small files - always read fully
-        if size_bytes < 1000:
+        # Binary files - don't read at all
+        if self.is_binary_file(filepath):
             return {
-                "action": "read_full",
+                "action": "skip",
                 "strategy": None,
-                "reason": "Small file, minimal token impact",
+                "reason": "binary",
                 "estimated_tokens": estimated_tokens,
             }
 
-        # Check if summarizable
-        strategy = self.get_summary_strategy(filepath)
+        if size_bytes < SMALL_FILE_THRESHOLD:
+            bucket = _BUCKET_SMALL
+        elif size_bytes < self.LARGE_FILE_THRESHOLD:
+            bucket = _BUCKET_STANDARD
+        else:
+            bucket = _BUCKET_LARGE
 
-        if strategy and size_bytes >= self.LARGE_FILE_THRESHOLD:
+        strategy = self.get_summary_strategy(filepath)
+        action, strategy_name, reason, extras = _recommendation_template(
+            Path(filepath).suffix, strategy["strategy"] if strategy else None, bucket
+        )
+
+        recommendation = {
+            "action": action,
+            "strategy": strategy_name,
+            "reason": reason,
+            "estimated_tokens": estimated_tokens,
+        }
+        if action == "summarize":
             # Estimate tokens after summarization
             summary_tokens = min(estimated_tokens, 500)  # Rough estimate
-            return {
-                "action": "summarize",
-                "strategy": strategy["strategy"],
-                "reason": f"Large {Path(filepath).suffix} file, summarization recommended",
-                "estimated_tokens": estimated_tokens,
-                "estimated_tokens_after": summary_tokens,
-                "tokens_saved": estimated_tokens - summary_tokens,
-            }
+            recommendation["estimated_tokens_after"] = summary_tokens
+            recommendation["tokens_saved"] = estimated_tokens - summary_tokens
+        recommendation.update(extras)
 
-        # Medium files - read but warn
-        if size_bytes >= self.LARGE_FILE_THRESHOLD:
-            return {
-                "action": "read_full",
-                "strategy": None,
-                "reason": "Large file but no summarization strategy available",
-                "estimated_tokens": estimated_tokens,
-                "warning": "Consider if full read is necessary",
-            }
+        return recommendation
 
-        # Default: read fully
-        return {
-            "action": "read_full",
-            "strategy": None,
-            "reason": "Standard file size",
-            "estimated_tokens": estimated_tokens,
-        }
+
+@functools.lru_cache(maxsize=64)
+def _recommendation_template(
+    suffix: str, strategy_name: Optional[str], bucket: int
+) -> Tuple[str, Optional[str], str, Tuple[Tuple[str, str], ...]]:
+    """Build the size-independent part of a read recommendation.
+
+    Args:
+        suffix: File suffix as written in the path (used in the reason)
+        strategy_name: Summary strategy for the file type, or None
+        bucket: One of the _BUCKET_* size classes
+
+    Returns:
+        Tuple of (action, strategy, reason, extra key/value pairs)
+    """
+    # Very small files - always read fully
+    if bucket == _BUCKET_SMALL:
+        return "read_full", None, "Small file, minimal token impact", ()
+
+    if bucket == _BUCKET_LARGE:
+        if strategy_name:
+            extras: Tuple[Tuple[str, str], ...] = ()
+            if strategy_name == "tail":
+                # Tail only needs the end of the file, see tail_path()
+                extras = (("fast_path", "tail_path"),)
+            return (
+                "summarize",
+                strategy_name,
+                f"Large {suffix} file, summarization recommended",
+                extras,
+            )
+
+        # Large files without a strategy - read but warn
+        return (
+            "read_full",
+            None,
+            "Large file but no summarization strategy available",
+            (("warning", "Consider if full read is necessary"),),
+        )
+
+    # Default: read fully
+    return "read_full", None, "Standard file size", ()
+
+
+def _summarize_one(item: Tuple[str, str]) -> Tuple[str, int]:
+    """Summarize one (filepath, content) pair in a worker process."""
+    filepath, content = item
+    return FileReadOptimizer().summarize_file(filepath, content)
 
 
 def get_file_read_optimizer() -> FileReadOptimizer:
@@ -0,0 +1,132 @@
+"""Hook daemon for Claude Harness.
+
+Serves tracking hook events over a Unix socket so hooks don't start a new
+claude-harness process for every tool call:
+- One event per connection: a tab-separated line of event name and arguments
+- Events are handled one at a time, in arrival order
+- Each event uses fresh trackers, so CLI commands that write the same files
+  in between are never overwritten with stale state
+"""
+
+import socket
+import socketserver
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from .context_tracker import ContextTracker
+from .progress_tracker import ProgressTracker
+
+
+# Socket file inside .claude-harness/, also hardcoded in hooks/send.sh
+SOCKET_NAME = "harness.sock"
+
+# Longest event line accepted from a hook
+MAX_EVENT_BYTES = 64 * 1024
+
+
+def get_socket_path(project_path: str = ".") -> Path:
+    """Get the hook daemon socket path for a project."""
+    return Path(project_path).resolve() / ".claude-harness" / SOCKET_NAME
+
+
+class HookDaemon:
+    """Handles hook events sent to the harness socket."""
+
+    def __init__(self, project_path: str = "."):
+        """Initialize with project path."""
+        self.project_path = str(Path(project_path).resolve())
+        self.socket_path = get_socket_path(project_path)
+        self._server: Optional[socketserver.UnixStreamServer] = None
+        self._handlers: Dict[str, Callable[[List[str]], None]] = {
+            "progress-file": self._progress_file,
+            "track-read": self._track_read,
+            "track-write": self._track_write,
+            "track-command": self._track_command,
+        }
+
+    def handle_event(self, line: str) -> bool:
+        """Handle one event line.
+
+        Args:
+            line: Tab-separated event name and arguments
+
+        Returns:
+            True if the event was recognized and handled
+        """
+        name, *args = line.rstrip("\r\n").split("\t")
+        handler = self._handlers.get(name)
+        if handler is None:
+            return False
+        try:
+            handler(args)
+        except (ValueError, IndexError):
+            return False
+        return True
+
+    def _progress_file(self, args: List[str]):
+        ProgressTracker(self.project_path).add_file_modified(args[0])
+
+    def _track_read(self, args: List[str]):
+        ContextTracker(self.project_path).track_file_read(args[0], int(args[1]))
+
+    def _track_write(self, args: List[str]):
+        ContextTracker(self.project_path).track_file_write(args[0], int(args[1]))
+
+    def _track_command(self, args: List[str]):
+        ContextTracker(self.project_path).track_command(args[0])
+
+    def bind(self):
+        """Create and bind the socket.
+
+        A leftover socket file from a daemon that is no longer running is
+        replaced.
+
+        Raises:
+            RuntimeError: If Unix sockets are unsupported or a daemon is running
+            OSError: If the socket cannot be bound
+        """
+        if not hasattr(socket, "AF_UNIX"):
+            raise RuntimeError("Unix sockets are not supported on this platform")
+
+        if self.socket_path.exists():
+            if self.is_running():
+                raise RuntimeError(f"Hook daemon already running on {self.socket_path}")
+            self.socket_path.unlink()
+
+        daemon = self
+
+        class _EventHandler(socketserver.StreamRequestHandler):
+            def handle(self):
+                line = self.rfile.readline(MAX_EVENT_BYTES)
+                daemon.handle_event(line.decode("utf-8", errors="replace"))
+
+        self._server = socketserver.UnixStreamServer(
+            str(self.socket_path), _EventHandler
+        )
+
+    def serve_forever(self):
+        """Serve events until shutdown() is called, then remove the socket."""
+        if self._server is None:
+            self.bind()
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+            self._server = None
+            self.socket_path.unlink(missing_ok=True)
+
+    def shutdown(self):
+        """Stop a running serve_forever() from another thread."""
+        if self._server is not None:
+            self._server.shutdown()
+
+    def is_running(self) -> bool:
+        """Check whether a daemon is accepting connections on the socket."""
+        if not hasattr(socket, "AF_UNIX") or not self.socket_path.exists():
+            return False
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(str(self.socket_path))
+            except OSError:
+                return False
+        return True
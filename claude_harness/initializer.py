@@ -5,26 +5,254 @@ Guides users through setup with intelligent questions based on:
 - User preferences (for new projects)
 """
 
+import functools
+import hashlib
 import os
 import json
+import re
+import shlex
+import shutil
+import sys
+import threading
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
+from types import MappingProxyType
 from typing import Optional
 from dataclasses import dataclass, field
 
-import questionary
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from jinja2 import Environment, PackageLoader, select_autoescape
-
 from .detector import StackDetector, DetectedStack
-from .command_generator import write_commands_to_directory, generate_commands_readme
+from .command_generator import (
+    HARNESS_COMMANDS,
+    generate_commands_readme,
+    write_commands_to_directory,
+)
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, fall back to the stdlib encoder
+    orjson = None
+
+
+def _dumps_json(data) -> bytes:
+    """Serialize data as 2-space indented JSON bytes, using orjson if available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+# questionary, rich and jinja2 are imported on first use so that CLI commands
+# which never build an Initializer don't pay their import cost.
+questionary = None
+_console = None
+
+
+def _load_questionary():
+    """Import questionary on first use and return the module."""
+    global questionary
+    if questionary is None:
+        import questionary as _questionary
+
+        questionary = _questionary
+    return questionary
+
+
+def _get_console():
+    """Create the shared rich Console on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
+
+
+# Package templates; compiled ahead of time into the user cache by _env()
+TEMPLATES_DIR = Path(__file__).parent / "templates"
+
+
+# Options shared by the runtime environment and ahead-of-time compilation
+_JINJA_OPTIONS = {
+    "trim_blocks": True,
+    "lstrip_blocks": True,
+    "keep_trailing_newline": True,
+}
+
+
+def _is_template(name: str) -> bool:
+    """Return True for template files (as opposed to package files)."""
+    return name.endswith(".j2")
+
+
+@functools.lru_cache(maxsize=None)
+def _template_digests() -> MappingProxyType:
+    """Content hash of each package template, keyed by file name.
+
+    Hashing content rather than comparing mtimes keeps caches correct for
+    installs that normalise file timestamps.
+    """
+    digests = {}
+    try:
+        entries = list(os.scandir(TEMPLATES_DIR))
+    except OSError:
+        entries = []
+    for entry in entries:
+        if _is_template(entry.name):
+            with open(entry.path, "rb") as f:
+                digests[entry.name] = hashlib.blake2b(
+                    f.read(), digest_size=16
+                ).hexdigest()
+    return MappingProxyType(digests)
+
+
+@functools.lru_cache(maxsize=None)
+def _template_stamp(name: str) -> str:
+    """Return a version stamp for the template rendering a script name."""
+    return _template_digests().get(f"{name}.j2", "")
+
+
+def _user_cache_dir() -> Path:
+    """Per-user cache directory ($XDG_CACHE_HOME or ~/.cache)."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(Path.home(), ".cache")
+    return Path(base) / "claude-harness"
+
+
+def _compiled_templates_path() -> Path:
+    """Compiled template zip for the installed templates and Jinja2 version."""
+    import jinja2
+
+    digest = hashlib.blake2b(jinja2.__version__.encode(), digest_size=16)
+    for name, template_digest in sorted(_template_digests().items()):
+        digest.update(f"{name}:{template_digest}\n".encode())
+    return _user_cache_dir() / f"templates-{digest.hexdigest()}.zip"
+
+
+def compile_templates(target: Optional[Path] = None) -> Path:
+    """Compile the package templates ahead of time into a zip file.
+
+    Initializer._env() calls this once per template version, so later
+    processes skip lexing and parsing on first render.
+
+    Args:
+        target: Zip file to write (default: _compiled_templates_path())
+
+    Returns:
+        Path of the written zip file
+    """
+    from jinja2 import Environment, PackageLoader, select_autoescape
+
+    target = Path(target) if target is not None else _compiled_templates_path()
+    env = Environment(
+        loader=PackageLoader("claude_harness", "templates"),
+        autoescape=select_autoescape(),
+        **_JINJA_OPTIONS,
+    )
+    env.compile_templates(
+        str(target), zip="deflated", filter_func=_is_template, ignore_errors=False
+    )
+    return target
+
+
+def _ensure_compiled_templates() -> Optional[Path]:
+    """Return the compiled template zip, compiling it on first use.
+
+    The zip is written under a temporary name and renamed into place, so
+    concurrent processes never load a partial archive. Zips for other
+    template versions are removed. Returns None when the cache directory
+    is not writable, in which case templates load from source.
+    """
+    target = _compiled_templates_path()
+    if target.exists():
+        return target
+
+    tmp = target.with_name(f"{target.stem}.{os.getpid()}.tmp")
+    try:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        compile_templates(tmp)
+        os.replace(tmp, target)
+        for stale in target.parent.glob("templates-*.zip"):
+            if stale != target:
+                stale.unlink(missing_ok=True)
+    except OSError:
+        try:
+            tmp.unlink(missing_ok=True)
+        except OSError:
+            pass
+        return None
+    return target
+
+
+class _LazyConsole:
+    """Module-level console stand-in that defers creating the rich Console."""
+
+    def __getattr__(self, name):
+        return getattr(_get_console(), name)
+
+
+console = _LazyConsole()
+
+# Thread pool size for writing harness files in _generate_files
+GENERATE_WORKERS = 4
+
+# Maximum number of rendered scripts kept by Initializer._cached_render
+RENDER_CACHE_SIZE = 64
 
+# Leaf directories created up front by Initializer._generate_files; every
+# generated file lives in one of these or their parents
+_GENERATED_DIRS = (
+    ".claude-harness/hooks",
+    ".claude-harness/session-history",
+    ".claude/commands",
+    "scripts",
+)
+_E2E_DIRS = ("e2e/tests",)
 
-console = Console()
+# os.open flags for Initializer._write_file; O_BINARY avoids newline translation
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
 
 
-@dataclass
+def _run_captured(task) -> str:
+    """Run a task, capturing anything it prints to the console.
+
+    Rich keeps its render buffer per thread, so tasks running concurrently
+    in worker threads capture only their own output.
+    """
+    with _get_console().capture() as capture:
+        task()
+    return capture.get()
+
+
+@contextmanager
+def _buffered_output():
+    """Render a block of console output and write it in a single call.
+
+    Also usable as a decorator for methods that print a whole section.
+    """
+    active = _get_console()
+    with active.capture() as capture:
+        yield
+    active.file.write(capture.get())
+
+
+# Defaults for HarnessConfig's list fields (copied per instance)
+_DEFAULT_PRE_CHECKS = ("venv_active", "db_connected")
+_DEFAULT_PROTECTED = ("main", "master")
+_DEFAULT_BRANCH_PREFIXES = ("feat/", "fix/", "chore/", "docs/", "refactor/")
+_DEFAULT_BLOCKED_ACTIONS = (
+    "commit_to_protected_branch",
+    "push_to_protected_branch_without_confirmation",
+    "delete_backup_branches",
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _default_generate_powershell() -> bool:
+    """Generate init.ps1 by default only on Windows or when pwsh is installed."""
+    return sys.platform == "win32" or shutil.which("pwsh") is not None
+
+
+@dataclass(slots=True)
 class HarnessConfig:
     """Complete harness configuration."""
 
@@ -50,14 +278,16 @@ class HarnessConfig:
     port: int = 8000
     health_endpoint: str = "/health"
     start_command: str = ""
-    pre_checks: list = field(default_factory=lambda: ["venv_active", "db_connected"])
+    pre_checks: list = field(default_factory=lambda: list(_DEFAULT_PRE_CHECKS))
 
     # Git
-    protected_branches: list = field(default_factory=lambda: ["main", "master"])
+    protected_branches: list = field(default_factory=lambda: list(_DEFAULT_PROTECTED))
     branch_prefixes: list = field(
-        default_factory=lambda: ["feat/", "fix/", "chore/", "docs/", "refactor/"]
+        default_factory=lambda: list(_DEFAULT_BRANCH_PREFIXES)
     )
     require_merge_confirmation: bool = True
+    git_huge_repo_threshold: int = 100000  # Skip the dirty check above this many files
+    git_auto_tune: bool = True  # Enable git's untracked cache (and fsmonitor) once
 
     # Testing
     test_framework: str = "pytest"
@@ -67,11 +297,7 @@ class HarnessConfig:
 
     # Blocked actions
     blocked_actions: list = field(
-        default_factory=lambda: [
-            "commit_to_protected_branch",
-            "push_to_protected_branch_without_confirmation",
-            "delete_backup_branches",
-        ]
+        default_factory=lambda: list(_DEFAULT_BLOCKED_ACTIONS)
     )
 
     # E2E
@@ -112,12 +338,19 @@ class HarnessConfig:
     # Claude Code Integration
     create_claude_hooks: bool = False  # Auto-create .claude/settings.local.json with hooks
 
+    # Startup scripts (not persisted: depends on the host, not the project)
+    generate_powershell: bool = field(default_factory=_default_generate_powershell)
+
     # Features
     initial_phase: str = "Phase 1"
     initial_features: list = field(default_factory=list)
 
     def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
+        """Convert to dictionary for JSON serialization.
+
+        Spelled out as a literal (must match _CONFIG_LAYOUT) rather than
+        walking the layout, which is about three times faster.
+        """
         return {
             "project_name": self.project_name,
             "project_description": self.project_description,
@@ -145,6 +378,8 @@ class HarnessConfig:
                 "protected_branches": self.protected_branches,
                 "branch_prefixes": self.branch_prefixes,
                 "require_merge_confirmation": self.require_merge_confirmation,
+                "huge_repo_threshold": self.git_huge_repo_threshold,
+                "auto_tune": self.git_auto_tune,
             },
             "testing": {
                 "framework": self.test_framework,
@@ -190,6 +425,258 @@ class HarnessConfig:
             },
         }
 
+    def is_default(self) -> bool:
+        """Check whether all persisted fields except name/description are defaults."""
+        return all(
+            getattr(self, f) == default
+            for f, default in zip(_DEFAULTABLE_FIELDS, _default_config_values())
+        )
+
+    def to_json(self) -> bytes:
+        """Serialize to config.json bytes.
+
+        All-default configs reuse a cached serialization and only splice in
+        the project name and description.
+        """
+        if not self.is_default():
+            return _dumps_json(self.to_dict())
+
+        data = _default_config_json()
+        for f in _IDENTITY_FIELDS:
+            value = getattr(self, f)
+            if value:
+                key = b'"%s": ' % f.encode()
+                data = data.replace(key + b'""', key + _dumps_json(value), 1)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "HarnessConfig":
+        """Create a config from config.json data (inverse of to_dict).
+
+        Keys missing from data keep their default values.
+        """
+        values = {}
+        for key, fields in _CONFIG_LAYOUT.items():
+            if key not in data:
+                continue
+            if isinstance(fields, str):
+                values[fields] = data[key]
+            else:
+                section = data[key] or {}
+                for f in fields:
+                    section_key = _CONFIG_KEYS.get(f, f)
+                    if section_key in section:
+                        values[f] = section[section_key]
+        return cls(**values)
+
+
+# Layout of config.json: top-level key -> field name, or tuple of field names
+# for a nested section. Fields not listed here are not persisted.
+# HarnessConfig.to_dict spells this out and must be kept in sync.
+_CONFIG_LAYOUT = {
+    "project_name": "project_name",
+    "project_description": "project_description",
+    "stack": ("language", "language_version", "framework", "database", "orm"),
+    "paths": (
+        "source_directory",
+        "backend_directory",
+        "venv_path",
+        "env_file",
+        "test_directory",
+    ),
+    "startup": ("port", "health_endpoint", "start_command", "pre_checks"),
+    "git": (
+        "protected_branches",
+        "branch_prefixes",
+        "require_merge_confirmation",
+        "git_huge_repo_threshold",
+        "git_auto_tune",
+    ),
+    "testing": (
+        "test_framework",
+        "unit_test_command",
+        "e2e_test_command",
+        "coverage_threshold",
+    ),
+    "blocked_actions": "blocked_actions",
+    "e2e": ("e2e_enabled", "e2e_base_url", "e2e_browser"),
+    "context_tracking": (
+        "context_tracking_enabled",
+        "context_budget",
+        "context_warning_threshold",
+        "context_critical_threshold",
+        "show_context_in_status",
+        "auto_reset_session",
+        "auto_save_handoff",
+    ),
+    "output": (
+        "output_compact_mode",
+        "output_max_lines",
+        "output_max_files_shown",
+        "output_truncate_long_values",
+    ),
+    "delegation": (
+        "delegation_enabled",
+        "delegation_auto",
+        "delegation_parallel_limit",
+    ),
+    "orchestration": ("orchestration_enabled",),
+    "discoveries": ("discoveries_enabled",),
+    "documentation": ("documentation_enabled", "documentation_trigger"),
+}
+
+# Fields whose key inside their config.json section differs from the field name
+_CONFIG_KEYS = {
+    "source_directory": "source",
+    "backend_directory": "backend",
+    "venv_path": "venv",
+    "test_directory": "tests",
+    "test_framework": "framework",
+    "unit_test_command": "unit_command",
+    "e2e_test_command": "e2e_command",
+    "git_huge_repo_threshold": "huge_repo_threshold",
+    "git_auto_tune": "auto_tune",
+    "e2e_enabled": "enabled",
+    "e2e_base_url": "base_url",
+    "e2e_browser": "browser",
+    "context_tracking_enabled": "enabled",
+    "context_budget": "budget",
+    "context_warning_threshold": "warning_threshold",
+    "context_critical_threshold": "critical_threshold",
+    "show_context_in_status": "show_in_status",
+    "output_compact_mode": "compact_mode",
+    "output_max_lines": "max_lines",
+    "output_max_files_shown": "max_files_shown",
+    "output_truncate_long_values": "truncate_long_values",
+    "delegation_enabled": "enabled",
+    "delegation_auto": "auto_delegate",
+    "delegation_parallel_limit": "parallel_limit",
+    "orchestration_enabled": "enabled",
+    "discoveries_enabled": "enabled",
+    "documentation_enabled": "enabled",
+    "documentation_trigger": "trigger",
+}
+
+# Persisted fields that vary per project even when everything else is default
+_IDENTITY_FIELDS = ("project_name", "project_description")
+
+# Persisted fields compared against the defaults in HarnessConfig.is_default()
+_DEFAULTABLE_FIELDS = tuple(
+    f
+    for fields in _CONFIG_LAYOUT.values()
+    for f in ((fields,) if isinstance(fields, str) else fields)
+    if f not in _IDENTITY_FIELDS
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _default_config_json() -> bytes:
+    """Serialized config.json for an all-default HarnessConfig."""
+    return _dumps_json(HarnessConfig().to_dict())
+
+
+@functools.lru_cache(maxsize=None)
+def _default_config_values() -> tuple:
+    """Default values of _DEFAULTABLE_FIELDS, in order."""
+    defaults = HarnessConfig()
+    return tuple(getattr(defaults, f) for f in _DEFAULTABLE_FIELDS)
+
+
+# Harness hooks registered in .claude/settings.local.json. Hooks receive
+# their input as JSON on stdin.
+_HARNESS_HOOKS = {
+    "PreToolUse": [
+        {
+            "matcher": "Bash",
+            "hooks": [
+                {
+                    "type": "command",
+                    "command": ".claude-harness/hooks/check-git-safety.sh"
+                }
+            ]
+        }
+    ],
+    "PostToolUse": [
+        {
+            "matcher": "Read",
+            "hooks": [
+                {
+                    "type": "command",
+                    "command": ".claude-harness/hooks/track-read.sh"
+                }
+            ]
+        },
+        {
+            "matcher": "Write",
+            "hooks": [
+                {
+                    "type": "command",
+                    "command": ".claude-harness/hooks/track-write.sh"
+                }
+            ]
+        },
+        {
+            "matcher": "Edit",
+            "hooks": [
+                {
+                    "type": "command",
+                    "command": ".claude-harness/hooks/track-edit.sh"
+                }
+            ]
+        },
+        {
+            "matcher": "Bash",
+            "hooks": [
+                {
+                    "type": "command",
+                    "command": ".claude-harness/hooks/log-activity.sh"
+                }
+            ]
+        }
+    ],
+    "SessionEnd": [
+        {
+            "hooks": [
+                {
+                    "type": "command",
+                    "command": ".claude-harness/hooks/check-subtasks.sh"
+                }
+            ]
+        },
+        {
+            "hooks": [
+                {
+                    "type": "command",
+                    "command": ".claude-harness/hooks/session-stop.sh"
+                }
+            ]
+        }
+    ]
+}
+
+
+def _ere_alternation(words) -> str:
+    """Build a POSIX ERE alternation that matches any of the words literally."""
+    return "|".join(re.sub(r"([.\[\]()*+?{}|^$\\])", r"\\\1", w) for w in words)
+
+
+def _hook_fingerprint(hook) -> str:
+    """Order-independent identity of a hook entry, for de-duplicating merges."""
+    return json.dumps(hook, sort_keys=True)
+
+
+@functools.lru_cache(maxsize=None)
+def _harness_hooks_json() -> str:
+    """_HARNESS_HOOKS as 2-space indented JSON, nested one level deep."""
+    return json.dumps(_HARNESS_HOOKS, indent=2).replace("\n", "\n  ")
+
+
+# (fingerprint, hook) pairs per hook type, computed once
+_HOOK_FINGERPRINTS = {
+    hook_type: tuple((_hook_fingerprint(hook), hook) for hook in hooks)
+    for hook_type, hooks in _HARNESS_HOOKS.items()
+}
+
 
 class Initializer:
     """Interactive project initializer."""
@@ -235,6 +722,152 @@ class Initializer:
         {"name": "None", "value": None},
     ]
 
+    # Default server port per database, probed by the init scripts
+    _DATABASE_PORTS = MappingProxyType({
+        "postgresql": 5432,
+        "mysql": 3306,
+        "mongodb": 27017,
+        "redis": 6379,
+    })
+
+    # Default dev server port per framework
+    _PORT_DEFAULTS = MappingProxyType({
+        "flask": 5000,
+        "django": 8000,
+        "fastapi": 8000,
+        "express": 3000,
+        "nextjs": 3000,
+        "react": 3000,
+        "vue": 8080,
+    })
+
+    # Default start command per (language, framework); (language, None) is
+    # the fallback for frameworks without their own entry
+    _START_COMMANDS = MappingProxyType({
+        ("python", "flask"): "python run.py",
+        ("python", "django"): "python manage.py runserver",
+        ("python", "fastapi"): "uvicorn main:app --reload",
+        ("python", None): "python main.py",
+        ("javascript", None): "npm run dev",
+        ("typescript", None): "npm run dev",
+    })
+
+    # Permissions allowed for every project; see _get_default_permissions
+    _BASE_PERMISSIONS = (
+        # Harness file operations (allow editing harness files without prompts)
+        "Edit(.claude-harness/**)",
+        "Write(.claude-harness/**)",
+        "Read(.claude-harness/**)",
+
+        # Harness commands
+        "Bash(claude-harness:*)",
+        "Bash(.claude-harness/hooks/*:*)",
+
+        # Git operations
+        "Bash(git:*)",
+
+        # Common shell utilities
+        "Bash(cat:*)",
+        "Bash(ls:*)",
+        "Bash(echo:*)",
+        "Bash(grep:*)",
+        "Bash(find:*)",
+        "Bash(tree:*)",
+        "Bash(wc:*)",
+        "Bash(head:*)",
+        "Bash(tail:*)",
+        "Bash(mkdir:*)",
+        "Bash(cp:*)",
+        "Bash(mv:*)",
+        "Bash(rm:*)",
+        "Bash(chmod:*)",
+        "Bash(touch:*)",
+        "Bash(diff:*)",
+        "Bash(sort:*)",
+        "Bash(uniq:*)",
+        "Bash(which:*)",
+        "Bash(pwd)",
+        "Bash(env:*)",
+        "Bash(export:*)",
+        "Bash(timeout:*)",
+        "Bash(bash:*)",
+        "Bash(sh:*)",
+
+        # Web tools
+        "WebSearch",
+        "WebFetch(domain:*)",
+    )
+
+    _JS_PERMISSIONS = (
+        "Bash(node:*)",
+        "Bash(npm:*)",
+        "Bash(npx:*)",
+        "Bash(yarn:*)",
+        "Bash(pnpm:*)",
+        "Bash(jest:*)",
+        "Bash(vitest:*)",
+        "Bash(eslint:*)",
+        "Bash(prettier:*)",
+        "Bash(tsc:*)",
+    )
+
+    # Extra permissions per language
+    _LANGUAGE_PERMISSIONS = MappingProxyType({
+        "python": (
+            "Bash(python:*)",
+            "Bash(python3:*)",
+            "Bash(pip:*)",
+            "Bash(pip3:*)",
+            "Bash(source:*)",
+            "Bash(.venv/bin/*:*)",
+            "Bash(venv/bin/*:*)",
+            "Bash(alembic:*)",
+            "Bash(flask:*)",
+            "Bash(django-admin:*)",
+            "Bash(uvicorn:*)",
+            "Bash(gunicorn:*)",
+            "Bash(pytest:*)",
+            "Bash(mypy:*)",
+            "Bash(ruff:*)",
+            "Bash(black:*)",
+            "Bash(isort:*)",
+            "Bash(bandit:*)",
+            "Bash(coverage:*)",
+        ),
+        "javascript": _JS_PERMISSIONS,
+        "typescript": _JS_PERMISSIONS,
+        "go": ("Bash(go:*)",),
+        "rust": ("Bash(cargo:*)", "Bash(rustc:*)"),
+    })
+
+    # Added when the framework mentions docker
+    _DOCKER_PERMISSIONS = ("Bash(docker:*)", "Bash(docker-compose:*)")
+
+    # Markup style for each file status reported through _record
+    _STATUS_STYLES = MappingProxyType({
+        "Created": "green",
+        "Updated": "green",
+        "Preserved": "blue",
+        "Unchanged": "dim",
+    })
+
+    # Display name -> value lookups for the choice lists above; iterating
+    # one yields the display names in choice order
+    LANGUAGE_BY_NAME = {c["name"]: c["value"] for c in LANGUAGE_CHOICES}
+    FRAMEWORK_BY_NAME = {
+        lang: {c["name"]: c["value"] for c in choices}
+        for lang, choices in FRAMEWORK_CHOICES.items()
+    }
+    DATABASE_BY_NAME = {c["name"]: c["value"] for c in DATABASE_CHOICES}
+
+    # Shared Jinja2 environment, created by _env() on first use. The lock
+    # keeps concurrent first renders in _generate_files from each building one.
+    _jinja_env = None
+    _jinja_env_lock = threading.Lock()
+
+    # Rendered scripts keyed by (script name, serialized config); see _cached_render
+    _render_cache: dict = {}
+
     TEST_FRAMEWORK_CHOICES = {
         "python": [
             {"name": "pytest", "value": "pytest"},
@@ -250,6 +883,10 @@ class Initializer:
             {"name": "Vitest", "value": "vitest"},
         ],
     }
+    TEST_FRAMEWORK_BY_NAME = {
+        lang: {c["name"]: c["value"] for c in choices}
+        for lang, choices in TEST_FRAMEWORK_CHOICES.items()
+    }
 
     def __init__(
         self,
@@ -265,18 +902,67 @@ class Initializer:
             config: Optional pre-loaded config (used by refresh command)
         """
         self.project_path = Path(project_path).resolve()
+        # Harness locations, joined once for all the writers
+        self._harness_dir = self.project_path / ".claude-harness"
+        self._claude_dir = self.project_path / ".claude"
+        self._scripts_dir = self.project_path / "scripts"
         self.detected: Optional[DetectedStack] = None
         self.config = config if config is not None else HarnessConfig()
         self.is_existing_project = False
         self.non_interactive = non_interactive
+        # Config loaded from an existing config.json, used as prompt defaults
+        self.previous_config: Optional[HarnessConfig] = None
+        self._accept_all_detected = False
+        # Directories known to exist, so _write_file creates each only once
+        self._created_dirs: set = set()
+        # (status, path) of files written by _generate_files, for the summary
+        self._created: list = []
+        # Per-thread record list while _generate_files runs a task
+        self._task_records = threading.local()
+        # Serialized config shared by the tasks of one _generate_files run
+        self._config_snapshot: Optional[bytes] = None
+
+    @classmethod
+    def _env(cls):
+        """Get the Jinja2 environment shared by all Initializer instances.
+
+        Built on first use and kept on the class so compiled templates are
+        reused across instances (e.g. repeated inits in one process). Loads
+        from the ahead-of-time compiled zip, compiling it once per template
+        version (see _ensure_compiled_templates).
+        """
+        if cls._jinja_env is not None:
+            return cls._jinja_env
+
+        with cls._jinja_env_lock:
+            if cls._jinja_env is None:
+                from jinja2 import (
+                    ChoiceLoader,
+                    Environment,
+                    ModuleLoader,
+                    PackageLoader,
+                    select_autoescape,
+                )
 
-        # Setup Jinja2 environment
-        self.jinja_env = Environment(
-            loader=PackageLoader("claude_harness", "templates"),
-            autoescape=select_autoescape(),
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
+                loader = PackageLoader("claude_harness", "templates")
+                compiled = _ensure_compiled_templates()
+                if compiled is not None:
+                    # Precompiled templates first, sources for anything missing
+                    loader = ChoiceLoader([ModuleLoader(str(compiled)), loader])
+
+                cls._jinja_env = Environment(
+                    loader=loader,
+                    autoescape=select_autoescape(),
+                    auto_reload=False,
+                    cache_size=-1,
+                    **_JINJA_OPTIONS,
+                )
+        return cls._jinja_env
+
+    @property
+    def jinja_env(self):
+        """Jinja2 environment (shared, see _env)."""
+        return self._env()
 
     def run(self) -> HarnessConfig:
         """Run the initialization process.
@@ -288,7 +974,7 @@ class Initializer:
 
         if self.non_interactive:
             self._apply_defaults()
-        else:
+        elif not self._reuse_existing_config():
             self._ask_questions()
 
         self._generate_files()
@@ -296,6 +982,62 @@ class Initializer:
 
         return self.config
 
+    def _reuse_existing_config(self) -> bool:
+        """Offer to reuse an existing config.json instead of re-running the wizard.
+
+        If the user declines, the loaded values become the defaults for
+        the wizard's prompts.
+
+        Returns:
+            True if the existing config was reused and questions can be skipped
+        """
+        config_path = self._harness_dir / "config.json"
+        if not config_path.exists():
+            return False
+
+        try:
+            self.previous_config = HarnessConfig.from_dict(
+                json.loads(config_path.read_text())
+            )
+        except (OSError, json.JSONDecodeError):
+            return False
+
+        questionary = _load_questionary()
+
+        reuse = questionary.confirm(
+            "Reuse existing config? (No = re-run wizard)",
+            default=True,
+        ).ask()
+        if not reuse:
+            return False
+
+        self.config = self.previous_config
+        # Hook settings aren't stored in config.json; keep them if present
+        self.config.create_claude_hooks = (
+            self._claude_dir / "settings.local.json"
+        ).exists()
+        console.print("[dim]Reusing existing configuration[/dim]\n")
+        return True
+
+    def _previous(self, field_name: str, fallback):
+        """Get a prompt default, preferring the previously saved config value."""
+        if self.previous_config is not None:
+            value = getattr(self.previous_config, field_name)
+            if value is not None:
+                return value
+        return fallback
+
+    def _previous_choice(self, choices: list, field_name: str) -> Optional[str]:
+        """Get the display name of the previously saved value for a select prompt."""
+        if self.previous_config is None:
+            return None
+        value = getattr(self.previous_config, field_name)
+        for c in choices:
+            if c["value"] == value:
+                return c["name"]
+        return None
+
+    @_buffered_output()
     def _apply_defaults(self):
         """Apply detected/default values without prompting (non-interactive mode)."""
         console.print("[yellow]Non-interactive mode: using detected/default values[/yellow]\n")
@@ -304,24 +1046,26 @@ class Initializer:
         self.config.project_name = self.project_path.name
 
         # Use detected values if available, otherwise use defaults
-        if self.detected:
-            self.config.language = self.detected.language or "python"
-            self.config.framework = self.detected.framework
-            self.config.database = self.detected.database
-            self.config.orm = self.detected.orm
-            self.config.source_directory = self.detected.source_directory or "."
-            self.config.venv_path = self.detected.venv_path or "venv"
-            self.config.env_file = self.detected.env_file or ".env"
-            self.config.test_directory = self.detected.test_directory or "tests"
-            self.config.test_framework = self.detected.test_framework or "pytest"
+        config = self.config
+        detected = self.detected
+        if detected:
+            config.language = detected.language or "python"
+            config.framework = detected.framework
+            config.database = detected.database
+            config.orm = detected.orm
+            config.source_directory = detected.source_directory or "."
+            config.venv_path = detected.venv_path or "venv"
+            config.env_file = detected.env_file or ".env"
+            config.test_directory = detected.test_directory or "tests"
+            config.test_framework = detected.test_framework or "pytest"
         else:
             # Pure defaults for empty/new projects
-            self.config.language = "python"
-            self.config.source_directory = "."
-            self.config.venv_path = "venv"
-            self.config.env_file = ".env"
-            self.config.test_directory = "tests"
-            self.config.test_framework = "pytest"
+            config.language = "python"
+            config.source_directory = "."
+            config.venv_path = "venv"
+            config.env_file = ".env"
+            config.test_directory = "tests"
+            config.test_framework = "pytest"
 
         # Set port and start command based on detected/default stack
         self.config.port = self._get_default_port()
@@ -337,17 +1081,21 @@ class Initializer:
         self.config.context_tracking_enabled = True
 
         # Log what was configured
-        console.print("[bold]Configuration applied:[/bold]")
-        console.print(f"  Project: {self.config.project_name}")
-        console.print(f"  Language: {self.config.language}")
-        console.print(f"  Framework: {self.config.framework or 'None'}")
-        console.print(f"  Database: {self.config.database or 'None'}")
-        console.print(f"  Port: {self.config.port}")
-        console.print(f"  Test Framework: {self.config.test_framework}")
-        console.print()
+        console.print(
+            "[bold]Configuration applied:[/bold]\n"
+            f"  Project: {self.config.project_name}\n"
+            f"  Language: {self.config.language}\n"
+            f"  Framework: {self.config.framework or 'None'}\n"
+            f"  Database: {self.config.database or 'None'}\n"
+            f"  Port: {self.config.port}\n"
+            f"  Test Framework: {self.config.test_framework}\n"
+        )
 
+    @_buffered_output()
     def _print_header(self):
         """Print welcome header."""
+        from rich.panel import Panel
+
         console.print()
         console.print(
             Panel.fit(
@@ -362,8 +1110,12 @@ class Initializer:
         """Run stack detection and show results."""
         console.print("[yellow]Analyzing project...[/yellow]")
 
-        detector = StackDetector(str(self.project_path))
-        self.detected = detector.detect()
+        if self._is_empty_project():
+            # Nothing to detect - skip the detector's filesystem walk
+            self.detected = DetectedStack()
+        else:
+            detector = StackDetector(str(self.project_path))
+            self.detected = detector.detect()
 
         # Determine if this is an existing project
         self.is_existing_project = (
@@ -377,8 +1129,19 @@ class Initializer:
                 "[dim]New project detected - will ask for full configuration[/dim]\n"
             )
 
+    def _is_empty_project(self) -> bool:
+        """Check whether the project directory has no entries at all."""
+        try:
+            with os.scandir(self.project_path) as entries:
+                return next(entries, None) is None
+        except FileNotFoundError:
+            return True
+
+    @_buffered_output()
     def _show_detection_results(self):
         """Display what was detected."""
+        from rich.table import Table
+
         console.print()
         table = Table(title="Detected Configuration", show_header=True)
         table.add_column("Setting", style="cyan")
@@ -414,8 +1177,10 @@ class Initializer:
 
     def _ask_questions(self):
         """Ask interactive questions."""
+        questionary = _load_questionary()
+
         # Project name
-        default_name = self.project_path.name
+        default_name = self._previous("project_name", self.project_path.name)
         self.config.project_name = questionary.text(
             "Project name:",
             default=default_name,
@@ -424,50 +1189,26 @@ class Initializer:
         # Project description
         self.config.project_description = questionary.text(
             "Short description (optional):",
-            default="",
+            default=self._previous("project_description", ""),
         ).ask()
 
-        # Language - use detected or ask
-        if self.detected and self.detected.language:
-            use_detected = questionary.confirm(
-                f"Use detected language ({self.detected.language})?",
-                default=True,
-            ).ask()
-
-            if use_detected:
-                self.config.language = self.detected.language
-            else:
-                self._ask_language()
-        else:
-            self._ask_language()
-
-        # Framework
-        if self.detected and self.detected.framework:
-            use_detected = questionary.confirm(
-                f"Use detected framework ({self.detected.framework})?",
-                default=True,
-            ).ask()
-
-            if use_detected:
-                self.config.framework = self.detected.framework
-            else:
-                self._ask_framework()
-        else:
-            self._ask_framework()
-
-        # Database
-        if self.detected and self.detected.database:
-            use_detected = questionary.confirm(
-                f"Use detected database ({self.detected.database})?",
+        # Stack - use detected values or ask
+        detected = self.detected or DetectedStack()
+        stack = (
+            ("language", detected.language, self._ask_language),
+            ("framework", detected.framework, self._ask_framework),
+            ("database", detected.database, self._ask_database),
+        )
+        # One prompt instead of one per field when several values were detected
+        self._accept_all_detected = (
+            sum(1 for _, value, _ in stack if value) > 1
+            and questionary.confirm(
+                "Auto-accept all detected values?",
                 default=True,
             ).ask()
-
-            if use_detected:
-                self.config.database = self.detected.database
-            else:
-                self._ask_database()
-        else:
-            self._ask_database()
+        )
+        for field_name, detected_value, ask_method in stack:
+            self._ask_or_confirm(field_name, detected_value, ask_method)
 
         # Paths
         self._ask_paths()
@@ -487,145 +1228,176 @@ class Initializer:
         # Claude Code hooks
         self._ask_claude_hooks()
 
+    def _ask_or_confirm(self, field_name: str, detected_value, ask_method):
+        """Use a detected value for a config field, or ask for it.
+
+        Args:
+            field_name: HarnessConfig field to set
+            detected_value: Value found by stack detection, if any
+            ask_method: Method that prompts for the field when not detected
+        """
+        if detected_value:
+            if self._accept_all_detected:
+                setattr(self.config, field_name, detected_value)
+                return
+            questionary = _load_questionary()
+            use_detected = questionary.confirm(
+                f"Use detected {field_name} ({detected_value})?",
+                default=True,
+            ).ask()
+            if use_detected:
+                setattr(self.config, field_name, detected_value)
+                return
+        ask_method()
+
     def _ask_language(self):
         """Ask for programming language."""
+        questionary = _load_questionary()
+
         choice = questionary.select(
             "Primary programming language:",
-            choices=[c["name"] for c in self.LANGUAGE_CHOICES],
+            choices=list(self.LANGUAGE_BY_NAME),
+            default=self._previous_choice(self.LANGUAGE_CHOICES, "language"),
         ).ask()
 
-        for c in self.LANGUAGE_CHOICES:
-            if c["name"] == choice:
-                self.config.language = c["value"]
-                break
+        if choice in self.LANGUAGE_BY_NAME:
+            self.config.language = self.LANGUAGE_BY_NAME[choice]
 
     def _ask_framework(self):
         """Ask for framework based on language."""
+        questionary = _load_questionary()
+
         frameworks = self.FRAMEWORK_CHOICES.get(self.config.language, [])
 
         if frameworks:
+            by_name = self.FRAMEWORK_BY_NAME[self.config.language]
             choice = questionary.select(
                 "Framework:",
-                choices=[c["name"] for c in frameworks],
+                choices=list(by_name),
+                default=self._previous_choice(frameworks, "framework"),
             ).ask()
 
-            for c in frameworks:
-                if c["name"] == choice:
-                    self.config.framework = c["value"]
-                    break
+            if choice in by_name:
+                self.config.framework = by_name[choice]
 
     def _ask_database(self):
         """Ask for database."""
+        questionary = _load_questionary()
+
         choice = questionary.select(
             "Database:",
-            choices=[c["name"] for c in self.DATABASE_CHOICES],
+            choices=list(self.DATABASE_BY_NAME),
+            default=self._previous_choice(self.DATABASE_CHOICES, "database"),
         ).ask()
 
-        for c in self.DATABASE_CHOICES:
-            if c["name"] == choice:
-                self.config.database = c["value"]
-                break
+        if choice in self.DATABASE_BY_NAME:
+            self.config.database = self.DATABASE_BY_NAME[choice]
+
+    def _ask_form(self, questions: dict) -> dict:
+        """Ask a group of questions in order and return answers by key.
+
+        Uses unsafe_ask so Ctrl-C propagates and cancels the init, rather
+        than leaving the form half answered.
+        """
+        return _load_questionary().form(**questions).unsafe_ask()
 
     def _ask_paths(self):
         """Ask for project paths."""
+        questionary = _load_questionary()
+
         console.print("\n[bold]Project Paths[/bold]")
 
+        # Questions keyed by config field, asked as one form
+        questions = {}
+
         # Source directory
         default_source = self.detected.source_directory if self.detected else "."
-        self.config.source_directory = questionary.text(
+        questions["source_directory"] = questionary.text(
             "Source directory:",
-            default=default_source or ".",
-        ).ask()
+            default=self._previous("source_directory", default_source or "."),
+        )
 
         # Backend directory (for monorepos)
         if self.detected and self.detected.source_directory:
             if "backend" in self.detected.source_directory:
-                self.config.backend_directory = questionary.text(
+                questions["backend_directory"] = questionary.text(
                     "Backend directory (if separate):",
-                    default="backend",
-                ).ask()
+                    default=self._previous("backend_directory", "backend"),
+                )
 
         # Virtual environment
         if self.config.language == "python":
             default_venv = self.detected.venv_path if self.detected else "venv"
-            self.config.venv_path = questionary.text(
+            questions["venv_path"] = questionary.text(
                 "Virtual environment path:",
-                default=default_venv or "venv",
-            ).ask()
+                default=self._previous("venv_path", default_venv or "venv"),
+            )
 
         # Env file
         default_env = self.detected.env_file if self.detected else ".env"
-        self.config.env_file = questionary.text(
+        questions["env_file"] = questionary.text(
             "Environment file:",
-            default=default_env or ".env",
-        ).ask()
+            default=self._previous("env_file", default_env or ".env"),
+        )
 
         # Test directory
         default_tests = self.detected.test_directory if self.detected else "tests"
-        self.config.test_directory = questionary.text(
+        questions["test_directory"] = questionary.text(
             "Test directory:",
-            default=default_tests or "tests",
-        ).ask()
+            default=self._previous("test_directory", default_tests or "tests"),
+        )
+
+        for field_name, answer in self._ask_form(questions).items():
+            setattr(self.config, field_name, answer)
 
     def _ask_startup(self):
         """Ask for startup configuration."""
-        console.print("\n[bold]Startup Configuration[/bold]")
-
-        # Port
-        default_port = self._get_default_port()
-        port_str = questionary.text(
-            "Development server port:",
-            default=str(default_port),
-        ).ask()
-        self.config.port = int(port_str)
+        questionary = _load_questionary()
 
-        # Health endpoint
-        self.config.health_endpoint = questionary.text(
-            "Health check endpoint:",
-            default="/api/v1/health" if self.config.framework else "/health",
-        ).ask()
+        console.print("\n[bold]Startup Configuration[/bold]")
 
-        # Start command
-        default_start = self._get_default_start_command()
-        self.config.start_command = questionary.text(
-            "Start command:",
-            default=default_start,
-        ).ask()
+        answers = self._ask_form({
+            "port": questionary.text(
+                "Development server port:",
+                default=str(self._previous("port", self._get_default_port())),
+            ),
+            "health_endpoint": questionary.text(
+                "Health check endpoint:",
+                default=self._previous(
+                    "health_endpoint",
+                    "/api/v1/health" if self.config.framework else "/health",
+                ),
+            ),
+            "start_command": questionary.text(
+                "Start command:",
+                default=self._previous(
+                    "start_command", self._get_default_start_command()
+                ),
+            ),
+        })
+        self.config.port = int(answers["port"])
+        self.config.health_endpoint = answers["health_endpoint"]
+        self.config.start_command = answers["start_command"]
 
         # E2E base URL
         self.config.e2e_base_url = f"http://localhost:{self.config.port}"
 
     def _get_default_port(self) -> int:
         """Get default port based on framework."""
-        port_defaults = {
-            "flask": 5000,
-            "django": 8000,
-            "fastapi": 8000,
-            "express": 3000,
-            "nextjs": 3000,
-            "react": 3000,
-            "vue": 8080,
-        }
-        return port_defaults.get(self.config.framework or "", 8000)
+        return self._PORT_DEFAULTS.get(self.config.framework or "", 8000)
 
     def _get_default_start_command(self) -> str:
         """Get default start command based on stack."""
-        if self.config.language == "python":
-            if self.config.framework == "flask":
-                return "python run.py"
-            elif self.config.framework == "django":
-                return "python manage.py runserver"
-            elif self.config.framework == "fastapi":
-                return "uvicorn main:app --reload"
-            else:
-                return "python main.py"
-        elif self.config.language in ("javascript", "typescript"):
-            return "npm run dev"
-        else:
-            return "./run.sh"
+        language = self.config.language
+        return self._START_COMMANDS.get(
+            (language, self.config.framework),
+            self._START_COMMANDS.get((language, None), "./run.sh"),
+        )
 
     def _ask_testing(self):
         """Ask for testing configuration."""
+        questionary = _load_questionary()
+
         console.print("\n[bold]Testing Configuration[/bold]")
 
         # Test framework
@@ -637,28 +1409,28 @@ class Initializer:
                 self.config.test_framework = default_framework
                 console.print(f"[dim]Using detected test framework: {default_framework}[/dim]")
             else:
+                by_name = self.TEST_FRAMEWORK_BY_NAME[self.config.language]
                 choice = questionary.select(
                     "Test framework:",
-                    choices=[c["name"] for c in frameworks],
+                    choices=list(by_name),
+                    default=self._previous_choice(frameworks, "test_framework"),
                 ).ask()
 
-                for c in frameworks:
-                    if c["name"] == choice:
-                        self.config.test_framework = c["value"]
-                        break
-
-        # Coverage threshold
-        coverage_str = questionary.text(
-            "Minimum coverage threshold (%):",
-            default="80",
-        ).ask()
-        self.config.coverage_threshold = int(coverage_str)
-
-        # E2E enabled
-        self.config.e2e_enabled = questionary.confirm(
-            "Enable E2E testing with Playwright?",
-            default=True,
-        ).ask()
+                if choice in by_name:
+                    self.config.test_framework = by_name[choice]
+
+        answers = self._ask_form({
+            "coverage_threshold": questionary.text(
+                "Minimum coverage threshold (%):",
+                default=str(self._previous("coverage_threshold", 80)),
+            ),
+            "e2e_enabled": questionary.confirm(
+                "Enable E2E testing with Playwright?",
+                default=self._previous("e2e_enabled", True),
+            ),
+        })
+        self.config.coverage_threshold = int(answers["coverage_threshold"])
+        self.config.e2e_enabled = answers["e2e_enabled"]
 
         # Set test commands
         self._set_test_commands()
@@ -679,23 +1451,31 @@ class Initializer:
 
     def _ask_git(self):
         """Ask for Git workflow configuration."""
-        console.print("\n[bold]Git Workflow[/bold]")
+        questionary = _load_questionary()
 
-        # Protected branches
-        branches = questionary.text(
-            "Protected branches (comma-separated):",
-            default="main, master",
-        ).ask()
-        self.config.protected_branches = [b.strip() for b in branches.split(",")]
+        console.print("\n[bold]Git Workflow[/bold]")
 
-        # Require confirmation
-        self.config.require_merge_confirmation = questionary.confirm(
-            "Require explicit confirmation before merging to protected branches?",
-            default=True,
-        ).ask()
+        answers = self._ask_form({
+            "protected_branches": questionary.text(
+                "Protected branches (comma-separated):",
+                default=", ".join(
+                    self._previous("protected_branches", _DEFAULT_PROTECTED)
+                ),
+            ),
+            "require_merge_confirmation": questionary.confirm(
+                "Require explicit confirmation before merging to protected branches?",
+                default=self._previous("require_merge_confirmation", True),
+            ),
+        })
+        self.config.protected_branches = [
+            b.strip() for b in answers["protected_branches"].split(",")
+        ]
+        self.config.require_merge_confirmation = answers["require_merge_confirmation"]
 
     def _ask_initial_features(self):
         """Ask for initial features to track."""
+        questionary = _load_questionary()
+
         console.print("\n[bold]Initial Feature Setup[/bold]")
 
         add_features = questionary.confirm(
@@ -736,6 +1516,8 @@ class Initializer:
 
     def _ask_claude_hooks(self):
         """Ask about auto-creating Claude Code hooks configuration."""
+        questionary = _load_questionary()
+
         console.print("\n[bold]Claude Code Hooks[/bold]")
         console.print(
             "[dim]Hooks integrate with Claude Code for automatic tracking and safety enforcement.[/dim]"
@@ -755,76 +1537,170 @@ class Initializer:
         """Generate all harness files."""
         console.print("\n[yellow]Generating harness files...[/yellow]")
 
-        # Create directories
-        harness_dir = self.project_path / ".claude-harness"
-        harness_dir.mkdir(exist_ok=True)
-        (harness_dir / "hooks").mkdir(exist_ok=True)
-        (harness_dir / "session-history").mkdir(exist_ok=True)
-
-        scripts_dir = self.project_path / "scripts"
-        scripts_dir.mkdir(exist_ok=True)
-
+        # Create every directory the tasks write into before they start
+        # (parents are created along the way)
+        directories = _GENERATED_DIRS
         if self.config.e2e_enabled:
-            e2e_dir = self.project_path / "e2e"
-            e2e_dir.mkdir(exist_ok=True)
-            (e2e_dir / "tests").mkdir(exist_ok=True)
-
-        # Generate config.json
-        self._write_config()
-
-        # Generate features.json
-        self._write_features()
+            directories += _E2E_DIRS
+
+        for rel_dir in directories:
+            directory = self.project_path / rel_dir
+            self._ensure_dir(directory)
+            self._created_dirs.add(directory.parent)
+
+        # The writes touch independent files, so overlap their I/O. Console
+        # output is captured per task and written out in order in one go.
+        tasks = [
+            self._write_config,
+            self._write_features,
+            self._write_progress,
+            self._write_init_script,
+        ]
+        # Keep an existing init.ps1 up to date even on hosts without pwsh
+        if self.config.generate_powershell or (self._scripts_dir / "init.ps1").exists():
+            tasks.append(self._write_init_powershell)
+        tasks += [
+            self._write_hooks,
+            self._update_gitignore,
+            self._update_claude_md,
+        ]
+        if self.config.create_claude_hooks:
+            tasks.append(self._write_claude_settings)
+        if self.config.e2e_enabled:
+            tasks.append(self._write_e2e_setup)
+        tasks.append(self._write_slash_commands)
+
+        # The config doesn't change while the tasks run; serialize it once
+        self._config_snapshot = self.config.to_json()
+        try:
+            with ThreadPoolExecutor(max_workers=GENERATE_WORKERS) as executor:
+                futures = [executor.submit(self._run_recorded, task) for task in tasks]
+                results = [future.result() for future in futures]
+        finally:
+            self._config_snapshot = None
+
+        # Files are listed in the summary; anything else printed goes out now
+        console.file.write("".join(output for output, _ in results))
+        for _, records in results:
+            self._created.extend(records)
+
+    def _run_recorded(self, task):
+        """Run a generation task, collecting its file records and console output.
 
-        # Generate progress.md
-        self._write_progress()
+        Returns:
+            Tuple of (captured output, list of (status, path) records)
+        """
+        records = self._task_records.items = []
+        try:
+            return _run_captured(task), records
+        finally:
+            del self._task_records.items
 
-        # Generate init.sh
-        self._write_init_script()
+    def _record(self, status: str, path: str):
+        """Report a written file.
 
-        # Generate init.ps1 (PowerShell)
-        self._write_init_powershell()
+        Inside _generate_files the record is kept for the summary table;
+        standalone calls (e.g. from the refresh command) print it right away.
+        """
+        records = getattr(self._task_records, "items", None)
+        if records is not None:
+            records.append((status, path))
+        else:
+            style = self._STATUS_STYLES[status]
+            console.print(f"  [{style}]{status}:[/{style}] {path}")
 
-        # Generate hooks
-        self._write_hooks()
+    def _ensure_dir(self, directory: Path):
+        """Create a directory (and parents) unless this run already has."""
+        if directory not in self._created_dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(directory)
 
-        # Update .gitignore for session files
-        self._update_gitignore()
+    def _write_file(self, rel_path: str, data, mode: int = 0o644):
+        """Write a generated file in one write call, creating its directory once.
 
-        # Update/create CLAUDE.md
-        self._update_claude_md()
+        The permission bits are applied through the open file descriptor, so
+        executables need no separate chmod by path. A file that already has
+        this content (and mode, for executables) is left untouched, so a
+        re-init with the same config keeps its mtimes.
 
-        # Create Claude Code settings with hooks if requested
-        if self.config.create_claude_hooks:
-            self._write_claude_settings()
+        Args:
+            rel_path: Path relative to the project root
+            data: File content as str (encoded as UTF-8) or bytes
+            mode: Permission bits for the file
 
-        # Generate E2E setup if enabled
-        if self.config.e2e_enabled:
-            self._write_e2e_setup()
+        Returns:
+            True if the file was written, False if it already matched
+        """
+        path = self.project_path / rel_path
+        self._ensure_dir(path.parent)
+
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+
+        try:
+            current = os.stat(path)
+        except OSError:
+            current = None
+        if (
+            current is not None
+            and current.st_size == len(data)
+            and not (mode & 0o111 and current.st_mode & 0o777 != mode)
+            and path.read_bytes() == data
+        ):
+            return False
+
+        fd = os.open(path, _WRITE_FLAGS, mode)
+        try:
+            if mode & 0o111 and hasattr(os, "fchmod"):
+                # Creation mode is masked by umask and ignored for existing files
+                os.fchmod(fd, mode)
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        return True
+
+    def _write_and_record(
+        self,
+        rel_path: str,
+        data,
+        status: str = "Created",
+        note: str = "",
+        mode: int = 0o644,
+    ):
+        """Write a generated file and report it, as Unchanged if it already matched.
 
-        # Generate slash commands for Claude Code integration
-        self._write_slash_commands()
+        Args:
+            rel_path: Path relative to the project root
+            data: File content as str (encoded as UTF-8) or bytes
+            status: Status reported when the file is written
+            note: Optional detail shown after the path when written
+            mode: Permission bits for the file
+        """
+        if self._write_file(rel_path, data, mode):
+            self._record(status, f"{rel_path} ({note})" if note else rel_path)
+        else:
+            self._record("Unchanged", rel_path)
 
     def _write_config(self):
         """Write config.json, preserving existing if present."""
-        config_path = self.project_path / ".claude-harness" / "config.json"
+        config_path = self._harness_dir / "config.json"
 
         if config_path.exists():
-            console.print(f"  [blue]Preserved:[/blue] .claude-harness/config.json (existing data kept)")
+            self._record("Preserved", ".claude-harness/config.json (existing data kept)")
             return
 
-        config_data = self.config.to_dict()
-
-        with open(config_path, "w") as f:
-            json.dump(config_data, f, indent=2)
+        self._write_file(".claude-harness/config.json", self._config_json())
 
-        console.print(f"  [green]Created:[/green] .claude-harness/config.json")
+        self._record("Created", ".claude-harness/config.json")
 
     def _write_features(self):
         """Write features.json, preserving existing if present."""
-        features_path = self.project_path / ".claude-harness" / "features.json"
+        features_path = self._harness_dir / "features.json"
 
         if features_path.exists():
-            console.print(f"  [blue]Preserved:[/blue] .claude-harness/features.json (existing data kept)")
+            self._record("Preserved", ".claude-harness/features.json (existing data kept)")
             return
 
         features_data = {
@@ -834,21 +1710,18 @@ class Initializer:
             "blocked": [],
         }
 
-        with open(features_path, "w") as f:
-            json.dump(features_data, f, indent=2)
+        self._write_file(".claude-harness/features.json", _dumps_json(features_data))
 
-        console.print(f"  [green]Created:[/green] .claude-harness/features.json")
+        self._record("Created", ".claude-harness/features.json")
 
     def _write_progress(self):
         """Write progress.md, preserving existing if present."""
-        progress_path = self.project_path / ".claude-harness" / "progress.md"
+        progress_path = self._harness_dir / "progress.md"
 
         if progress_path.exists():
-            console.print(f"  [blue]Preserved:[/blue] .claude-harness/progress.md (existing data kept)")
+            self._record("Preserved", ".claude-harness/progress.md (existing data kept)")
             return
 
-        from datetime import datetime, timezone
-
         content = f"""# Session Progress Log
 
 ## Last Session: {datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M")} UTC
@@ -883,599 +1756,258 @@ class Initializer:
 (No previous sessions)
 """
 
-        with open(progress_path, "w") as f:
-            f.write(content)
+        self._write_file(".claude-harness/progress.md", content)
 
-        console.print(f"  [green]Created:[/green] .claude-harness/progress.md")
+        self._record("Created", ".claude-harness/progress.md")
 
     def _write_init_script(self):
         """Write init.sh startup script."""
-        init_path = self.project_path / "scripts" / "init.sh"
-
         # Build script based on config
-        script = self._build_init_script()
+        script = self._cached_render("init.sh", self._build_init_script)
 
-        with open(init_path, "w") as f:
-            f.write(script)
+        self._write_and_record("scripts/init.sh", script, mode=0o755)
 
-        # Make executable
-        os.chmod(init_path, 0o755)
+    def _config_json(self) -> bytes:
+        """Serialized config, reusing the _generate_files snapshot if any."""
+        if self._config_snapshot is not None:
+            return self._config_snapshot
+        return self.config.to_json()
 
-        console.print(f"  [green]Created:[/green] scripts/init.sh")
+    def _cached_render(self, name: str, build, persist: bool = True) -> str:
+        """Return a rendered script, reusing earlier output for an identical config.
+
+        The script builders only read persisted config fields, so the
+        serialized config is a complete cache key. Renders are kept in
+        memory and in .claude-harness/.cache/, so a re-init with an
+        unchanged config copies the previous output without loading Jinja.
+
+        Args:
+            name: Script name, distinguishing builders in the shared cache
+            build: Zero-argument builder called on a cache miss
+            persist: Also keep the render on disk; only for template-backed
+                     builders, whose template content versions the entry
+
+        Returns:
+            Rendered script content
+        """
+        key = (name, self._config_json())
+        rendered = self._render_cache.get(key)
+        if rendered is None:
+            if persist:
+                rendered = self._disk_cached_render(name, key[1], build)
+            else:
+                rendered = build()
+            if len(self._render_cache) >= RENDER_CACHE_SIZE:
+                self._render_cache.clear()
+            self._render_cache[key] = rendered
+        return rendered
+
+    def _disk_cached_render(self, name: str, config_json: bytes, build) -> str:
+        """Read a render from the project's script cache, or build and store it.
+
+        Entries are named <stem>-<hash><suffix>, hashed over the config and
+        the template content so package upgrades invalidate them. Only the
+        newest entry per script is kept. Cache I/O errors fall back to build().
+        """
+        digest = hashlib.blake2b(config_json, digest_size=16)
+        digest.update(_template_stamp(name).encode())
+        stem, suffix = os.path.splitext(name)
+        cache_dir = self._harness_dir / ".cache"
+        cache_file = cache_dir / f"{stem}-{digest.hexdigest()}{suffix}"
+
+        try:
+            return cache_file.read_bytes().decode("utf-8")
+        except (OSError, UnicodeDecodeError):
+            pass
+
+        rendered = build()
+        try:
+            for stale in cache_dir.glob(f"{stem}-*{suffix}"):
+                stale.unlink()
+            self._write_file(cache_file.relative_to(self.project_path), rendered)
+        except OSError:
+            pass
+        return rendered
 
     def _build_init_script(self) -> str:
         """Build the init.sh script content.
 
         The script reads most values from config.json at runtime to stay in sync.
-        Only fallback defaults are hardcoded.
+        Only fallback defaults are hardcoded. Rendered from templates/init.sh.j2.
         """
-        backend_dir = self.config.backend_directory or self.config.source_directory
-        if backend_dir == ".":
-            backend_dir = ""
-
-        script = '''#!/bin/bash
-# Claude Harness - Session Initialization Script
-# Generated by claude-harness
-# NOTE: Most settings are read from .claude-harness/config.json at runtime
-
-set -e
-
-# Colors
-GREEN='\\033[0;32m'
-RED='\\033[0;31m'
-YELLOW='\\033[1;33m'
-BLUE='\\033[0;34m'
-NC='\\033[0m' # No Color
-
-HARNESS_DIR=".claude-harness"
-CONFIG="$HARNESS_DIR/config.json"
-
-# Check harness exists
-if [[ ! -f "$CONFIG" ]]; then
-    echo -e "${RED}ERROR: Harness not initialized. Run 'claude-harness init' first.${NC}"
-    exit 1
-fi
-
-# Read config values (with fallback defaults)
-if command -v jq &> /dev/null; then
-    PROJECT_NAME=$(jq -r '.project_name // "project"' "$CONFIG")
-    PORT=$(jq -r '.startup.port // 8000' "$CONFIG")
-    HEALTH_ENDPOINT=$(jq -r '.startup.health_endpoint // "/health"' "$CONFIG")
-    START_CMD=$(jq -r '.startup.start_command // "python main.py"' "$CONFIG")
-    VENV_PATH=$(jq -r '.paths.venv // "venv"' "$CONFIG")
-    ENV_FILE=$(jq -r '.paths.env_file // ".env"' "$CONFIG")
-    DATABASE=$(jq -r '.stack.database // ""' "$CONFIG")
-    LANGUAGE=$(jq -r '.stack.language // "python"' "$CONFIG")
-    PROTECTED=$(jq -r '.git.protected_branches | join(" ")' "$CONFIG" 2>/dev/null || echo "main master")
-else
-    # Fallback if jq not available
-    PROJECT_NAME="project"
-    PORT=8000
-    HEALTH_ENDPOINT="/health"
-    START_CMD="python main.py"
-    VENV_PATH="venv"
-    ENV_FILE=".env"
-    DATABASE=""
-    LANGUAGE="python"
-    PROTECTED="main master"
-fi
-
-echo ""
-echo -e "${BLUE}=======================================================${NC}"
-echo -e "${BLUE}  CLAUDE HARNESS - Session Initialization${NC}"
-echo -e "${BLUE}  Project: $PROJECT_NAME${NC}"
-echo -e "${BLUE}=======================================================${NC}"
-echo ""
-
-# 1. Git Status
-echo -e "${YELLOW}[1/6] GIT STATUS${NC}"
-if command -v git &> /dev/null && [[ -d ".git" ]]; then
-    BRANCH=$(git branch --show-current 2>/dev/null || echo "unknown")
-
-    if [[ " $PROTECTED " =~ " $BRANCH " ]]; then
-        echo -e "${RED}  WARNING: On protected branch '$BRANCH'!${NC}"
-        echo -e "${RED}  Create a feature branch before making changes.${NC}"
-    else
-        echo -e "${GREEN}  Branch: $BRANCH${NC}"
-    fi
-
-    # Check for uncommitted changes
-    if [[ -n $(git status --porcelain 2>/dev/null) ]]; then
-        echo -e "${YELLOW}  Uncommitted changes detected${NC}"
-    fi
-else
-    echo -e "${YELLOW}  Git not available or not a repository${NC}"
-fi
-echo ""
-'''
-
-        # Virtual environment setup (uses VENV_PATH from config)
-        script += '''
-# 2. Virtual Environment
-echo -e "${YELLOW}[2/6] VIRTUAL ENVIRONMENT${NC}"
-if [[ "$LANGUAGE" == "python" ]] && [[ -n "$VENV_PATH" ]]; then
-    VENV_ACTIVATE="$VENV_PATH/bin/activate"
-    if [[ -f "$VENV_ACTIVATE" ]]; then
-        source "$VENV_ACTIVATE" 2>/dev/null
-        echo -e "${GREEN}  Activated: $VENV_PATH${NC}"
-    else
-        echo -e "${RED}  Virtual environment not found at $VENV_PATH${NC}"
-        echo -e "${YELLOW}  Run: python -m venv $VENV_PATH${NC}"
-    fi
-else
-    echo -e "${GREEN}  No virtual environment needed${NC}"
-fi
-echo ""
-'''
-
-        # App status check (uses PORT, HEALTH_ENDPOINT, START_CMD from config)
-        script += '''
-# 3. Application Status
-echo -e "${YELLOW}[3/6] APPLICATION${NC}"
-HEALTH_URL="http://localhost:$PORT$HEALTH_ENDPOINT"
-
-if curl -s "$HEALTH_URL" > /dev/null 2>&1; then
-    echo -e "${GREEN}  App running on port $PORT${NC}"
-    APP_RUNNING=true
-else
-    echo -e "${YELLOW}  App not running on port $PORT${NC}"
-    APP_RUNNING=false
-
-    # Offer to start
-    read -p "  Start the application? (y/N) " -n 1 -r
-    echo
-    if [[ $REPLY =~ ^[Yy]$ ]]; then
-        if [[ -n "$ENV_FILE" ]] && [[ -f "$ENV_FILE" ]]; then
-            export $(grep -v '^#' "$ENV_FILE" | xargs) 2>/dev/null
-        fi
-        echo -e "${YELLOW}  Starting: $START_CMD${NC}"
-        LOG_FILE="/tmp/${PROJECT_NAME// /_}.log"
-        nohup $START_CMD > "$LOG_FILE" 2>&1 &
-        sleep 3
-
-        if curl -s "$HEALTH_URL" > /dev/null 2>&1; then
-            echo -e "${GREEN}  App started successfully${NC}"
-        else
-            echo -e "${RED}  Failed to start. Check $LOG_FILE${NC}"
-        fi
-    fi
-fi
-echo ""
-'''
-
-        # Database check (uses DATABASE from config)
-        script += '''
-# 4. Database Connection
-echo -e "${YELLOW}[4/6] DATABASE${NC}"
-if [[ -n "$DATABASE" ]]; then
-    echo -e "  Checking $DATABASE connection..."
-    # Generic database check - tries common Python patterns
-    python3 -c "
-import sys
-try:
-    # Try Flask pattern first
-    from app import create_app, db
-    app = create_app()
-    with app.app_context():
-        db.engine.connect()
-        print('  Connected successfully')
-except ImportError:
-    try:
-        # Try direct SQLAlchemy
-        from db import engine
-        engine.connect()
-        print('  Connected successfully')
-    except:
-        print('  Could not verify connection (check manually)')
-except Exception as e:
-    print(f'  Connection issue: {e}')
-" 2>/dev/null || echo -e "${YELLOW}  Could not verify database connection${NC}"
-else
-    echo -e "${GREEN}  No database configured${NC}"
-fi
-echo ""
-'''
-
-        # Test status (quick collection count, not full run)
-        script += '''
-# 5. Test Status
-echo -e "${YELLOW}[5/6] TESTS${NC}"
-if command -v pytest &> /dev/null; then
-    # Quick test collection (no execution)
-    TEST_COUNT=$(pytest --collect-only -q 2>/dev/null | tail -1 | grep -oE "[0-9]+ test" || echo "? tests")
-    echo -e "  Found: ${GREEN}$TEST_COUNT${NC}"
-    echo -e "  Run: pytest tests/ -v --tb=short"
-else
-    echo -e "${YELLOW}  pytest not available${NC}"
-fi
-echo ""
-'''
-
-        # Session progress
-        script += '''
-# 6. Session Progress
-echo -e "${YELLOW}[6/6] SESSION PROGRESS${NC}"
-PROGRESS_FILE="$HARNESS_DIR/progress.md"
-FEATURES_FILE="$HARNESS_DIR/features.json"
-
-if [[ -f "$PROGRESS_FILE" ]]; then
-    echo ""
-    echo -e "${BLUE}--- Last Session Summary ---${NC}"
-    # Show relevant sections from progress.md
-    sed -n '/^## Last Session/,/^## Previous/p' "$PROGRESS_FILE" | head -25
-    echo -e "${BLUE}----------------------------${NC}"
-fi
-
-if [[ -f "$FEATURES_FILE" ]] && command -v jq &> /dev/null; then
-    echo ""
-    CURRENT_PHASE=$(jq -r '.current_phase' "$FEATURES_FILE")
-    echo -e "  Current Phase: ${GREEN}$CURRENT_PHASE${NC}"
-
-    IN_PROGRESS=$(jq -r '.features[] | select(.status == "in_progress") | "\\(.id): \\(.name)"' "$FEATURES_FILE" 2>/dev/null | head -1)
-    if [[ -n "$IN_PROGRESS" ]]; then
-        echo -e "  In Progress: ${YELLOW}$IN_PROGRESS${NC}"
-    else
-        NEXT_PENDING=$(jq -r '.features[] | select(.status == "pending") | "\\(.id): \\(.name)"' "$FEATURES_FILE" 2>/dev/null | head -1)
-        if [[ -n "$NEXT_PENDING" ]]; then
-            echo -e "  Next Pending: ${BLUE}$NEXT_PENDING${NC}"
-        fi
-    fi
-fi
-
-echo ""
-echo -e "${BLUE}=======================================================${NC}"
-echo -e "${GREEN}  Ready to work!${NC}"
-echo -e "${BLUE}  Read .claude-harness/progress.md for full context${NC}"
-echo -e "${BLUE}=======================================================${NC}"
-echo ""
-'''
-
-        return script
+        return self._env().get_template("init.sh.j2").render(
+            config=self.config, database_ports=self._DATABASE_PORTS
+        )
 
     def _write_init_powershell(self):
         """Write init.ps1 PowerShell startup script."""
-        init_path = self.project_path / "scripts" / "init.ps1"
-
-        script = self._build_init_powershell()
-
-        with open(init_path, "w") as f:
-            f.write(script)
+        script = self._cached_render("init.ps1", self._build_init_powershell)
 
-        console.print(f"  [green]Created:[/green] scripts/init.ps1")
+        self._write_and_record("scripts/init.ps1", script)
 
     def _build_init_powershell(self) -> str:
-        """Build the init.ps1 PowerShell script content."""
+        """Build the init.ps1 PowerShell script content.
+
+        Rendered from templates/init.ps1.j2; only the values that need
+        Python-side computation are passed alongside the config.
+        """
         backend_dir = self.config.backend_directory or self.config.source_directory
         if backend_dir == ".":
             backend_dir = ""
 
-        script = f'''#Requires -Version 7.0
-<#
-.SYNOPSIS
-    Claude Harness - Session Initialization Script (PowerShell)
-.DESCRIPTION
-    Project: {self.config.project_name}
-    Generated by claude-harness
-.NOTES
-    Run this at the start of each Claude Code session
-#>
-
-$ErrorActionPreference = 'Continue'
-
-# Configuration
-$HarnessDir = ".claude-harness"
-$ConfigFile = "$HarnessDir/config.json"
-
-function Write-ColorOutput {{
-    param(
-        [string]$Message,
-        [string]$Color = "White"
-    )
-    Write-Host $Message -ForegroundColor $Color
-}}
-
-# Header
-Write-Host ""
-Write-ColorOutput "=======================================================" "Blue"
-Write-ColorOutput "  CLAUDE HARNESS - Session Initialization" "Blue"
-Write-ColorOutput "  Project: {self.config.project_name}" "Blue"
-Write-ColorOutput "=======================================================" "Blue"
-Write-Host ""
-
-# Check harness exists
-if (-not (Test-Path $ConfigFile)) {{
-    Write-ColorOutput "ERROR: Harness not initialized. Run 'claude-harness init' first." "Red"
-    exit 1
-}}
-
-# 1. Git Status
-Write-ColorOutput "[1/6] GIT STATUS" "Yellow"
-if (Get-Command git -ErrorAction SilentlyContinue) {{
-    if (Test-Path ".git") {{
-        $branch = git branch --show-current 2>$null
-        $protectedBranches = @({", ".join(f'"{b}"' for b in self.config.protected_branches)})
-
-        if ($protectedBranches -contains $branch) {{
-            Write-ColorOutput "  WARNING: On protected branch '$branch'!" "Red"
-            Write-ColorOutput "  Create a feature branch before making changes." "Red"
-        }} else {{
-            Write-ColorOutput "  Branch: $branch" "Green"
-        }}
-
-        # Check for uncommitted changes
-        $status = git status --porcelain 2>$null
-        if ($status) {{
-            Write-ColorOutput "  Uncommitted changes detected" "Yellow"
-        }}
-    }} else {{
-        Write-ColorOutput "  Not a git repository" "Yellow"
-    }}
-}} else {{
-    Write-ColorOutput "  Git not available" "Yellow"
-}}
-Write-Host ""
-'''
-
-        # Python-specific setup
+        venv_activate = ""
         if self.config.language == "python" and self.config.venv_path:
-            venv_activate = f"{backend_dir}/{self.config.venv_path}/Scripts/Activate.ps1" if backend_dir else f"{self.config.venv_path}/Scripts/Activate.ps1"
-            venv_activate = venv_activate.lstrip("/")
-
-            script += f'''
-# 2. Virtual Environment
-Write-ColorOutput "[2/6] VIRTUAL ENVIRONMENT" "Yellow"
-$venvActivate = "{venv_activate}"
-if (Test-Path $venvActivate) {{
-    try {{
-        & $venvActivate
-        Write-ColorOutput "  Activated: {self.config.venv_path}" "Green"
-    }} catch {{
-        Write-ColorOutput "  Failed to activate venv: $_" "Red"
-    }}
-}} else {{
-    Write-ColorOutput "  Virtual environment not found at {self.config.venv_path}" "Red"
-    Write-ColorOutput "  Run: python -m venv {self.config.venv_path}" "Yellow"
-}}
-Write-Host ""
-'''
-        else:
-            script += '''
-# 2. Environment (skip for non-Python)
-Write-ColorOutput "[2/6] ENVIRONMENT" "Yellow"
-Write-ColorOutput "  No virtual environment needed" "Green"
-Write-Host ""
-'''
-
-        # App status check
-        script += f'''
-# 3. Application Status
-Write-ColorOutput "[3/6] APPLICATION" "Yellow"
-$port = {self.config.port}
-$healthUrl = "http://localhost:$port{self.config.health_endpoint}"
-
-try {{
-    $response = Invoke-WebRequest -Uri $healthUrl -TimeoutSec 5 -UseBasicParsing -ErrorAction Stop
-    Write-ColorOutput "  App running on port $port" "Green"
-    $appRunning = $true
-}} catch {{
-    Write-ColorOutput "  App not running on port $port" "Yellow"
-    $appRunning = $false
-
-    $startApp = Read-Host "  Start the application? (y/N)"
-    if ($startApp -eq 'y' -or $startApp -eq 'Y') {{
-'''
-
-        # Start command based on stack
-        if backend_dir:
-            script += f'''        Push-Location "{backend_dir}"
-'''
-
-        if self.config.env_file:
-            script += f'''        # Load environment from .env
-        if (Test-Path "{self.config.env_file}") {{
-            Get-Content "{self.config.env_file}" | ForEach-Object {{
-                if ($_ -match '^([^#][^=]+)=(.*)$') {{
-                    [Environment]::SetEnvironmentVariable($matches[1], $matches[2], 'Process')
-                }}
-            }}
-        }}
-'''
-
-        script += f'''        Write-ColorOutput "  Starting: {self.config.start_command}" "Yellow"
-        Start-Process -FilePath "pwsh" -ArgumentList "-Command", "{self.config.start_command}" -WindowStyle Hidden
-        Start-Sleep -Seconds 3
-
-        try {{
-            $response = Invoke-WebRequest -Uri $healthUrl -TimeoutSec 5 -UseBasicParsing -ErrorAction Stop
-            Write-ColorOutput "  App started successfully" "Green"
-        }} catch {{
-            Write-ColorOutput "  Failed to start. Check logs." "Red"
-        }}
-'''
-
-        if backend_dir:
-            script += '''        Pop-Location
-'''
-
-        script += '''    }
-}
-Write-Host ""
-'''
-
-        # Database check
-        if self.config.database and self.config.language == "python":
-            script += f'''
-# 4. Database Connection
-Write-ColorOutput "[4/6] DATABASE ({self.config.database})" "Yellow"
-'''
-            if backend_dir:
-                script += f'''Push-Location "{backend_dir}"
-'''
-            script += '''try {
-    $result = python -c @"
-try:
-    from app import create_app
-    app = create_app()
-    with app.app_context():
-        from app.extensions import db
-        db.engine.connect()
-        print('Connected successfully')
-except Exception as e:
-    print(f'Connection failed: {e}')
-"@
-    Write-ColorOutput "  $result" "Green"
-} catch {
-    Write-ColorOutput "  Could not verify database connection" "Yellow"
-}
-'''
+            venv_activate = f"{self.config.venv_path}/Scripts/Activate.ps1"
             if backend_dir:
-                script += '''Pop-Location
-'''
-            script += '''Write-Host ""
-'''
-        else:
-            script += '''
-# 4. Database (skip)
-Write-ColorOutput "[4/6] DATABASE" "Yellow"
-Write-ColorOutput "  No database configured" "Green"
-Write-Host ""
-'''
-
-        # Test status
-        script += f'''
-# 5. Test Status
-Write-ColorOutput "[5/6] TESTS" "Yellow"
-'''
-        if backend_dir:
-            script += f'''Push-Location "{backend_dir}"
-'''
+                venv_activate = f"{backend_dir}/{venv_activate}"
+            venv_activate = venv_activate.lstrip("/")
 
-        if self.config.test_framework == "pytest":
-            script += f'''if (Get-Command pytest -ErrorAction SilentlyContinue) {{
-    try {{
-        $testResult = pytest {self.config.test_directory}/unit/ -q --tb=no 2>&1 | Select-Object -Last 3
-        Write-Host "  $testResult"
-    }} catch {{
-        Write-ColorOutput "  Could not run tests" "Yellow"
-    }}
-}} else {{
-    Write-ColorOutput "  pytest not available" "Yellow"
-}}
-'''
-        else:
-            script += f'''Write-ColorOutput "  Run: {self.config.unit_test_command}" "Yellow"
-'''
+        database = (self.config.database or "").lower()
+        return self._env().get_template("init.ps1.j2").render(
+            config=self.config,
+            backend_dir=backend_dir,
+            venv_activate=venv_activate,
+            db_port=self._DATABASE_PORTS.get(database),
+            db_file_based=database.startswith("sqlite"),
+            protected_branches=", ".join(
+                f'"{b}"' for b in self.config.protected_branches
+            ),
+        )
 
-        if backend_dir:
-            script += '''Pop-Location
-'''
-        script += '''Write-Host ""
-'''
+    def _write_hooks(self):
+        """Write Claude Code hooks that read JSON from stdin."""
+        # Event sender used by the tracking hooks - goes through the hook
+        # daemon's socket when `claude-harness daemon` is running, otherwise
+        # runs the equivalent claude-harness command
+        send_event = '''#!/bin/bash
+# Claude Harness - Hook Event Sender
+# Usage: send.sh EVENT [ARGS...]
+# Sends the event to the hook daemon if it is running; otherwise context
+# events are queued for the context tracker and other events run the CLI
+
+SOCKET=".claude-harness/harness.sock"
+PENDING_EVENTS=".claude-harness/.pending-events"
+
+# Events are tab-separated lines; arguments with tabs or newlines use the CLI
+SENDABLE=true
+for ARG in "$@"; do
+    case "$ARG" in
+        *$'\\t'*|*$'\\n'*) SENDABLE=false ;;
+    esac
+done
 
-        # Session progress
-        script += '''
-# 6. Session Progress
-Write-ColorOutput "[6/6] SESSION PROGRESS" "Yellow"
-$progressFile = "$HarnessDir/progress.md"
-$featuresFile = "$HarnessDir/features.json"
-
-if (Test-Path $progressFile) {
-    Write-Host ""
-    Write-ColorOutput "--- Last Session Summary ---" "Blue"
-    $content = Get-Content $progressFile -Raw
-    # Show the Last Session section
-    if ($content -match '(?s)## Last Session.*?(?=## Previous|$)') {
-        $matches[0] -split "`n" | Select-Object -First 25 | ForEach-Object { Write-Host $_ }
-    }
-    Write-ColorOutput "----------------------------" "Blue"
-}
+if [ "$SENDABLE" = true ]; then
+    if [ -S "$SOCKET" ] && command -v nc &> /dev/null; then
+        (IFS=$'\\t'; printf '%s\\n' "$*") | nc -U -w 1 "$SOCKET" 2>/dev/null && exit 0
+    fi
+    # Context events fire on every tool call: queue them for the next context
+    # tracker load (or 'claude-harness context flush') instead of starting
+    # Python. Lines are short, so the appends don't interleave.
+    # CLAUDE_HARNESS_HOOK_SYNC=1 records them right away instead
+    case "$1" in
+        track-read|track-write|track-command)
+            if [ -z "$CLAUDE_HARNESS_HOOK_SYNC" ]; then
+                (IFS=$'\\t'; printf '%s\\n' "$*") >> "$PENDING_EVENTS" 2>/dev/null && exit 0
+            fi
+            ;;
+    esac
+fi
 
-if (Test-Path $featuresFile) {
-    Write-Host ""
-    $features = Get-Content $featuresFile | ConvertFrom-Json
-    Write-ColorOutput "  Current Phase: $($features.current_phase)" "Green"
-
-    $inProgress = $features.features | Where-Object { $_.status -eq "in_progress" } | Select-Object -First 1
-    if ($inProgress) {
-        Write-ColorOutput "  In Progress: $($inProgress.id): $($inProgress.name)" "Yellow"
-    } else {
-        $nextPending = $features.features | Where-Object { $_.status -eq "pending" } | Select-Object -First 1
-        if ($nextPending) {
-            Write-ColorOutput "  Next Pending: $($nextPending.id): $($nextPending.name)" "Blue"
-        }
-    }
-}
+case "$1" in
+    progress-file) claude-harness progress file "$2" ;;
+    track-read) claude-harness context track-file "$2" "$3" ;;
+    track-write) claude-harness context track-file "$2" "$3" --write ;;
+    track-command) claude-harness context track-command "$2" ;;
+esac > /dev/null 2>&1
 
-Write-Host ""
-Write-ColorOutput "=======================================================" "Blue"
-Write-ColorOutput "  Ready to work!" "Green"
-Write-ColorOutput "  Read .claude-harness/progress.md for full context" "Blue"
-Write-ColorOutput "=======================================================" "Blue"
-Write-Host ""
+exit 0
 '''
 
-        return script
-
-    def _write_hooks(self):
-        """Write Claude Code hooks that read JSON from stdin."""
-        hooks_dir = self.project_path / ".claude-harness" / "hooks"
+        self._write_and_record(
+            ".claude-harness/hooks/send.sh", send_event, mode=0o755
+        )
 
         # Git safety hook - PreToolUse for Bash commands
-        # Reads JSON from stdin, extracts command, checks for dangerous operations
+        # Reads JSON from stdin, extracts command, checks for dangerous operations.
+        # Runs before every Bash call, so the rules use bash's built-in regex
+        # matching and git is only asked for the branch when a rule needs it.
+        branches = " ".join(self.config.protected_branches)
+        branch_re = _ere_alternation(self.config.protected_branches)
         git_safety = f'''#!/bin/bash
 # Claude Harness - Git Safety Hook (PreToolUse)
 # Blocks dangerous git operations
 # Input: JSON via stdin with tool_input.command
 
-# Read JSON from stdin
-INPUT_JSON=$(cat)
-
-# Extract the command from tool_input
-COMMAND=$(echo "$INPUT_JSON" | jq -r '.tool_input.command // empty' 2>/dev/null)
+# Extract the command from the JSON on stdin
+COMMAND=$(jq -r '.tool_input.command // empty' 2>/dev/null)
 
 # If no command found, allow
 [ -z "$COMMAND" ] && exit 0
 
-PROTECTED_BRANCHES="{" ".join(self.config.protected_branches)}"
-
-# Check current branch
-CURRENT_BRANCH=$(git branch --show-current 2>/dev/null || echo "")
+PROTECTED_BRANCHES={shlex.quote(branches)}
+
+# Rules, matched per line of the command
+COMMIT_RE='^git commit'
+FORCE_PUSH_RE={shlex.quote(f"git push.*(-f|--force).*({branch_re})")}
+REBASE_RE='git rebase'
+
+# Current branch, looked up once and only when a rule needs it. HEAD is read
+# directly (worktrees have a .git file pointing at the real git dir); git is
+# only started when the project isn't the repository root
+ON_PROTECTED=""
+check_branch() {{
+    [ -n "$ON_PROTECTED" ] && return
+    GIT_DIR_PATH=".git"
+    if [ -f "$GIT_DIR_PATH" ]; then
+        read -r HEAD_REF < "$GIT_DIR_PATH"
+        GIT_DIR_PATH=${{HEAD_REF#gitdir: }}
+    fi
+    if read -r HEAD_REF 2>/dev/null < "$GIT_DIR_PATH/HEAD"; then
+        case "$HEAD_REF" in
+            "ref: refs/heads/"*) CURRENT_BRANCH=${{HEAD_REF#ref: refs/heads/}} ;;
+            *) CURRENT_BRANCH="" ;;
+        esac
+    else
+        CURRENT_BRANCH=$(git branch --show-current 2>/dev/null || echo "")
+    fi
+    case " $PROTECTED_BRANCHES " in
+        *" $CURRENT_BRANCH "*) [ -n "$CURRENT_BRANCH" ] && ON_PROTECTED=true || ON_PROTECTED=false ;;
+        *) ON_PROTECTED=false ;;
+    esac
+}}
 
-# Block commits on protected branches
-for branch in $PROTECTED_BRANCHES; do
-    if [ "$CURRENT_BRANCH" = "$branch" ]; then
-        if echo "$COMMAND" | grep -qE "^git commit"; then
-            echo "BLOCKED: Cannot commit on protected branch '$branch'. Create a feature branch first." >&2
+while IFS= read -r LINE; do
+    # Block commits on protected branches
+    if [[ "$LINE" =~ $COMMIT_RE ]]; then
+        check_branch
+        if [ "$ON_PROTECTED" = true ]; then
+            echo "BLOCKED: Cannot commit on protected branch '$CURRENT_BRANCH'. Create a feature branch first." >&2
             exit 2
         fi
     fi
-done
 
-# Block force pushes to protected branches
-for branch in $PROTECTED_BRANCHES; do
-    if echo "$COMMAND" | grep -qE "git push.*(-f|--force).*($branch|origin/$branch)"; then
-        echo "BLOCKED: Cannot force push to protected branch '$branch'." >&2
+    # Block force pushes to protected branches
+    if [ -n "$PROTECTED_BRANCHES" ] && [[ "$LINE" =~ $FORCE_PUSH_RE ]]; then
+        echo "BLOCKED: Cannot force push to protected branch '${{BASH_REMATCH[2]}}'." >&2
         exit 2
     fi
-done
 
-# Block destructive rebase on protected branches
-for branch in $PROTECTED_BRANCHES; do
-    if echo "$COMMAND" | grep -qE "git rebase.*(origin/)?$branch"; then
-        if [ "$CURRENT_BRANCH" = "$branch" ]; then
-            echo "BLOCKED: Cannot rebase on protected branch '$branch'." >&2
+    # Block destructive rebase on protected branches
+    if [[ "$LINE" =~ $REBASE_RE ]]; then
+        check_branch
+        if [ "$ON_PROTECTED" = true ] && [[ "${{LINE#*git rebase}}" == *"$CURRENT_BRANCH"* ]]; then
+            echo "BLOCKED: Cannot rebase on protected branch '$CURRENT_BRANCH'." >&2
             exit 2
         fi
     fi
-done
+done <<< "$COMMAND"
 
 exit 0
 '''
 
-        git_safety_path = hooks_dir / "check-git-safety.sh"
-        with open(git_safety_path, "w") as f:
-            f.write(git_safety)
-        os.chmod(git_safety_path, 0o755)
+        self._write_and_record(
+            ".claude-harness/hooks/check-git-safety.sh", git_safety, mode=0o755
+        )
 
         # Track Read hook - PostToolUse for Read tool
         track_read = '''#!/bin/bash
@@ -1483,41 +2015,40 @@ exit 0
 # Tracks files read for context estimation
 # Input: JSON via stdin with tool_input.file_path
 
-# Read JSON from stdin
-INPUT_JSON=$(cat)
-
-# Extract file path
-FILE_PATH=$(echo "$INPUT_JSON" | jq -r '.tool_input.file_path // empty' 2>/dev/null)
+# Extract the file path from the JSON on stdin
+FILE_PATH=$(jq -r '.tool_input.file_path // empty' 2>/dev/null)
 
 # Skip if no file path or harness not initialized
 [ -z "$FILE_PATH" ] && exit 0
 [ -f ".claude-harness/config.json" ] || exit 0
 
-# Get file size for token estimation
+# Get file size for token estimation from metadata, without reading the
+# file: GNU stat uses -c %s, BSD/macOS stat uses -f %z; wc -c is the last resort
 if [ -f "$FILE_PATH" ]; then
-    CHAR_COUNT=$(wc -c < "$FILE_PATH" 2>/dev/null || echo 1000)
-    claude-harness context track-file "$FILE_PATH" "$CHAR_COUNT" 2>/dev/null || true
+    CHAR_COUNT=$(stat -c %s -- "$FILE_PATH" 2>/dev/null ||
+        stat -f %z -- "$FILE_PATH" 2>/dev/null ||
+        wc -c < "$FILE_PATH" 2>/dev/null || echo 1000)
+    .claude-harness/hooks/send.sh track-read "$FILE_PATH" "$CHAR_COUNT"
 fi
 
 exit 0
 '''
 
-        track_read_path = hooks_dir / "track-read.sh"
-        with open(track_read_path, "w") as f:
-            f.write(track_read)
-        os.chmod(track_read_path, 0o755)
+        self._write_and_record(
+            ".claude-harness/hooks/track-read.sh", track_read, mode=0o755
+        )
 
         # Track Write hook - PostToolUse for Write tool
-        track_write = '''#!/bin/bash
+        track_write = r'''#!/bin/bash
 # Claude Harness - Track File Write (PostToolUse)
 # Tracks files written for progress tracking
 # Input: JSON via stdin with tool_input.file_path
 
-# Read JSON from stdin
-INPUT_JSON=$(cat)
-
-# Extract file path
-FILE_PATH=$(echo "$INPUT_JSON" | jq -r '.tool_input.file_path // empty' 2>/dev/null)
+# One jq pass over stdin for the path and the content length (for token
+# estimates); fields are joined with \x1f so an empty path survives `read`
+IFS=$'\x1f' read -r FILE_PATH CONTENT_LENGTH < <(jq -r \
+    '[.tool_input.file_path // "", (.tool_input.content // "" | length)]
+     | map(tostring) | join("\u001f")' 2>/dev/null)
 
 # Skip if no file path or harness not initialized
 [ -z "$FILE_PATH" ] && exit 0
@@ -1531,33 +2062,33 @@ case "$FILE_PATH" in
 esac
 
 # Track the file in progress
-claude-harness progress file "$FILE_PATH" 2>/dev/null || true
+.claude-harness/hooks/send.sh progress-file "$FILE_PATH"
 
-# Also track in context (estimate tokens for content written)
-CONTENT_LENGTH=$(echo "$INPUT_JSON" | jq -r '.tool_input.content // empty' 2>/dev/null | wc -c)
-if [ "$CONTENT_LENGTH" -gt 0 ]; then
-    claude-harness context track-file "$FILE_PATH" "$CONTENT_LENGTH" --write 2>/dev/null || true
+# Also track in context
+if [ "${CONTENT_LENGTH:-0}" -gt 0 ]; then
+    .claude-harness/hooks/send.sh track-write "$FILE_PATH" "$CONTENT_LENGTH"
 fi
 
 exit 0
 '''
 
-        track_write_path = hooks_dir / "track-write.sh"
-        with open(track_write_path, "w") as f:
-            f.write(track_write)
-        os.chmod(track_write_path, 0o755)
+        self._write_and_record(
+            ".claude-harness/hooks/track-write.sh", track_write, mode=0o755
+        )
 
         # Track Edit hook - PostToolUse for Edit tool
-        track_edit = '''#!/bin/bash
+        track_edit = r'''#!/bin/bash
 # Claude Harness - Track File Edit (PostToolUse)
 # Tracks files edited for progress tracking
 # Input: JSON via stdin with tool_input.file_path
 
-# Read JSON from stdin
-INPUT_JSON=$(cat)
-
-# Extract file path
-FILE_PATH=$(echo "$INPUT_JSON" | jq -r '.tool_input.file_path // empty' 2>/dev/null)
+# One jq pass over stdin for the path and the edit size (old_string +
+# new_string, for token estimates); fields are joined with \x1f so an empty
+# path survives `read`
+IFS=$'\x1f' read -r FILE_PATH TOTAL_LEN < <(jq -r \
+    '[.tool_input.file_path // "",
+      (.tool_input.old_string // "" | length) + (.tool_input.new_string // "" | length)]
+     | map(tostring) | join("\u001f")' 2>/dev/null)
 
 # Skip if no file path or harness not initialized
 [ -z "$FILE_PATH" ] && exit 0
@@ -1571,23 +2102,18 @@ case "$FILE_PATH" in
 esac
 
 # Track the file in progress
-claude-harness progress file "$FILE_PATH" 2>/dev/null || true
-
-# Estimate tokens for edit (old_string + new_string)
-OLD_LEN=$(echo "$INPUT_JSON" | jq -r '.tool_input.old_string // empty' 2>/dev/null | wc -c)
-NEW_LEN=$(echo "$INPUT_JSON" | jq -r '.tool_input.new_string // empty' 2>/dev/null | wc -c)
-TOTAL_LEN=$((OLD_LEN + NEW_LEN))
-if [ "$TOTAL_LEN" -gt 0 ]; then
-    claude-harness context track-file "$FILE_PATH" "$TOTAL_LEN" --write 2>/dev/null || true
+.claude-harness/hooks/send.sh progress-file "$FILE_PATH"
+
+if [ "${TOTAL_LEN:-0}" -gt 0 ]; then
+    .claude-harness/hooks/send.sh track-write "$FILE_PATH" "$TOTAL_LEN"
 fi
 
 exit 0
 '''
 
-        track_edit_path = hooks_dir / "track-edit.sh"
-        with open(track_edit_path, "w") as f:
-            f.write(track_edit)
-        os.chmod(track_edit_path, 0o755)
+        self._write_and_record(
+            ".claude-harness/hooks/track-edit.sh", track_edit, mode=0o755
+        )
 
         # Activity logger hook - PostToolUse for Bash
         activity_logger = '''#!/bin/bash
@@ -1595,33 +2121,35 @@ exit 0
 # Logs bash commands for session tracking
 # Input: JSON via stdin with tool_input.command
 
-# Read JSON from stdin
-INPUT_JSON=$(cat)
-
-# Extract command
-COMMAND=$(echo "$INPUT_JSON" | jq -r '.tool_input.command // empty' 2>/dev/null)
+# Extract the command from the JSON on stdin
+COMMAND=$(jq -r '.tool_input.command // empty' 2>/dev/null)
 
 # Skip if no command or harness not initialized
 [ -z "$COMMAND" ] && exit 0
 [ -f ".claude-harness/config.json" ] || exit 0
 
+# One date call for both the timestamp and the log file's day
+NOW=$(date -Iseconds)
+DAY=${NOW:0:10}
 LOG_DIR=".claude-harness/session-history"
-LOG_FILE="$LOG_DIR/activity-$(date +%Y%m%d).log"
+LOG_FILE="$LOG_DIR/activity-${DAY//-/}.log"
+ENTRY="[$NOW] Bash: ${COMMAND:0:200}"
 
-mkdir -p "$LOG_DIR"
-echo "[$(date -Iseconds)] Bash: ${COMMAND:0:200}" >> "$LOG_FILE"
+# init creates LOG_DIR, so only fall back to mkdir if the append fails
+{ printf '%s\n' "$ENTRY" >> "$LOG_FILE"; } 2>/dev/null || {
+    mkdir -p "$LOG_DIR" && printf '%s\n' "$ENTRY" >> "$LOG_FILE"
+}
 
 # Track command execution in context
 COMMAND_LEN=${#COMMAND}
-claude-harness context track-command "$COMMAND_LEN" 2>/dev/null || true
+.claude-harness/hooks/send.sh track-command "$COMMAND_LEN"
 
 exit 0
 '''
 
-        logger_path = hooks_dir / "log-activity.sh"
-        with open(logger_path, "w") as f:
-            f.write(activity_logger)
-        os.chmod(logger_path, 0o755)
+        self._write_and_record(
+            ".claude-harness/hooks/log-activity.sh", activity_logger, mode=0o755
+        )
 
         # Session stop hook - shows summary, saves handoff, marks session closed
         session_stop = '''#!/bin/bash
@@ -1630,21 +2158,44 @@ exit 0
 
 [ -f ".claude-harness/config.json" ] || exit 0
 
+OUT_DIR=".claude-harness/.cache"
+[ -d "$OUT_DIR" ] || mkdir -p "$OUT_DIR"
+
+# One stop at a time: a re-invoked hook leaves it to the running one
+if command -v flock > /dev/null 2>&1; then
+    exec 9> "$OUT_DIR/stop.lock"
+    flock -n 9 || exit 0
+fi
+
+# Record events queued by the tracking hooks before summarizing
+claude-harness context flush > /dev/null 2>&1 || true
+
+# Check if auto_save_handoff is enabled (default: true)
+AUTO_HANDOFF=$(grep -o '"auto_save_handoff"[[:space:]]*:[[:space:]]*false' .claude-harness/config.json 2>/dev/null || echo "")
+
+# The summary and the handoff only read the flushed state, so they run side
+# by side; their output is printed afterwards in the usual order
+OUT="$OUT_DIR/stop-$$"
+claude-harness context show > "$OUT.context" 2>/dev/null &
+claude-harness progress show > "$OUT.progress" 2>/dev/null &
+if [ -z "$AUTO_HANDOFF" ]; then
+    claude-harness context handoff --save > "$OUT.handoff" 2>/dev/null &
+fi
+wait
+
 echo ""
 echo "=== Session Summary ==="
-claude-harness context show 2>/dev/null || true
+cat "$OUT.context"
 echo "---"
-claude-harness progress show 2>/dev/null || true
+cat "$OUT.progress"
 echo "======================="
-
-# Check if auto_save_handoff is enabled (default: true)
-AUTO_HANDOFF=$(cat .claude-harness/config.json 2>/dev/null | grep -o '"auto_save_handoff"[[:space:]]*:[[:space:]]*false' || echo "")
 if [ -z "$AUTO_HANDOFF" ]; then
     # Auto-save handoff document
     echo ""
     echo "Saving session handoff..."
-    claude-harness context handoff --save 2>/dev/null || true
+    cat "$OUT.handoff"
 fi
+rm -f "$OUT.context" "$OUT.progress" "$OUT.handoff"
 
 # Mark session as closed for clean restart
 claude-harness context session-close 2>/dev/null || true
@@ -1652,10 +2203,9 @@ claude-harness context session-close 2>/dev/null || true
 exit 0
 '''
 
-        session_stop_path = hooks_dir / "session-stop.sh"
-        with open(session_stop_path, "w") as f:
-            f.write(session_stop)
-        os.chmod(session_stop_path, 0o755)
+        self._write_and_record(
+            ".claude-harness/hooks/session-stop.sh", session_stop, mode=0o755
+        )
 
         # Check subtasks hook - audits in-progress features for unmarked subtasks
         check_subtasks = '''#!/bin/bash
@@ -1718,18 +2268,9 @@ PYTHON_SCRIPT
 exit 0
 '''
 
-        check_subtasks_path = hooks_dir / "check-subtasks.sh"
-        with open(check_subtasks_path, "w") as f:
-            f.write(check_subtasks)
-        os.chmod(check_subtasks_path, 0o755)
-
-        console.print(f"  [green]Created:[/green] .claude-harness/hooks/check-git-safety.sh")
-        console.print(f"  [green]Created:[/green] .claude-harness/hooks/track-read.sh")
-        console.print(f"  [green]Created:[/green] .claude-harness/hooks/track-write.sh")
-        console.print(f"  [green]Created:[/green] .claude-harness/hooks/track-edit.sh")
-        console.print(f"  [green]Created:[/green] .claude-harness/hooks/log-activity.sh")
-        console.print(f"  [green]Created:[/green] .claude-harness/hooks/session-stop.sh")
-        console.print(f"  [green]Created:[/green] .claude-harness/hooks/check-subtasks.sh")
+        self._write_and_record(
+            ".claude-harness/hooks/check-subtasks.sh", check_subtasks, mode=0o755
+        )
 
     def _get_default_permissions(self) -> list:
         """Generate default permissions based on detected stack.
@@ -1737,116 +2278,15 @@ exit 0
         Returns a list of permission patterns that allow common development
         commands without requiring manual approval each session.
         """
-        # Common permissions for all projects
-        permissions = [
-            # Harness file operations (allow editing harness files without prompts)
-            "Edit(.claude-harness/**)",
-            "Write(.claude-harness/**)",
-            "Read(.claude-harness/**)",
-
-            # Harness commands
-            "Bash(claude-harness:*)",
-            "Bash(.claude-harness/hooks/*:*)",
-
-            # Git operations
-            "Bash(git:*)",
-
-            # Common shell utilities
-            "Bash(cat:*)",
-            "Bash(ls:*)",
-            "Bash(echo:*)",
-            "Bash(grep:*)",
-            "Bash(find:*)",
-            "Bash(tree:*)",
-            "Bash(wc:*)",
-            "Bash(head:*)",
-            "Bash(tail:*)",
-            "Bash(mkdir:*)",
-            "Bash(cp:*)",
-            "Bash(mv:*)",
-            "Bash(rm:*)",
-            "Bash(chmod:*)",
-            "Bash(touch:*)",
-            "Bash(diff:*)",
-            "Bash(sort:*)",
-            "Bash(uniq:*)",
-            "Bash(which:*)",
-            "Bash(pwd)",
-            "Bash(env:*)",
-            "Bash(export:*)",
-            "Bash(timeout:*)",
-            "Bash(bash:*)",
-            "Bash(sh:*)",
-
-            # Web tools
-            "WebSearch",
-            "WebFetch(domain:*)",
+        docker = bool(self.config.framework) and "docker" in str(self.config.framework).lower()
+        return [
+            *self._BASE_PERMISSIONS,
+            *self._LANGUAGE_PERMISSIONS.get(self.config.language, ()),
+            *(self._DOCKER_PERMISSIONS if docker else ()),
+            # Add write-unit-tests skill if available
+            "Skill(write-unit-tests)",
         ]
 
-        # Python-specific permissions
-        if self.config.language == "python":
-            permissions.extend([
-                "Bash(python:*)",
-                "Bash(python3:*)",
-                "Bash(pip:*)",
-                "Bash(pip3:*)",
-                "Bash(source:*)",
-                "Bash(.venv/bin/*:*)",
-                "Bash(venv/bin/*:*)",
-                "Bash(alembic:*)",
-                "Bash(flask:*)",
-                "Bash(django-admin:*)",
-                "Bash(uvicorn:*)",
-                "Bash(gunicorn:*)",
-                "Bash(pytest:*)",
-                "Bash(mypy:*)",
-                "Bash(ruff:*)",
-                "Bash(black:*)",
-                "Bash(isort:*)",
-                "Bash(bandit:*)",
-                "Bash(coverage:*)",
-            ])
-
-        # JavaScript/TypeScript-specific permissions
-        if self.config.language in ["javascript", "typescript"]:
-            permissions.extend([
-                "Bash(node:*)",
-                "Bash(npm:*)",
-                "Bash(npx:*)",
-                "Bash(yarn:*)",
-                "Bash(pnpm:*)",
-                "Bash(jest:*)",
-                "Bash(vitest:*)",
-                "Bash(eslint:*)",
-                "Bash(prettier:*)",
-                "Bash(tsc:*)",
-            ])
-
-        # Go-specific permissions
-        if self.config.language == "go":
-            permissions.extend([
-                "Bash(go:*)",
-            ])
-
-        # Rust-specific permissions
-        if self.config.language == "rust":
-            permissions.extend([
-                "Bash(cargo:*)",
-                "Bash(rustc:*)",
-            ])
-
-        # Docker permissions (if detected)
-        if self.config.framework and "docker" in str(self.config.framework).lower():
-            permissions.extend([
-                "Bash(docker:*)",
-                "Bash(docker-compose:*)",
-            ])
-
-        # Add write-unit-tests skill if available
-        permissions.append("Skill(write-unit-tests)")
-
-        return permissions
-
     def _update_gitignore(self):
         """Update .gitignore to exclude session-specific harness files.
 
@@ -1854,33 +2294,43 @@ exit 0
         - context_metrics.json (session tracking)
         - session-history/ (archived sessions)
         - discoveries.json (session discoveries)
+        - .cache/ (rendered scripts, test counts and other caches)
+        - .pending-events*, .pending-reads* (queued hook events)
+
+        Only missing entries are appended, so re-running init on an older
+        project adds entries introduced since.
         """
         gitignore_path = self.project_path / ".gitignore"
 
-        # Entries to add
+        header = "# Claude Harness - session-specific files"
         harness_ignores = [
-            "",
-            "# Claude Harness - session-specific files",
             ".claude-harness/context_metrics.json",
             ".claude-harness/session-history/",
             ".claude-harness/discoveries.json",
+            ".claude-harness/.cache/",
+            ".claude-harness/.pending-events*",
+            ".claude-harness/.pending-reads*",
         ]
 
         existing_content = ""
         if gitignore_path.exists():
             existing_content = gitignore_path.read_text()
 
-        # Check if already present
-        if ".claude-harness/context_metrics.json" in existing_content:
-            console.print(f"  [blue]Preserved:[/blue] .gitignore (harness entries exist)")
+        # Add only the entries that are missing, so projects initialized by an
+        # older version pick up entries added since
+        existing_lines = {line.strip() for line in existing_content.splitlines()}
+        missing = [entry for entry in harness_ignores if entry not in existing_lines]
+        if not missing:
+            self._record("Preserved", ".gitignore (harness entries exist)")
             # Still untrack files in case they were tracked before
             self._untrack_session_files()
             return
 
-        # Append harness ignores
-        new_content = existing_content.rstrip() + "\n" + "\n".join(harness_ignores) + "\n"
-        gitignore_path.write_text(new_content)
-        console.print(f"  [green]Updated:[/green] .gitignore (added harness session files)")
+        if header not in existing_lines:
+            missing.insert(0, header)
+        new_content = existing_content.rstrip() + "\n\n" + "\n".join(missing) + "\n"
+        self._write_file(".gitignore", new_content.lstrip("\n"))
+        self._record("Updated", ".gitignore (added harness session files)")
 
         # Untrack already-tracked session files (gitignore only affects new files)
         self._untrack_session_files()
@@ -1941,86 +2391,8 @@ exit 0
         Uses settings.local.json (project-specific, not committed) rather than
         settings.json to keep harness hooks local to each project instance.
         """
-        claude_dir = self.project_path / ".claude"
-        claude_dir.mkdir(exist_ok=True)
-
-        settings_path = claude_dir / "settings.local.json"
-
-        # Correct Claude Code hooks format - hooks receive JSON via stdin
-        hooks_config = {
-            "hooks": {
-                "PreToolUse": [
-                    {
-                        "matcher": "Bash",
-                        "hooks": [
-                            {
-                                "type": "command",
-                                "command": ".claude-harness/hooks/check-git-safety.sh"
-                            }
-                        ]
-                    }
-                ],
-                "PostToolUse": [
-                    {
-                        "matcher": "Read",
-                        "hooks": [
-                            {
-                                "type": "command",
-                                "command": ".claude-harness/hooks/track-read.sh"
-                            }
-                        ]
-                    },
-                    {
-                        "matcher": "Write",
-                        "hooks": [
-                            {
-                                "type": "command",
-                                "command": ".claude-harness/hooks/track-write.sh"
-                            }
-                        ]
-                    },
-                    {
-                        "matcher": "Edit",
-                        "hooks": [
-                            {
-                                "type": "command",
-                                "command": ".claude-harness/hooks/track-edit.sh"
-                            }
-                        ]
-                    },
-                    {
-                        "matcher": "Bash",
-                        "hooks": [
-                            {
-                                "type": "command",
-                                "command": ".claude-harness/hooks/log-activity.sh"
-                            }
-                        ]
-                    }
-                ],
-                "SessionEnd": [
-                    {
-                        "hooks": [
-                            {
-                                "type": "command",
-                                "command": ".claude-harness/hooks/check-subtasks.sh"
-                            }
-                        ]
-                    },
-                    {
-                        "hooks": [
-                            {
-                                "type": "command",
-                                "command": ".claude-harness/hooks/session-stop.sh"
-                            }
-                        ]
-                    }
-                ]
-            },
-            "permissions": {
-                "allow": self._get_default_permissions()
-            }
-        }
+        settings_path = self._claude_dir / "settings.local.json"
+        permissions = self._get_default_permissions()
 
         if settings_path.exists():
             # Merge with existing settings
@@ -2031,28 +2403,33 @@ exit 0
                 if "hooks" not in existing:
                     existing["hooks"] = {}
 
-                for hook_type, hook_list in hooks_config["hooks"].items():
+                for hook_type, fingerprinted in _HOOK_FINGERPRINTS.items():
                     if hook_type not in existing["hooks"]:
                         existing["hooks"][hook_type] = []
+                    current = existing["hooks"][hook_type]
                     # Add our hooks if not already present
-                    for hook in hook_list:
-                        if hook not in existing["hooks"][hook_type]:
-                            existing["hooks"][hook_type].append(hook)
+                    present = {_hook_fingerprint(hook) for hook in current}
+                    current.extend(
+                        hook for fp, hook in fingerprinted if fp not in present
+                    )
 
                 # Merge permissions
                 if "permissions" not in existing:
                     existing["permissions"] = {}
                 if "allow" not in existing["permissions"]:
                     existing["permissions"]["allow"] = []
-                for perm in hooks_config["permissions"]["allow"]:
-                    if perm not in existing["permissions"]["allow"]:
-                        existing["permissions"]["allow"].append(perm)
-
-                with open(settings_path, "w") as f:
-                    json.dump(existing, f, indent=2)
-
-                console.print(
-                    f"  [green]Updated:[/green] .claude/settings.local.json (merged with existing)"
+                allowed = existing["permissions"]["allow"]
+                present = set(allowed)
+                for perm in permissions:
+                    if perm not in present:
+                        allowed.append(perm)
+                        present.add(perm)
+
+                self._write_and_record(
+                    ".claude/settings.local.json",
+                    _dumps_json(existing),
+                    status="Updated",
+                    note="merged with existing",
                 )
             except json.JSONDecodeError:
                 console.print(
@@ -2062,10 +2439,14 @@ exit 0
                     f"  [yellow]Skipping hooks config - please add manually from docs/HOOKS.md[/yellow]"
                 )
         else:
-            # Create new settings file
-            with open(settings_path, "w") as f:
-                json.dump(hooks_config, f, indent=2)
-            console.print(f"  [green]Created:[/green] .claude/settings.local.json")
+            # Create new settings file; only the permissions vary per config,
+            # so they are spliced in after the pre-serialized hooks
+            allow = json.dumps(permissions, indent=2).replace("\n", "\n    ")
+            self._write_and_record(
+                ".claude/settings.local.json",
+                f'{{\n  "hooks": {_harness_hooks_json()},\n'
+                f'  "permissions": {{\n    "allow": {allow}\n  }}\n}}',
+            )
 
     def _build_harness_section(self) -> str:
         """Build compact CLAUDE.md harness section optimized for AI comprehension.
@@ -2314,13 +2695,16 @@ Note: Claude's indicator is authoritative. Harness estimation is supplementary."
         - Conditional sections based on enabled features
         - Minimal redundancy
         """
-        claude_dir = self.project_path / ".claude"
-        claude_dir.mkdir(exist_ok=True)
+        claude_dir = self._claude_dir
+        self._ensure_dir(claude_dir)
 
         claude_md_path = claude_dir / "CLAUDE.md"
 
-        # Build harness section with modular components
-        harness_section = self._build_harness_section()
+        # Build harness section with modular components; it depends only on
+        # the config, so repeat inits with the same config reuse it
+        harness_section = self._cached_render(
+            "CLAUDE.md", self._build_harness_section, persist=False
+        )
 
         if claude_md_path.exists():
             # Append to existing
@@ -2328,19 +2712,24 @@ Note: Claude's indicator is authoritative. Harness estimation is supplementary."
 
             # Check if harness section already exists
             if "CLAUDE HARNESS INTEGRATION" not in existing_content:
-                with open(claude_md_path, "a") as f:
-                    f.write("\n" + harness_section)
-                console.print(f"  [green]Updated:[/green] .claude/CLAUDE.md (added harness section)")
+                self._write_and_record(
+                    ".claude/CLAUDE.md",
+                    existing_content + "\n" + harness_section,
+                    status="Updated",
+                    note="added harness section",
+                )
             else:
                 # Replace existing harness section with updated one
-                import re
                 # Match from "# CLAUDE HARNESS INTEGRATION" to just before "## Project-Specific" or similar end marker
                 # Use greedy match to capture entire harness section including all --- separators
                 pattern = r'# CLAUDE HARNESS INTEGRATION.*?(?=\n## Project-Specific|\n## Project Specific|\Z)'
                 new_content = re.sub(pattern, harness_section.strip() + "\n", existing_content, flags=re.DOTALL)
-                with open(claude_md_path, "w") as f:
-                    f.write(new_content)
-                console.print(f"  [green]Updated:[/green] .claude/CLAUDE.md (replaced harness section)")
+                self._write_and_record(
+                    ".claude/CLAUDE.md",
+                    new_content,
+                    status="Updated",
+                    note="replaced harness section",
+                )
         else:
             # Create new
             full_content = f"""# {self.config.project_name}
@@ -2357,14 +2746,10 @@ Note: Claude's indicator is authoritative. Harness estimation is supplementary."
 **Version:** 1.0
 **Maintained by:** Claude Harness
 """
-            with open(claude_md_path, "w") as f:
-                f.write(full_content)
-            console.print(f"  [green]Created:[/green] .claude/CLAUDE.md")
+            self._write_and_record(".claude/CLAUDE.md", full_content)
 
     def _write_e2e_setup(self):
         """Write E2E testing setup files."""
-        e2e_dir = self.project_path / "e2e"
-
         # Create conftest.py for pytest + playwright
         conftest = f'''"""E2E test configuration for Playwright."""
 import pytest
@@ -2393,9 +2778,7 @@ def authenticated_page(page: Page):
     return page
 '''
 
-        conftest_path = e2e_dir / "conftest.py"
-        with open(conftest_path, "w") as f:
-            f.write(conftest)
+        self._write_and_record("e2e/conftest.py", conftest)
 
         # Create example test
         example_test = f'''"""Example E2E test."""
@@ -2416,9 +2799,7 @@ def test_health_endpoint(page: Page):
     assert response.ok
 '''
 
-        test_path = e2e_dir / "tests" / "test_example.py"
-        with open(test_path, "w") as f:
-            f.write(example_test)
+        self._write_and_record("e2e/tests/test_example.py", example_test)
 
         # Create pytest.ini for e2e
         pytest_ini = '''[pytest]
@@ -2428,33 +2809,34 @@ python_functions = test_*
 addopts = -v --tb=short
 '''
 
-        pytest_ini_path = e2e_dir / "pytest.ini"
-        with open(pytest_ini_path, "w") as f:
-            f.write(pytest_ini)
-
-        console.print(f"  [green]Created:[/green] e2e/conftest.py")
-        console.print(f"  [green]Created:[/green] e2e/tests/test_example.py")
-        console.print(f"  [green]Created:[/green] e2e/pytest.ini")
+        self._write_and_record("e2e/pytest.ini", pytest_ini)
 
     def _write_slash_commands(self):
         """Write Claude Code slash commands for harness integration."""
-        claude_dir = self.project_path / ".claude"
-        claude_dir.mkdir(exist_ok=True)
-
-        commands_dir = claude_dir / "commands"
-        commands_dir.mkdir(exist_ok=True)
-
-        # Write all harness commands
-        created_files = write_commands_to_directory(commands_dir)
+        commands_dir = self._claude_dir / "commands"
+        self._ensure_dir(commands_dir)
+
+        # Write all harness commands; files already up to date are skipped
+        written = write_commands_to_directory(commands_dir, only_changed=True)
+        if written:
+            self._record(
+                "Created", f".claude/commands/ ({len(HARNESS_COMMANDS)} slash commands)"
+            )
+        else:
+            self._record("Unchanged", ".claude/commands/")
 
         # Generate README for commands
-        generate_commands_readme(commands_dir)
-
-        console.print(f"  [green]Created:[/green] .claude/commands/ ({len(created_files)} slash commands)")
-        console.print(f"  [green]Created:[/green] .claude/commands/README.md")
+        if generate_commands_readme(commands_dir, only_changed=True):
+            self._record("Created", ".claude/commands/README.md")
+        else:
+            self._record("Unchanged", ".claude/commands/README.md")
 
+    @_buffered_output()
     def _print_summary(self):
         """Print initialization summary."""
+        from rich.panel import Panel
+        from rich.table import Table
+
         console.print()
         console.print(
             Panel.fit(
@@ -2475,26 +2857,14 @@ addopts = -v --tb=short
             console.print("  2. Install browsers: [cyan]playwright install[/cyan]")
             console.print("  3. Run E2E tests: [cyan]pytest e2e/[/cyan]")
 
-        console.print("\n[bold]Files Created:[/bold]")
-        console.print("  .claude-harness/config.json")
-        console.print("  .claude-harness/features.json")
-        console.print("  .claude-harness/progress.md")
-        console.print("  .claude-harness/hooks/check-git-safety.sh")
-        console.print("  .claude-harness/hooks/log-activity.sh")
-        console.print("  .claude/CLAUDE.md (created or updated)")
-        console.print("  scripts/init.sh")
-        console.print("  scripts/init.ps1")
-
-        if self.config.create_claude_hooks:
-            console.print("  .claude/settings.local.json (Claude Code hooks)")
-
-        if self.config.e2e_enabled:
-            console.print("  e2e/conftest.py")
-            console.print("  e2e/tests/test_example.py")
-            console.print("  e2e/pytest.ini")
-
-        console.print("  .claude/commands/ (35 slash commands)")
-        console.print("  .claude/commands/README.md")
+        console.print("\n[bold]Files:[/bold]")
+        files = Table(box=None, padding=(0, 2), header_style="bold")
+        files.add_column("Status")
+        files.add_column("Path")
+        for status, path in self._created:
+            style = self._STATUS_STYLES[status]
+            files.add_row(f"[{style}]{status}[/{style}]", path)
+        console.print(files)
 
         console.print("\n[bold]Slash Commands Available:[/bold]")
         console.print("  Inside Claude Code, use commands like:")
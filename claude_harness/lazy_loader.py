@@ -6,6 +6,9 @@ Defers loading non-critical context until needed to optimize token usage:
 - Generates notes about deferred files for context awareness
 """
 
+import functools
+import os
+import re
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
@@ -44,6 +47,38 @@ class PrioritizedFile:
 CHARS_PER_TOKEN = 4
 CODE_CHARS_PER_TOKEN = 3.5
 
+# Extensions estimated at CODE_CHARS_PER_TOKEN
+_CODE_EXTENSIONS = frozenset(
+    {
+        ".py", ".js", ".ts", ".jsx", ".tsx", ".go", ".rs", ".java",
+        ".c", ".cpp", ".h", ".hpp", ".cs", ".rb", ".php", ".swift",
+        ".kt", ".scala", ".sh", ".bash", ".ps1", ".sql",
+    }
+)
+# Extensions classified as source files when no pattern matches
+_SOURCE_EXTENSIONS = frozenset(
+    {".py", ".js", ".ts", ".jsx", ".tsx", ".go", ".rs", ".java"}
+)
+
+# Filename fragments that mark a test file
+_TEST_FILE_PATTERNS = ("test_", "_test.", ".spec.")
+
+
+@functools.lru_cache(maxsize=None)
+def _pattern_union(patterns: tuple) -> "re.Pattern[str]":
+    """Compile substring patterns into one regex matching any of them (lowercase)."""
+    if not patterns:
+        return re.compile(r"(?!)")  # an empty group matches nothing
+    return re.compile("|".join(re.escape(p.lower()) for p in patterns))
+
+
+@functools.lru_cache(maxsize=None)
+def _skip_patterns_for(patterns: tuple, test_task: bool) -> tuple:
+    """Skip patterns for a task; test tasks keep test files."""
+    if not test_task:
+        return patterns
+    return tuple(p for p in patterns if p not in _TEST_FILE_PATTERNS)
+
 
 class LazyContextLoader:
     """Load context on-demand based on priority.
@@ -119,6 +154,46 @@ class LazyContextLoader:
                          If None, uses current working directory.
         """
         self.project_path = Path(project_path).resolve() if project_path else Path.cwd()
+        self._skip_patterns = tuple(self.SKIP_PATTERNS)
+        self._critical_re = _pattern_union(tuple(self.CRITICAL_PATTERNS))
+        self._important_re = _pattern_union(tuple(self.IMPORTANT_PATTERNS))
+        self._reference_re = _pattern_union(tuple(self.REFERENCE_PATTERNS))
+        # (filepath, task_type) -> (priority, reason), reused across planning passes
+        self._classified: dict[tuple[str, Optional[str]], tuple[FilePriority, str]] = {}
+        # Resolved path -> stat result, filled by _prewarm for the current plan
+        self._stat_cache: dict[str, os.stat_result] = {}
+
+    def _prewarm(self, filepaths: List[str]) -> None:
+        """Collect stat results for files a directory listing at a time.
+
+        On Windows the directory scan already returns size information, so
+        one scan per directory replaces a stat call per file. Elsewhere
+        DirEntry.stat() costs a syscall of its own, so nothing is collected.
+
+        Args:
+            filepaths: File paths about to be estimated.
+        """
+        self._stat_cache.clear()
+        if os.name != "nt":
+            return
+
+        # directory -> {entry name: path as _estimate_file_tokens spells it}
+        by_dir: dict[str, dict[str, str]] = {}
+        for filepath in filepaths:
+            path = os.path.join(self.project_path, filepath)
+            directory, name = os.path.split(path)
+            by_dir.setdefault(directory, {})[name] = path
+
+        for directory, names in by_dir.items():
+            if len(names) < 2:
+                continue  # a lone stat is cheaper than listing the directory
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.name in names:
+                            self._stat_cache[names[entry.name]] = entry.stat()
+            except OSError:
+                continue
 
     def _estimate_file_tokens(self, filepath: str) -> int:
         """Estimate token count for a file.
@@ -129,46 +204,20 @@ class LazyContextLoader:
         Returns:
             Estimated token count based on file size and type.
         """
-        try:
-            path = Path(filepath)
-            if not path.is_absolute():
-                path = self.project_path / path
-
-            if not path.exists():
+        path = os.path.join(self.project_path, filepath)
+        stat = self._stat_cache.get(path)
+        if stat is None:
+            try:
+                stat = os.stat(path)
+            except OSError:
                 return 0
 
-            size = path.stat().st_size
-            # Use code-specific ratio for source files
-            code_extensions = {
-                ".py",
-                ".js",
-                ".ts",
-                ".jsx",
-                ".tsx",
-                ".go",
-                ".rs",
-                ".java",
-                ".c",
-                ".cpp",
-                ".h",
-                ".hpp",
-                ".cs",
-                ".rb",
-                ".php",
-                ".swift",
-                ".kt",
-                ".scala",
-                ".sh",
-                ".bash",
-                ".ps1",
-                ".sql",
-            }
-
-            if path.suffix.lower() in code_extensions:
-                return int(size / CODE_CHARS_PER_TOKEN)
-            return int(size / CHARS_PER_TOKEN)
-        except (OSError, IOError):
-            return 0
+        size = stat.st_size
+        # Use code-specific ratio for source files. Integer forms of
+        # size / CODE_CHARS_PER_TOKEN and size / CHARS_PER_TOKEN.
+        if os.path.splitext(path)[1].lower() in _CODE_EXTENSIONS:
+            return size * 2 // 7
+        return size >> 2
 
     def _match_patterns(self, filename: str, patterns: List[str]) -> bool:
         """Check if filename matches any pattern.
@@ -180,11 +229,7 @@ class LazyContextLoader:
         Returns:
             True if any pattern matches.
         """
-        filename_lower = filename.lower()
-        for pattern in patterns:
-            if pattern.lower() in filename_lower:
-                return True
-        return False
+        return _pattern_union(tuple(patterns)).search(filename.lower()) is not None
 
     def _classify_file(
         self, filepath: str, task_type: Optional[str] = None
@@ -198,42 +243,51 @@ class LazyContextLoader:
         Returns:
             Tuple of (priority, reason).
         """
-        path = Path(filepath)
-        filename = path.name
+        key = (filepath, task_type)
+        classified = self._classified.get(key)
+        if classified is None:
+            classified = self._classified[key] = self._classify_uncached(
+                filepath, task_type
+            )
+        return classified
+
+    def _classify_uncached(
+        self, filepath: str, task_type: Optional[str]
+    ) -> tuple[FilePriority, str]:
+        """Classify a file without consulting the memo (see _classify_file)."""
+        filename = os.path.basename(filepath)
+        filename_lower = filename.lower()
         filepath_lower = filepath.lower()
 
-        # Check SKIP patterns first (unless task-specific override)
-        if task_type and task_type.lower() in self.TEST_TASK_TYPES:
-            # For test tasks, don't skip test files
-            skip_patterns = [
-                p for p in self.SKIP_PATTERNS if p not in ["test_", "_test.", ".spec."]
-            ]
-        else:
-            skip_patterns = self.SKIP_PATTERNS
-
-        for pattern in skip_patterns:
-            if pattern.lower() in filepath_lower:
-                return (
-                    FilePriority.SKIP,
-                    f"Matches skip pattern: {pattern}",
-                )
+        # Check SKIP patterns first (for test tasks, don't skip test files)
+        skip_patterns = _skip_patterns_for(
+            self._skip_patterns,
+            bool(task_type) and task_type.lower() in self.TEST_TASK_TYPES,
+        )
+        if _pattern_union(skip_patterns).search(filepath_lower):
+            # Report the first listed pattern, as the scan order defines
+            pattern = next(p for p in skip_patterns if p.lower() in filepath_lower)
+            return (
+                FilePriority.SKIP,
+                f"Matches skip pattern: {pattern}",
+            )
 
         # Check CRITICAL patterns
-        if self._match_patterns(filename, self.CRITICAL_PATTERNS):
+        if self._critical_re.search(filename_lower):
             return (
                 FilePriority.CRITICAL,
                 f"Entry point or critical file: {filename}",
             )
 
         # Check IMPORTANT patterns
-        if self._match_patterns(filename, self.IMPORTANT_PATTERNS):
+        if self._important_re.search(filename_lower):
             return (
                 FilePriority.IMPORTANT,
                 f"Core application file: {filename}",
             )
 
         # Check REFERENCE patterns
-        if self._match_patterns(filename, self.REFERENCE_PATTERNS):
+        if self._reference_re.search(filename_lower):
             # For doc tasks, elevate reference files to important
             if task_type and task_type.lower() in self.DOC_TASK_TYPES:
                 return (
@@ -246,7 +300,7 @@ class LazyContextLoader:
             )
 
         # Test files when not doing test tasks
-        if self._match_patterns(filename, ["test_", "_test.", ".spec."]):
+        if _pattern_union(_TEST_FILE_PATTERNS).search(filename_lower):
             if task_type and task_type.lower() in self.TEST_TASK_TYPES:
                 return (
                     FilePriority.IMPORTANT,
@@ -258,17 +312,7 @@ class LazyContextLoader:
             )
 
         # Default to IMPORTANT for source files
-        source_extensions = {
-            ".py",
-            ".js",
-            ".ts",
-            ".jsx",
-            ".tsx",
-            ".go",
-            ".rs",
-            ".java",
-        }
-        if path.suffix.lower() in source_extensions:
+        if os.path.splitext(filename_lower)[1] in _SOURCE_EXTENSIONS:
             return (
                 FilePriority.IMPORTANT,
                 f"Source file: {filename}",
@@ -293,23 +337,39 @@ class LazyContextLoader:
         Returns:
             List of PrioritizedFile objects sorted by priority (CRITICAL first).
         """
-        prioritized = []
+        buckets = self._bucket_files(filepaths, task_type)
+        # Bucket order is priority order, so no sort is needed
+        return [pf for priority in FilePriority for pf in buckets[priority]]
+
+    def _bucket_files(
+        self, filepaths: List[str], task_type: Optional[str] = None
+    ) -> dict[FilePriority, List[PrioritizedFile]]:
+        """Classify and estimate files in one pass, grouped by priority.
+
+        Args:
+            filepaths: List of file paths to prioritize.
+            task_type: Optional task type to influence prioritization.
+
+        Returns:
+            Dict of priority to its files, in input order.
+        """
+        buckets: dict[FilePriority, List[PrioritizedFile]] = {
+            priority: [] for priority in FilePriority
+        }
+        self._prewarm(filepaths)
 
         for filepath in filepaths:
             priority, reason = self._classify_file(filepath, task_type)
-            estimated_tokens = self._estimate_file_tokens(filepath)
-
-            prioritized.append(
+            buckets[priority].append(
                 PrioritizedFile(
                     filepath=filepath,
                     priority=priority,
                     reason=reason,
-                    estimated_tokens=estimated_tokens,
+                    estimated_tokens=self._estimate_file_tokens(filepath),
                 )
             )
 
-        # Sort by priority value (lower = higher priority)
-        return sorted(prioritized, key=lambda pf: pf.priority.value)
+        return buckets
 
     def get_deferred_files(self, prioritized: List[PrioritizedFile]) -> List[str]:
         """Get files that can be deferred (REFERENCE and SKIP priority).
@@ -352,7 +412,9 @@ class LazyContextLoader:
         """
         return sum(self._estimate_file_tokens(fp) for fp in deferred)
 
-    def generate_deferral_note(self, deferred: List[str]) -> str:
+    def generate_deferral_note(
+        self, deferred: List[str], total_tokens: Optional[int] = None
+    ) -> str:
         """Generate a note about deferred files for context awareness.
 
         This note can be included in the context to inform Claude about
@@ -360,6 +422,8 @@ class LazyContextLoader:
 
         Args:
             deferred: List of deferred file paths.
+            total_tokens: Already-estimated tokens for the deferred files.
+                         If None, they are estimated from the files on disk.
 
         Returns:
             Formatted note about deferred files.
@@ -367,7 +431,8 @@ class LazyContextLoader:
         if not deferred:
             return ""
 
-        total_tokens = self.estimate_deferred_savings(deferred)
+        if total_tokens is None:
+            total_tokens = self.estimate_deferred_savings(deferred)
 
         lines = [
             "---",
@@ -429,19 +494,10 @@ class LazyContextLoader:
             - tokens_saved: Estimated tokens saved by deferral/skip
             - deferral_note: Note about deferred files
         """
-        prioritized = self.prioritize_files(filepaths, task_type)
-
-        immediate = []
-        deferred = []
-        skipped = []
-
-        for pf in prioritized:
-            if pf.priority in (FilePriority.CRITICAL, FilePriority.IMPORTANT):
-                immediate.append(pf)
-            elif pf.priority == FilePriority.REFERENCE:
-                deferred.append(pf)
-            else:
-                skipped.append(pf)
+        buckets = self._bucket_files(filepaths, task_type)
+        immediate = buckets[FilePriority.CRITICAL] + buckets[FilePriority.IMPORTANT]
+        deferred = buckets[FilePriority.REFERENCE]
+        skipped = buckets[FilePriority.SKIP]
 
         tokens_immediate = sum(pf.estimated_tokens for pf in immediate)
         tokens_deferred = sum(pf.estimated_tokens for pf in deferred)
@@ -455,7 +511,9 @@ class LazyContextLoader:
             "skipped": [pf.to_dict() for pf in skipped],
             "tokens_immediate": tokens_immediate,
             "tokens_saved": tokens_deferred + tokens_skipped,
-            "deferral_note": self.generate_deferral_note(deferred_paths),
+            "deferral_note": self.generate_deferral_note(
+                deferred_paths, tokens_deferred
+            ),
             "summary": {
                 "total_files": len(filepaths),
                 "immediate_count": len(immediate),
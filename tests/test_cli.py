@@ -729,6 +729,17 @@ class TestContextCommands:
         assert result.exit_code == 0
         assert "tracked" in result.output.lower()
 
+    def test_context_flush(self, runner, initialized_project):
+        """Test context flush command."""
+        import os
+        os.chdir(initialized_project)
+        pending = initialized_project / ".claude-harness" / ".pending-events"
+        pending.write_text("track-read\ta.py\t10\ntrack-write\tb.py\t20\n")
+        result = runner.invoke(main, ["context", "flush"])
+        assert result.exit_code == 0
+        assert "Recorded 2" in result.output
+        assert not pending.exists()
+
     def test_context_start_task(self, runner, initialized_project):
         """Test context start-task command."""
         import os
@@ -199,6 +199,18 @@ class TestWriteCommandsToDirectory:
         assert "old content" not in content
 
 
+    def test_only_changed_reports_written_files(self, tmp_path):
+        """Test that up-to-date files are skipped and left out with only_changed."""
+        commands_dir = tmp_path / "commands"
+        write_commands_to_directory(commands_dir)
+        (commands_dir / "harness-status.md").write_text("old content")
+
+        written = write_commands_to_directory(commands_dir, only_changed=True)
+
+        assert written == [str(commands_dir / "harness-status.md")]
+        assert write_commands_to_directory(commands_dir, only_changed=True) == []
+        assert len(write_commands_to_directory(commands_dir)) == len(HARNESS_COMMANDS)
+
 class TestGetCommandList:
     """Tests for get_command_list function."""
 
@@ -271,6 +283,30 @@ class TestGenerateCommandsReadme:
 
         assert "## Usage" in content
 
+    def test_readme_only_changed(self, tmp_path):
+        """Test that an up-to-date README is reported as not written."""
+        commands_dir = tmp_path / "commands"
+        commands_dir.mkdir()
+
+        assert generate_commands_readme(commands_dir, only_changed=True)
+        assert generate_commands_readme(commands_dir, only_changed=True) is None
+        assert generate_commands_readme(commands_dir) == str(commands_dir / "README.md")
+
+    def test_readme_table_rows_in_order(self, tmp_path):
+        """Test that the table has one sorted row per command, between header and usage."""
+        commands_dir = tmp_path / "commands"
+        commands_dir.mkdir()
+
+        content = Path(generate_commands_readme(commands_dir)).read_text()
+        table, _, _ = content.partition("\n## Usage")
+        rows = [line for line in table.splitlines() if line.startswith("| `/")]
+
+        assert rows == [
+            f"| `/{name}` | {HARNESS_COMMANDS[name]['description']} |"
+            for name in sorted(HARNESS_COMMANDS)
+        ]
+        assert content.endswith("claude-harness init\n```\n")
+
 
 class TestCommandContent:
     """Tests for specific command content."""
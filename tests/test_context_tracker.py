@@ -176,6 +176,50 @@ class TestContextTracker:
         # But chars should accumulate
         assert metrics.files_read_chars >= 1500
 
+    def test_pending_events_ingested_on_load(self, tracker, temp_project):
+        """Test that events queued by the hooks are counted on the next load."""
+        pending = temp_project / ".claude-harness" / ".pending-events"
+        pending.write_text(
+            "track-read\tsrc/a.py\t400\n"
+            "track-write\tsrc/b.py\t   80\n"
+            "track-command\t12\n"
+            "bad line\n"
+            "track-read\tsrc/c.py\tx\n"
+        )
+
+        metrics = tracker.get_metrics()
+
+        assert metrics.files_read == ["src/a.py"]
+        assert metrics.files_read_chars == 400
+        assert metrics.files_written == ["src/b.py"]
+        assert metrics.files_written_chars == 80
+        assert metrics.commands_executed == 1
+        assert metrics.tool_calls == 3
+        assert not pending.exists()
+        # Persisted, so a new tracker doesn't need the queue
+        assert ContextTracker(str(temp_project)).get_metrics().files_written_chars == 80
+
+    def test_legacy_pending_reads_ingested(self, tracker, temp_project):
+        """Test that reads queued by older hooks are still counted."""
+        pending = temp_project / ".claude-harness" / ".pending-reads"
+        pending.write_text("src/a.py\t400\nsrc/b.md\t   80\nbad line\n")
+
+        metrics = tracker.get_metrics()
+
+        assert metrics.files_read == ["src/a.py", "src/b.md"]
+        assert metrics.files_read_chars == 480
+        assert not pending.exists()
+
+    def test_flush_pending_events(self, tracker, temp_project):
+        """Test that flush picks up events queued after the first load."""
+        tracker.track_file_read("src/main.py", 100)
+        pending = temp_project / ".claude-harness" / ".pending-events"
+        pending.write_text("track-read\tsrc/queued.py\t200\n")
+
+        assert tracker.flush_pending_events() == 1
+        assert "src/queued.py" in tracker.get_metrics().files_read
+        assert tracker.flush_pending_events() == 1
+
     def test_track_file_write(self, tracker):
         """Test tracking a file write."""
         tracker.track_file_write("src/output.py", 500)
@@ -430,6 +474,14 @@ class TestContextTrackerDisabled:
         disabled_tracker.track_command("ls", 100)
         # Should not raise, just skip
 
+    def test_pending_events_dropped_when_disabled(self, disabled_tracker):
+        """Test that queued events are discarded rather than recorded."""
+        disabled_tracker.pending_events_file.write_text("track-read\ttest.py\t1000\n")
+
+        assert disabled_tracker.flush_pending_events() == 0
+        assert disabled_tracker.get_metrics().files_read == []
+        assert not disabled_tracker.pending_events_file.exists()
+
 
 class TestSessionBasedTracking:
     """Tests for session-based context tracking."""
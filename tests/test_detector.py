@@ -135,3 +135,41 @@ class TestStackDetector:
 
         assert detected_full.confidence > detected_minimal.confidence
         assert detected_full.confidence >= 0.5
+
+    def test_manifest_read_once_per_content(self, tmp_path, monkeypatch):
+        """Test that an unchanged dependency file is read only once."""
+        req_file = tmp_path / "requirements.txt"
+        req_file.write_text("flask\npsycopg2\npytest\n")
+        reads = []
+        real_read_text = Path.read_text
+
+        def counting_read_text(path, *args, **kwargs):
+            reads.append(path.name)
+            return real_read_text(path, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "read_text", counting_read_text)
+
+        first = detect_stack(str(tmp_path))
+        second = detect_stack(str(tmp_path))
+
+        assert reads.count("requirements.txt") == 1
+        assert first.to_dict() == second.to_dict()
+        assert second.database == "PostgreSQL"
+
+        req_file.write_text("django\npymongo\n")
+        changed = detect_stack(str(tmp_path))
+
+        assert reads.count("requirements.txt") == 2
+        assert changed.framework == "Django"
+        assert changed.database == "MongoDB"
+
+    def test_detected_stack_is_slotted(self):
+        """Test that DetectedStack stores fields in slots."""
+        from claude_harness.detector import DetectedStack
+
+        detected = DetectedStack(language="go")
+
+        assert not hasattr(detected, "__dict__")
+        with pytest.raises(AttributeError):
+            detected.not_a_field = True
+        assert detected.to_dict()["language"] == "go"
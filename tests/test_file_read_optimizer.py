@@ -5,6 +5,7 @@ large files (JSON, logs, markdown) to save tokens while preserving structure
 and essential information.
 """
 
+import asyncio
 import json
 import pytest
 from pathlib import Path
@@ -170,6 +171,13 @@ class TestSummarizeJsonStructure:
         assert "name" in result
         assert "nested" in result
 
+    def test_extract_json_structure_from_bytes(self, optimizer):
+        """Test that raw bytes give the same structure as a string."""
+        json_content = json.dumps({"name": "test", "items": [1, 2, 3]})
+        assert optimizer.extract_json_structure(
+            json_content.encode("utf-8")
+        ) == optimizer.extract_json_structure(json_content)
+
 
 class TestSummarizeMarkdownHeadings:
     """Tests for markdown heading extraction."""
@@ -254,6 +262,15 @@ class TestTruncateWithIndicator:
         # First lines should be present
         assert "line 0" in result
 
+    def test_truncate_with_presplit_lines(self, optimizer):
+        """Test that pre-split lines give the same result as splitting."""
+        content = "\n".join(f"line {i}" for i in range(100))
+        expected = optimizer.truncate_with_indicator(content, max_lines=10)
+        result = optimizer.truncate_with_indicator(
+            content, max_lines=10, lines=content.split("\n")
+        )
+        assert result == expected
+
 
 class TestGetReadRecommendation:
     """Tests for get_read_recommendation method."""
@@ -280,6 +297,25 @@ class TestGetReadRecommendation:
         # Unknown file type - read full with warning
         assert recommendation["action"] == "read_full"
 
+    def test_read_recommendation_skips_gzipped_log(self, optimizer, tmp_path):
+        """Test that binary content is skipped regardless of extension."""
+        log_file = tmp_path / "app.log"
+        log_file.write_bytes(b"\x1f\x8b\x08\x00" + b"\x00" * 10000)
+
+        recommendation = optimizer.get_read_recommendation(str(log_file), 10004)
+        assert recommendation["action"] == "skip"
+        assert recommendation["reason"] == "binary"
+
+    def test_read_recommendation_text_log_not_skipped(self, optimizer, tmp_path):
+        """Test that text files with a summarizable extension are not skipped."""
+        log_file = tmp_path / "app.log"
+        log_file.write_text("INFO started\n" * 1000)
+
+        recommendation = optimizer.get_read_recommendation(
+            str(log_file), log_file.stat().st_size
+        )
+        assert recommendation["action"] == "summarize"
+
 
 class TestTokensSavedEstimation:
     """Tests for tokens_saved estimation."""
@@ -401,3 +437,97 @@ class TestEdgeCases:
         json_content = json.dumps({"message": "Hello World", "emoji": "Test"})
         result, tokens_saved = optimizer.summarize_file("unicode.json", json_content)
         assert isinstance(result, str)
+
+
+class TestTailPath:
+    """Tests for tail_path seek-from-end reading."""
+
+    @pytest.fixture
+    def optimizer(self):
+        """Create a FileReadOptimizer instance."""
+        return FileReadOptimizer()
+
+    def test_tail_path_small_file_matches_extract_tail(self, optimizer, tmp_path):
+        """Test that a fully-read file gives the same result as _extract_tail."""
+        content = "\n".join(f"line {i}" for i in range(50))
+        log_file = tmp_path / "app.log"
+        log_file.write_text(content)
+
+        assert optimizer.tail_path(str(log_file), 10) == optimizer._extract_tail(
+            content, 10
+        )
+
+    def test_tail_path_reads_only_the_end(self, optimizer, tmp_path):
+        """Test that the tail of a large file is returned in small chunks."""
+        content = "\n".join(f"line {i}" for i in range(10000))
+        log_file = tmp_path / "app.log"
+        log_file.write_text(content)
+
+        result = optimizer.tail_path(str(log_file), 5, chunk=128)
+
+        assert result.startswith("[... earlier lines skipped ...]")
+        assert result.endswith("\n".join(f"line {i}" for i in range(9995, 10000)))
+        assert "line 9994\n" not in result
+
+    def test_read_recommendation_large_log_fast_path(self, optimizer):
+        """Test that large logs are pointed at the tail fast path."""
+        recommendation = optimizer.get_read_recommendation("app.log", 10000)
+        assert recommendation["fast_path"] == "tail_path"
+
+
+class TestSummarizeBatch:
+    """Tests for summarize_batch."""
+
+    @pytest.fixture
+    def optimizer(self):
+        """Create a FileReadOptimizer instance."""
+        return FileReadOptimizer()
+
+    @pytest.fixture
+    def items(self):
+        """Create a mixed batch of files."""
+        return [
+            ("data.json", json.dumps({"key": "value" * 100, "n": [1, 2, 3]})),
+            ("app.log", "\n".join(f"log {i}" for i in range(500))),
+            ("README.md", "# Title\n\nIntro text.\n\n## Usage\n\nRun it.\n"),
+            ("notes.txt", "\n".join(f"note {i}" for i in range(200))),
+            ("main.py", "print('hello')\n"),
+        ]
+
+    def test_summarize_batch_sequential(self, optimizer, items):
+        """Test that sequential batches match per-file summarization."""
+        expected = [optimizer.summarize_file(path, content) for path, content in items]
+        assert optimizer.summarize_batch(items, parallel=False) == expected
+
+    def test_summarize_batch_parallel(self, optimizer, items):
+        """Test that parallel batches preserve order and results."""
+        expected = [optimizer.summarize_file(path, content) for path, content in items]
+        assert optimizer.summarize_batch(items) == expected
+
+    def test_summarize_batch_empty(self, optimizer):
+        """Test that an empty batch returns an empty list."""
+        assert optimizer.summarize_batch([]) == []
+
+
+class TestSummarizeFilesAsync:
+    """Tests for summarize_files_async."""
+
+    def test_summarize_files_async(self, tmp_path):
+        """Test that async summarization matches summarize_file per path."""
+        optimizer = FileReadOptimizer()
+        files = {
+            "data.json": json.dumps({"key": "value" * 100}),
+            "app.log": "\n".join(f"log {i}" for i in range(500)),
+            "main.py": "print('hello')\n",
+        }
+        paths = []
+        for name, content in files.items():
+            path = tmp_path / name
+            path.write_text(content)
+            paths.append(str(path))
+
+        results = asyncio.run(optimizer.summarize_files_async(paths))
+
+        assert results == [
+            optimizer.summarize_file(path, files[Path(path).name]) for path in paths
+        ]
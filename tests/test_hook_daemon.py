@@ -0,0 +1,145 @@
+"""Tests for hook_daemon.py - Hook events over a Unix socket."""
+
+import json
+import socket
+import threading
+import time
+
+import pytest
+
+from claude_harness.hook_daemon import HookDaemon, get_socket_path
+from claude_harness.progress_tracker import ProgressTracker
+
+
+unix_only = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="Unix sockets not supported"
+)
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """Create a project with an initialized harness directory."""
+    # Daemons here use "." as the project path, like the CLI
+    monkeypatch.chdir(tmp_path)
+    harness_dir = tmp_path / ".claude-harness"
+    harness_dir.mkdir()
+    (harness_dir / "config.json").write_text("{}")
+    return tmp_path
+
+
+def _metrics(project):
+    metrics_file = project / ".claude-harness" / "context_metrics.json"
+    return json.loads(metrics_file.read_text())
+
+
+class TestHandleEvent:
+    """Tests for HookDaemon.handle_event."""
+
+    def test_track_read(self, project):
+        """Test that a read event updates context metrics."""
+        daemon = HookDaemon(str(project))
+
+        assert daemon.handle_event("track-read\tsrc/app.py\t400\n") is True
+
+        metrics = _metrics(project)
+        assert metrics["files_read"] == ["src/app.py"]
+        assert metrics["files_read_chars"] == 400
+
+    def test_track_write_and_command(self, project):
+        """Test write and command events."""
+        daemon = HookDaemon(str(project))
+
+        assert daemon.handle_event("track-write\tsrc/app.py\t120") is True
+        assert daemon.handle_event("track-command\t12") is True
+
+        metrics = _metrics(project)
+        assert metrics["files_written"] == ["src/app.py"]
+        assert metrics["commands_executed"] == 1
+
+    def test_progress_file(self, project):
+        """Test that a progress-file event records the modified file."""
+        daemon = HookDaemon(str(project))
+
+        assert daemon.handle_event("progress-file\tsrc/app.py\n") is True
+
+        progress = ProgressTracker(str(project)).get_current_progress()
+        assert "src/app.py" in progress.files_modified
+
+    def test_each_event_sees_external_changes(self, project):
+        """Test that events don't overwrite metrics changed by other processes."""
+        daemon = HookDaemon(str(project))
+        daemon.handle_event("track-command\t5")
+
+        metrics = _metrics(project)
+        metrics["commands_executed"] = 10
+        (project / ".claude-harness" / "context_metrics.json").write_text(
+            json.dumps(metrics)
+        )
+        daemon.handle_event("track-command\t5")
+
+        assert _metrics(project)["commands_executed"] == 11
+
+    @pytest.mark.parametrize(
+        "line",
+        ["", "unknown\tx", "track-read\tsrc/app.py", "track-read\tsrc/app.py\tmany"],
+    )
+    def test_invalid_events_rejected(self, project, line):
+        """Test that unknown or malformed events are ignored."""
+        assert HookDaemon(str(project)).handle_event(line) is False
+
+
+@unix_only
+class TestSocketServer:
+    """Tests for serving events over the socket."""
+
+    @pytest.fixture
+    def running(self, project):
+        """Run a daemon in a background thread."""
+        daemon = HookDaemon(".")
+        daemon.bind()
+        thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+        thread.start()
+        yield daemon
+        daemon.shutdown()
+        thread.join(timeout=5)
+
+    def _send(self, line: str):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(str(get_socket_path(".")))
+            client.sendall(line.encode())
+            client.shutdown(socket.SHUT_WR)
+            client.recv(1)
+
+    def test_events_over_socket(self, project, running):
+        """Test that events sent to the socket are handled."""
+        self._send("track-read\tsrc/app.py\t400\n")
+
+        assert _metrics(project)["files_read"] == ["src/app.py"]
+
+    def test_is_running_and_cleanup(self, project, running):
+        """Test that the socket is removed after shutdown."""
+        assert running.is_running() is True
+
+        running.shutdown()
+        for _ in range(50):
+            if not get_socket_path(".").exists():
+                break
+            time.sleep(0.05)
+
+        assert not get_socket_path(".").exists()
+
+    def test_second_daemon_refused(self, project, running):
+        """Test that a second daemon won't take over a live socket."""
+        with pytest.raises(RuntimeError, match="already running"):
+            HookDaemon(".").bind()
+
+    def test_stale_socket_replaced(self, project):
+        """Test that a leftover socket file doesn't block a new daemon."""
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(str(get_socket_path(".")))
+        stale.close()
+
+        daemon = HookDaemon(".")
+        assert daemon.is_running() is False
+        daemon.bind()
+        daemon._server.server_close()
@@ -1,14 +1,29 @@
 """Tests for initializer.py - Project initialization."""
 
+import copy
+import io
 import json
+import os
+import pickle
+import re
+import shutil
+import socket
+import subprocess
+import sys
 import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
+from rich.console import Console
+
 from claude_harness.initializer import (
     HarnessConfig,
     Initializer,
     initialize_project,
+    _dumps_json,
+    _CONFIG_KEYS,
+    _CONFIG_LAYOUT,
+    _HARNESS_HOOKS,
 )
 
 
@@ -24,6 +39,32 @@ class TestHarnessConfig:
         assert config.protected_branches == ["main", "master"]
         assert config.context_budget == 200000
 
+    def test_harness_config_list_defaults_not_shared(self):
+        """Test that list defaults are fresh copies per instance."""
+        first = HarnessConfig()
+        first.protected_branches.append("develop")
+        first.branch_prefixes.clear()
+
+        second = HarnessConfig()
+        assert second.protected_branches == ["main", "master"]
+        assert "feat/" in second.branch_prefixes
+
+    def test_harness_config_rejects_unknown_attributes(self):
+        """Test that the slotted config rejects undeclared attributes."""
+        config = HarnessConfig()
+        assert not hasattr(config, "__dict__")
+        with pytest.raises(AttributeError):
+            config.not_a_field = True
+
+    def test_harness_config_pickle_and_copy(self):
+        """Test that the slotted config survives pickling and deep copies."""
+        config = HarnessConfig(project_name="test", port=5000, protected_branches=["main"])
+
+        assert pickle.loads(pickle.dumps(config)) == config
+        clone = copy.deepcopy(config)
+        assert clone == config
+        assert clone.protected_branches is not config.protected_branches
+
     def test_harness_config_custom(self):
         """Test custom values."""
         config = HarnessConfig(
@@ -70,6 +111,61 @@ class TestHarnessConfig:
         assert data["startup"]["port"] == 5000
         assert data["startup"]["health_endpoint"] == "/health"
 
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {},
+            {"project_name": "my-project"},
+            {"project_name": 'quote"d \u00e9', "project_description": "Demo app"},
+            {"project_name": "custom", "port": 5000},
+            {"protected_branches": ["main"]},
+        ],
+    )
+    def test_harness_config_to_json_matches_full_serialization(self, kwargs):
+        """Test that the default fast path produces the same bytes."""
+        config = HarnessConfig(**kwargs)
+        assert json.loads(config.to_json()) == config.to_dict()
+        assert config.to_json() == _dumps_json(config.to_dict())
+
+    def test_harness_config_is_default(self):
+        """Test default detection ignores name and description."""
+        assert HarnessConfig(project_name="x", project_description="y").is_default()
+        assert not HarnessConfig(port=5000).is_default()
+
+    def test_harness_config_from_dict_round_trip(self):
+        """Test that from_dict restores a config written by to_dict."""
+        config = HarnessConfig(
+            project_name="test",
+            language="typescript",
+            framework="nextjs",
+            port=3000,
+            protected_branches=["main"],
+        )
+        restored = HarnessConfig.from_dict(config.to_dict())
+        assert restored.to_dict() == config.to_dict()
+
+    def test_harness_config_to_dict_matches_layout(self):
+        """Test the to_dict literal lists every layout field, in order."""
+        config = HarnessConfig()
+        for name in config.__slots__:
+            value = getattr(config, name)
+            setattr(config, name, [name] if isinstance(value, list) else name)
+
+        expected = {}
+        for key, fields in _CONFIG_LAYOUT.items():
+            if isinstance(fields, str):
+                expected[key] = getattr(config, fields)
+            else:
+                expected[key] = {_CONFIG_KEYS.get(f, f): getattr(config, f) for f in fields}
+        assert json.dumps(config.to_dict()) == json.dumps(expected)
+
+    def test_harness_config_from_dict_missing_keys(self):
+        """Test that missing keys keep their defaults."""
+        restored = HarnessConfig.from_dict({"project_name": "partial"})
+        assert restored.project_name == "partial"
+        assert restored.port == 8000
+        assert restored.language == "python"
+
 
 class TestInitializerFileGeneration:
     """Tests for Initializer file generation."""
@@ -100,6 +196,211 @@ class TestInitializerFileGeneration:
         )
         return init
 
+    def test_generate_files_records_in_task_order(self, initializer, capsys):
+        """Test that concurrent writes are recorded in a fixed order."""
+        initializer._generate_files()
+
+        paths = [path for _, path in initializer._created]
+        positions = [
+            paths.index(".claude-harness/config.json"),
+            paths.index(".claude-harness/features.json"),
+            paths.index("scripts/init.sh"),
+            paths.index("e2e/pytest.ini"),
+            paths.index(".claude/commands/README.md"),
+        ]
+        assert positions == sorted(positions)
+        # Listed once, in the summary table, rather than line by line
+        assert "Created:" not in capsys.readouterr().out
+
+    def test_summary_lists_recorded_files(self, initializer, capsys):
+        """Test that the summary renders the recorded files as a table."""
+        initializer._generate_files()
+        capsys.readouterr()
+
+        initializer._print_summary()
+
+        out = capsys.readouterr().out
+        assert "Status" in out and "Path" in out
+        assert out.index(".claude-harness/config.json") < out.index("e2e/pytest.ini")
+
+    def test_record_prints_outside_generation(self, initializer, capsys):
+        """Test that standalone writes (e.g. refresh) still report inline."""
+        initializer._record("Updated", ".gitignore")
+
+        assert "Updated: .gitignore" in capsys.readouterr().out
+        assert initializer._created == []
+
+    def test_generate_files_propagates_errors(self, initializer):
+        """Test that a failing write surfaces from _generate_files."""
+        with patch.object(
+            initializer, "_write_progress", side_effect=OSError("disk full")
+        ):
+            with pytest.raises(OSError, match="disk full"):
+                initializer._generate_files()
+
+    def test_ensure_dir_creates_once(self, initializer, temp_project):
+        """Test that writers sharing a directory only create it once."""
+        with patch.object(Path, "mkdir") as mkdir:
+            initializer._ensure_dir(initializer._claude_dir)
+            initializer._ensure_dir(temp_project / ".claude")
+
+        mkdir.assert_called_once_with(parents=True, exist_ok=True)
+
+    def test_generate_files_creates_directories_up_front(self, initializer, temp_project):
+        """Test that tasks find their directories already created."""
+        initializer.config.e2e_enabled = True
+
+        with patch.object(Path, "mkdir", autospec=True) as mkdir:
+            mkdir.side_effect = lambda path, **kwargs: os.makedirs(path, exist_ok=True)
+            initializer._generate_files()
+        created = [
+            call.args[0].relative_to(temp_project).as_posix()
+            for call in mkdir.call_args_list
+        ]
+        # The render cache directory is only made on an in-memory cache miss
+        created = [path for path in created if not path.endswith("/.cache")]
+
+        # write_commands_to_directory creates its own directory as well
+        assert sorted(created) == [
+            ".claude-harness/hooks",
+            ".claude-harness/session-history",
+            ".claude/commands",
+            ".claude/commands",
+            "e2e/tests",
+            "scripts",
+        ]
+
+    def test_write_file_creates_parents(self, initializer, temp_project):
+        """Test that _write_file creates missing directories."""
+        initializer._write_file("a/b/c.txt", "héllo\n")
+
+        assert (temp_project / "a" / "b" / "c.txt").read_bytes() == "héllo\n".encode()
+
+    @pytest.mark.skipif(not hasattr(os, "fchmod"), reason="POSIX permissions")
+    def test_write_file_executable_overwrites_mode(self, initializer, temp_project):
+        """Test that executables get their mode even when the file already exists."""
+        target = temp_project / "run.sh"
+        target.write_text("old contents that are longer")
+        target.chmod(0o600)
+
+        initializer._write_file("run.sh", b"#!/bin/sh\n", mode=0o755)
+
+        assert target.read_bytes() == b"#!/bin/sh\n"
+        assert target.stat().st_mode & 0o777 == 0o755
+
+    @pytest.mark.skipif(not hasattr(os, "fchmod"), reason="POSIX permissions")
+    def test_write_file_skips_unchanged(self, initializer, temp_project):
+        """Test that files already holding the content are not rewritten."""
+        initializer._write_hooks()
+        hooks = sorted((temp_project / ".claude-harness" / "hooks").iterdir())
+        for hook in hooks:
+            os.utime(hook, ns=(1, 1))
+
+        with patch("claude_harness.initializer.os.open", wraps=os.open) as opened:
+            initializer._write_hooks()
+
+        assert opened.call_count == 0
+        assert {hook.stat().st_mtime_ns for hook in hooks} == {1}
+
+        # A changed mode or content is still written
+        hooks[0].chmod(0o644)
+        initializer._write_file("run.sh", "a")
+        initializer._write_file("run.sh", "b")
+        initializer._write_hooks()
+        assert hooks[0].stat().st_mode & 0o777 == 0o755
+        assert (temp_project / "run.sh").read_text() == "b"
+
+    def test_reinit_reports_unchanged_files(self, temp_project):
+        """Test that a second init reports untouched files as Unchanged, not Created."""
+        config = HarnessConfig(
+            project_name="demo", e2e_enabled=True, generate_powershell=True
+        )
+        first = Initializer(str(temp_project))
+        first.config = copy.deepcopy(config)
+        first._generate_files()
+
+        second = Initializer(str(temp_project))
+        second.config = copy.deepcopy(config)
+        second._generate_files()
+        statuses = dict((path, status) for status, path in second._created)
+
+        for path in (
+            "scripts/init.sh",
+            "scripts/init.ps1",
+            ".claude-harness/hooks/send.sh",
+            ".claude/CLAUDE.md",
+            "e2e/conftest.py",
+            ".claude/commands/",
+            ".claude/commands/README.md",
+        ):
+            assert statuses[path] == "Unchanged", path
+        assert "Created" not in {statuses[p] for p in statuses if p.startswith(".claude-harness/hooks/")}
+        assert ("Created", "scripts/init.sh") in first._created
+
+    def test_tracking_hooks_use_event_sender(self, initializer, temp_project):
+        """Test that tracking hooks go through send.sh instead of the CLI."""
+        (temp_project / ".claude-harness" / "hooks").mkdir(parents=True)
+        initializer._write_hooks()
+
+        hooks_dir = temp_project / ".claude-harness" / "hooks"
+        send = hooks_dir / "send.sh"
+        assert os.access(send, os.X_OK)
+        assert "harness.sock" in send.read_text()
+        for name in ("track-read.sh", "track-write.sh", "track-edit.sh", "log-activity.sh"):
+            content = (hooks_dir / name).read_text()
+            assert ".claude-harness/hooks/send.sh" in content
+            assert "claude-harness context" not in content
+
+    def test_event_sender_queues_context_events_without_daemon(self, initializer, temp_project):
+        """Test that send.sh appends context events to the queue when no daemon runs."""
+        (temp_project / ".claude-harness" / "hooks").mkdir(parents=True)
+        initializer._write_hooks()
+
+        for event in (
+            ["track-read", "src/a.py", "12"],
+            ["track-write", "src/b c.py", "34"],
+            ["track-command", "56"],
+        ):
+            subprocess.run(
+                ["bash", ".claude-harness/hooks/send.sh", *event],
+                cwd=temp_project, check=True,
+            )
+
+        pending = temp_project / ".claude-harness" / ".pending-events"
+        assert pending.read_text() == (
+            "track-read\tsrc/a.py\t12\ntrack-write\tsrc/b c.py\t34\ntrack-command\t56\n"
+        )
+
+    def test_event_sender_sync_mode_skips_queue(self, initializer, temp_project):
+        """Test that CLAUDE_HARNESS_HOOK_SYNC=1 sends events to the CLI instead."""
+        (temp_project / ".claude-harness" / "hooks").mkdir(parents=True)
+        initializer._write_hooks()
+
+        subprocess.run(
+            ["bash", ".claude-harness/hooks/send.sh", "track-read", "src/a.py", "12"],
+            cwd=temp_project, check=True,
+            env={**os.environ, "CLAUDE_HARNESS_HOOK_SYNC": "1", "PATH": "/usr/bin:/bin"},
+        )
+
+        assert not (temp_project / ".claude-harness" / ".pending-events").exists()
+
+    @pytest.mark.skipif(not shutil.which("jq"), reason="jq not installed")
+    def test_track_read_hook_records_file_size(self, initializer, temp_project):
+        """Test that the Read hook reports the file's size in bytes."""
+        (temp_project / ".claude-harness" / "hooks").mkdir(parents=True)
+        (temp_project / ".claude-harness" / "config.json").write_text("{}")
+        initializer._write_hooks()
+        (temp_project / "notes.txt").write_text("héllo world")
+
+        subprocess.run(
+            ["bash", ".claude-harness/hooks/track-read.sh"],
+            input=json.dumps({"tool_input": {"file_path": "notes.txt"}}),
+            text=True, cwd=temp_project, check=True,
+        )
+
+        pending = temp_project / ".claude-harness" / ".pending-events"
+        assert pending.read_text() == "track-read\tnotes.txt\t12\n"
+
     def test_write_config(self, initializer, temp_project):
         """Test config.json generation."""
         harness_dir = temp_project / ".claude-harness"
@@ -200,6 +501,45 @@ class TestInitializerFileGeneration:
         session_stop = hooks_dir / "session-stop.sh"
         assert session_stop.exists()
 
+    def test_session_stop_runs_summary_in_parallel(self, initializer, temp_project):
+        """Test session-stop.sh overlaps the summary and handoff, printing in order."""
+        initializer._write_hooks()
+        (temp_project / ".claude-harness" / "config.json").write_text("{}")
+        bin_dir = temp_project / "bin"
+        bin_dir.mkdir()
+        # Each summary command waits until all three have started
+        fake = bin_dir / "claude-harness"
+        fake.write_text(
+            "#!/bin/bash\n"
+            'case "$*" in\n'
+            '    "context show"|"progress show"|"context handoff --save")\n'
+            '        touch "started.$1.$2"\n'
+            "        for _ in $(seq 50); do\n"
+            "            [ $(ls started.* | wc -l) -eq 3 ] && break\n"
+            "            sleep 0.1\n"
+            "        done\n"
+            '        ls started.* | wc -l | tr -d " " ;;\n'
+            "esac\n"
+            'echo "$*" >> calls.log\n'
+        )
+        fake.chmod(0o755)
+
+        result = subprocess.run(
+            ["bash", ".claude-harness/hooks/session-stop.sh"], capture_output=True,
+            text=True, cwd=temp_project, timeout=30,
+            env={**os.environ, "PATH": f"{bin_dir}:{os.environ['PATH']}"},
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.split("\n") == [
+            "", "=== Session Summary ===", "3", "---", "3", "=======================",
+            "", "Saving session handoff...", "3", "",
+        ]
+        calls = (temp_project / "calls.log").read_text().splitlines()
+        assert calls[0] == "context flush"
+        assert calls[-1] == "context session-close"
+        assert not list((temp_project / ".claude-harness" / ".cache").glob("stop-*"))
+
     def test_write_e2e_setup(self, initializer, temp_project):
         """Test E2E setup generation."""
         # Create required directories first (normally done by _generate_files)
@@ -255,6 +595,24 @@ class TestInitializerClaudeSettings:
         assert "PostToolUse" in data["hooks"]
         assert "SessionEnd" in data["hooks"]
 
+    @pytest.mark.parametrize("language", ["python", "javascript", "go"])
+    def test_write_claude_settings_new_matches_json_dump(
+        self, initializer, temp_project, language
+    ):
+        """Test the spliced new-file output is what json.dump would write."""
+        initializer.config.language = language
+        initializer._write_claude_settings()
+
+        expected = json.dumps(
+            {
+                "hooks": _HARNESS_HOOKS,
+                "permissions": {"allow": initializer._get_default_permissions()},
+            },
+            indent=2,
+        )
+        settings_file = temp_project / ".claude" / "settings.local.json"
+        assert settings_file.read_text() == expected
+
     def test_write_claude_settings_merge(self, initializer, temp_project):
         """Test merging with existing .claude/settings.local.json."""
         claude_dir = temp_project / ".claude"
@@ -272,13 +630,38 @@ class TestInitializerClaudeSettings:
 
         initializer._write_claude_settings()
 
-        data = json.loads((claude_dir / "settings.local.json").read_text())
+        raw = (claude_dir / "settings.local.json").read_bytes()
+        data = json.loads(raw)
+        assert raw == _dumps_json(data)
 
         # Should preserve existing
         assert data["custom_setting"] == "value"
         # Should have merged hooks
         assert len(data["hooks"]["PreToolUse"]) >= 2
 
+    def test_write_claude_settings_merge_is_idempotent(
+        self, initializer, temp_project
+    ):
+        """Test that re-running the merge adds no duplicate hooks or permissions."""
+        initializer._write_claude_settings()
+        settings_file = temp_project / ".claude" / "settings.local.json"
+        first = json.loads(settings_file.read_text())
+
+        # Reorder keys inside an existing hook; it must still be recognized
+        hook = first["hooks"]["PreToolUse"][0]
+        first["hooks"]["PreToolUse"][0] = dict(reversed(list(hook.items())))
+        settings_file.write_text(json.dumps(first))
+
+        initializer._write_claude_settings()
+        second = json.loads(settings_file.read_text())
+
+        assert len(second["hooks"]["PreToolUse"]) == 1
+        assert len(second["hooks"]["PostToolUse"]) == len(
+            first["hooks"]["PostToolUse"]
+        )
+        allowed = second["permissions"]["allow"]
+        assert len(allowed) == len(set(allowed))
+
     def test_default_permissions_python(self, temp_project):
         """Test default permissions generated for Python projects."""
         init = Initializer(str(temp_project))
@@ -323,6 +706,19 @@ class TestInitializerClaudeSettings:
         assert "Bash(python:*)" not in permissions
         assert "Bash(pytest:*)" not in permissions
 
+    def test_default_permissions_go_docker(self, temp_project):
+        """Test language and docker permissions compose in order, as a fresh list."""
+        init = Initializer(str(temp_project))
+        init.config = HarnessConfig(language="go", framework="Docker Compose")
+
+        permissions = init._get_default_permissions()
+
+        assert permissions[-4:] == [
+            "Bash(go:*)", "Bash(docker:*)", "Bash(docker-compose:*)", "Skill(write-unit-tests)",
+        ]
+        permissions.clear()
+        assert "Bash(go:*)" in init._get_default_permissions()
+
     def test_permissions_in_settings_file(self, initializer, temp_project):
         """Test that permissions are written to settings.local.json."""
         initializer._write_claude_settings()
@@ -354,6 +750,53 @@ class TestInitializerDetection:
         assert init.detected is not None
         assert init.detected.language == "python"
 
+    def test_detect_empty_project_skips_detector(self, tmp_path):
+        """Test that an empty directory short-circuits stack detection."""
+        init = Initializer(str(tmp_path))
+
+        with patch("claude_harness.initializer.StackDetector") as mock_detector:
+            init._detect_existing_stack()
+
+        mock_detector.assert_not_called()
+        assert init.detected is not None
+        assert init.detected.language is None
+        assert init.is_existing_project is False
+
+    def test_ask_or_confirm_accept_all_skips_prompt(self, tmp_path):
+        """Test that accept-all uses the detected value without prompting."""
+        init = Initializer(str(tmp_path))
+        init._accept_all_detected = True
+        ask_method = MagicMock()
+
+        with patch("claude_harness.initializer.questionary") as mock_q:
+            init._ask_or_confirm("framework", "flask", ask_method)
+
+        mock_q.confirm.assert_not_called()
+        ask_method.assert_not_called()
+        assert init.config.framework == "flask"
+
+    def test_ask_or_confirm_declined_asks(self, tmp_path):
+        """Test that declining a detected value falls back to asking."""
+        init = Initializer(str(tmp_path))
+        ask_method = MagicMock()
+
+        with patch("claude_harness.initializer.questionary") as mock_q:
+            mock_q.confirm.return_value.ask.return_value = False
+            init._ask_or_confirm("database", "sqlite", ask_method)
+
+        ask_method.assert_called_once()
+
+    def test_ask_or_confirm_not_detected_asks(self, tmp_path):
+        """Test that a missing detected value asks without confirming."""
+        init = Initializer(str(tmp_path))
+        ask_method = MagicMock()
+
+        with patch("claude_harness.initializer.questionary") as mock_q:
+            init._ask_or_confirm("language", None, ask_method)
+
+        mock_q.confirm.assert_not_called()
+        ask_method.assert_called_once()
+
     def test_default_port_python(self, python_project):
         """Test default port for Python projects."""
         init = Initializer(str(python_project))
@@ -372,6 +815,103 @@ class TestInitializerDetection:
         port = init._get_default_port()
         assert port == 3000  # Express default
 
+    @pytest.mark.parametrize(
+        "language, framework, expected",
+        [
+            ("python", "flask", "python run.py"),
+            ("python", "django", "python manage.py runserver"),
+            ("python", "fastapi", "uvicorn main:app --reload"),
+            ("python", "bottle", "python main.py"),
+            ("python", None, "python main.py"),
+            ("typescript", "nextjs", "npm run dev"),
+            ("javascript", None, "npm run dev"),
+            ("go", None, "./run.sh"),
+        ],
+    )
+    def test_default_start_command(self, tmp_path, language, framework, expected):
+        """Test default start commands per language and framework."""
+        init = Initializer(str(tmp_path))
+        init.config = HarnessConfig(language=language, framework=framework)
+
+        assert init._get_default_start_command() == expected
+
+    @patch("claude_harness.initializer.questionary")
+    def test_ask_choices_map_names_to_values(self, mock_questionary, tmp_path):
+        """Test that selected display names map back to choice values."""
+        init = Initializer(str(tmp_path))
+
+        mock_questionary.select.return_value.ask.return_value = "TypeScript"
+        init._ask_language()
+        assert init.config.language == "typescript"
+
+        mock_questionary.select.return_value.ask.return_value = "NestJS"
+        init._ask_framework()
+        assert init.config.framework == "nestjs"
+
+        mock_questionary.select.return_value.ask.return_value = "None"
+        init.config.database = "sqlite"
+        init._ask_database()
+        assert init.config.database is None
+
+    @patch("claude_harness.initializer.questionary")
+    def test_ask_choices_offer_names_in_order(self, mock_questionary, tmp_path):
+        """Test that select prompts list the display names in choice order."""
+        init = Initializer(str(tmp_path))
+        init.config.language = "python"
+
+        init._ask_language()
+        init._ask_framework()
+        offered = [call.kwargs["choices"] for call in mock_questionary.select.call_args_list]
+
+        assert offered == [
+            [c["name"] for c in init.LANGUAGE_CHOICES],
+            [c["name"] for c in init.FRAMEWORK_CHOICES["python"]],
+        ]
+
+
+    @patch("claude_harness.initializer.questionary")
+    def test_ask_paths_uses_one_form(self, mock_questionary, tmp_path):
+        """Test that path prompts are grouped into a form keyed by field."""
+        init = Initializer(str(tmp_path))
+        init.config.language = "go"
+        mock_questionary.form.return_value.unsafe_ask.return_value = {
+            "source_directory": "src",
+            "env_file": ".env.local",
+            "test_directory": "spec",
+        }
+
+        init._ask_paths()
+
+        mock_questionary.text.return_value.ask.assert_not_called()
+        fields = mock_questionary.form.call_args.kwargs
+        assert list(fields) == ["source_directory", "env_file", "test_directory"]
+        assert init.config.source_directory == "src"
+        assert init.config.env_file == ".env.local"
+        assert init.config.test_directory == "spec"
+
+    @patch("claude_harness.initializer.questionary")
+    def test_ask_startup_and_git_forms(self, mock_questionary, tmp_path):
+        """Test that startup and git answers are converted from the form."""
+        init = Initializer(str(tmp_path))
+        form = mock_questionary.form.return_value.unsafe_ask
+
+        form.return_value = {
+            "port": "5001",
+            "health_endpoint": "/ping",
+            "start_command": "make run",
+        }
+        init._ask_startup()
+        assert init.config.port == 5001
+        assert init.config.e2e_base_url == "http://localhost:5001"
+
+        form.return_value = {
+            "protected_branches": "main, release",
+            "require_merge_confirmation": False,
+        }
+        init._ask_git()
+        assert init.config.protected_branches == ["main", "release"]
+        assert init.config.require_merge_confirmation is False
+
 
 class TestInitializerIntegration:
     """Integration tests for full initialization."""
@@ -402,6 +942,7 @@ class TestInitializerIntegration:
             e2e_base_url="http://localhost:5000",
             initial_phase="Phase 1",
             create_claude_hooks=False,
+            generate_powershell=True,
         )
 
         # Run file generation
@@ -424,6 +965,56 @@ class TestInitializerIntegration:
         assert e2e_dir.exists()
 
 
+    def test_powershell_skipped_unless_requested(self, temp_project):
+        """Test init.ps1 is only generated when enabled or already present."""
+        init = Initializer(str(temp_project))
+        init.config = HarnessConfig(
+            project_name="test-project", e2e_enabled=False, generate_powershell=False
+        )
+        init._generate_files()
+
+        assert (temp_project / "scripts" / "init.sh").exists()
+        assert not (temp_project / "scripts" / "init.ps1").exists()
+        assert "scripts/init.ps1" not in [path for _, path in init._created]
+
+        (temp_project / "scripts" / "init.ps1").write_text("old")
+        init = Initializer(str(temp_project))
+        init.config = HarnessConfig(
+            project_name="test-project", e2e_enabled=False, generate_powershell=False
+        )
+        init._generate_files()
+
+        assert (temp_project / "scripts" / "init.ps1").read_text() != "old"
+
+    def test_generate_powershell_not_persisted(self):
+        """Test the host-dependent PowerShell flag stays out of config.json."""
+        config = HarnessConfig(generate_powershell=True)
+
+        assert b"generate_powershell" not in config.to_json()
+        assert config.is_default()
+
+
+class TestImportCost:
+    """Tests that importing the initializer stays lightweight."""
+
+    def test_import_skips_optional_modules(self):
+        """Test that heavy and unrelated modules load only when used."""
+        code = (
+            "import sys, claude_harness.initializer\n"
+            "heavy = ('rich', 'questionary', 'jinja2', 'claude_harness.lazy_loader',"
+            " 'claude_harness.exploration_cache', 'claude_harness.output_compressor')\n"
+            "print([m for m in heavy if m in sys.modules])\n"
+            "from claude_harness import LazyContextLoader\n"
+            "print(LazyContextLoader.__module__)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.splitlines() == ["[]", "claude_harness.lazy_loader"]
+
+
 class TestInitializeProjectFunction:
     """Tests for initialize_project convenience function."""
 
@@ -920,6 +1511,224 @@ class TestDocumentationConfig:
         assert "DOCUMENTATION (MANDATORY)" not in section
 
 
+@pytest.mark.skipif(
+    not (shutil.which("bash") and shutil.which("jq") and shutil.which("git")),
+    reason="requires bash, jq and git",
+)
+class TestGitSafetyHook:
+    """Tests for the check-git-safety.sh PreToolUse hook."""
+
+    @pytest.fixture
+    def run_hook(self, tmp_path):
+        """Write the hook into a git repo and return a runner for it."""
+        subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+        init = Initializer(str(tmp_path))
+        init.config = HarnessConfig(protected_branches=["main", "release/1.0"])
+        init._write_hooks()
+        hook = tmp_path / ".claude-harness" / "hooks" / "check-git-safety.sh"
+
+        def run(command, branch="main"):
+            subprocess.run(
+                ["git", "symbolic-ref", "HEAD", f"refs/heads/{branch}"],
+                cwd=tmp_path,
+                check=True,
+            )
+            payload = json.dumps({"tool_input": {"command": command}})
+            return subprocess.run(
+                ["bash", str(hook)],
+                input=payload,
+                capture_output=True,
+                text=True,
+                cwd=tmp_path,
+            )
+
+        return run
+
+    def test_commit_on_protected_branch_blocked(self, run_hook):
+        """Test that commits are blocked on protected branches only."""
+        assert run_hook("git commit -m x").returncode == 2
+        assert run_hook("cd src\ngit commit -m x").returncode == 2
+        assert run_hook("git commit -m x", branch="feat/x").returncode == 0
+
+    def test_force_push_blocked(self, run_hook):
+        """Test that force pushes to protected branches are blocked anywhere."""
+        result = run_hook("git push --force origin release/1.0", branch="feat/x")
+        assert result.returncode == 2
+        assert "release/1.0" in result.stderr
+        # Branch names are matched literally
+        assert run_hook("git push -f origin release/1x0").returncode == 0
+        assert run_hook("git push origin main").returncode == 0
+
+    def test_rebase_on_protected_branch_blocked(self, run_hook):
+        """Test that rebasing the current protected branch is blocked."""
+        assert run_hook("git rebase origin/main").returncode == 2
+        assert run_hook("git rebase origin/main", branch="feat/x").returncode == 0
+        assert run_hook("ls -la").returncode == 0
+
+    def test_branch_read_from_worktree_head(self, tmp_path):
+        """Test the branch is read through a worktree's .git file, and via git in subdirectories."""
+        repo = tmp_path / "repo"
+        git = ["git", "-c", "user.name=t", "-c", "user.email=t@example.com"]
+        subprocess.run(["git", "init", "-q", "-b", "feat/x", str(repo)], check=True)
+        subprocess.run(git + ["commit", "-q", "--allow-empty", "-m", "init"], cwd=repo, check=True)
+        worktree = tmp_path / "wt"
+        subprocess.run(["git", "worktree", "add", "-q", "-b", "main", str(worktree)], cwd=repo, check=True)
+        subdir = repo / "app"
+        subdir.mkdir()
+        subprocess.run(["git", "checkout", "-q", "-b", "release/1.0"], cwd=repo, check=True)
+
+        for project, blocked in ((worktree, True), (subdir, True)):
+            init = Initializer(str(project))
+            init.config = HarnessConfig(protected_branches=["main", "release/1.0"])
+            init._write_hooks()
+            result = subprocess.run(
+                ["bash", ".claude-harness/hooks/check-git-safety.sh"],
+                input=json.dumps({"tool_input": {"command": "git commit -m x"}}),
+                capture_output=True, text=True, cwd=project,
+            )
+            assert (result.returncode == 2) is blocked, project
+
+        subprocess.run(["git", "checkout", "-q", "--detach"], cwd=worktree, check=True)
+        result = subprocess.run(
+            ["bash", ".claude-harness/hooks/check-git-safety.sh"],
+            input=json.dumps({"tool_input": {"command": "git commit -m x"}}),
+            capture_output=True, text=True, cwd=worktree,
+        )
+        assert result.returncode == 0
+
+
+@pytest.mark.skipif(
+    not (shutil.which("bash") and shutil.which("jq")), reason="requires bash and jq"
+)
+class TestActivityLogHook:
+    """Tests for the log-activity.sh PostToolUse hook."""
+
+    def _run(self, project, command):
+        hook = project / ".claude-harness" / "hooks" / "log-activity.sh"
+        payload = json.dumps({"tool_input": {"command": command}})
+        return subprocess.run(
+            ["bash", str(hook)], input=payload, capture_output=True, text=True,
+            cwd=project,
+        )
+
+    def _log_lines(self, project):
+        history = project / ".claude-harness" / "session-history"
+        return [
+            line
+            for log in history.glob("activity-*.log")
+            for line in log.read_text().splitlines()
+        ]
+
+    @pytest.fixture
+    def project(self, tmp_path):
+        """Write the hooks and config into a project."""
+        init = Initializer(str(tmp_path))
+        init.config = HarnessConfig()
+        (tmp_path / ".claude-harness" / "session-history").mkdir(parents=True)
+        (tmp_path / ".claude-harness" / "config.json").write_text("{}")
+        init._write_hooks()
+        return tmp_path
+
+    def test_appends_to_daily_log(self, project):
+        """Test that commands are appended to the day's activity log."""
+        self._run(project, "ls -la")
+        self._run(project, "x" * 300)
+
+        lines = self._log_lines(project)
+        assert len(lines) == 2
+        assert lines[0].endswith("] Bash: ls -la")
+        assert lines[1].endswith("Bash: " + "x" * 200)
+
+    def test_recreates_missing_log_dir(self, project):
+        """Test that a deleted session-history directory is recreated."""
+        shutil.rmtree(project / ".claude-harness" / "session-history")
+
+        self._run(project, "ls")
+
+        assert len(self._log_lines(project)) == 1
+
+
+@pytest.mark.skipif(
+    not (shutil.which("bash") and shutil.which("jq")), reason="requires bash and jq"
+)
+class TestTrackHooks:
+    """Tests for the track-write.sh and track-edit.sh PostToolUse hooks."""
+
+    @pytest.fixture
+    def run_hook(self, tmp_path):
+        """Write the hooks with send.sh swapped for a recorder."""
+        init = Initializer(str(tmp_path))
+        init.config = HarnessConfig()
+        (tmp_path / ".claude-harness").mkdir()
+        (tmp_path / ".claude-harness" / "config.json").write_text("{}")
+        init._write_hooks()
+        hooks = tmp_path / ".claude-harness" / "hooks"
+        (hooks / "send.sh").write_text(
+            "#!/bin/bash\n(IFS='|'; printf '%s\\n' \"$*\") >> sent.log\n"
+        )
+
+        def run(name, tool_input):
+            subprocess.run(
+                ["bash", str(hooks / name)], input=json.dumps({"tool_input": tool_input}),
+                capture_output=True, text=True, cwd=tmp_path, check=True,
+            )
+            sent = tmp_path / "sent.log"
+            lines = sent.read_text().splitlines() if sent.exists() else []
+            sent.unlink(missing_ok=True)
+            return lines
+
+        return run
+
+    def test_write_hook_sends_path_and_length(self, run_hook):
+        """Test track-write.sh extracts the path and content length in one pass."""
+        assert run_hook("track-write.sh", {"file_path": "src/a b.py", "content": "x = 1\n"}) == [
+            "progress-file|src/a b.py",
+            "track-write|src/a b.py|6",
+        ]
+        assert run_hook("track-write.sh", {"file_path": "src/a.py", "content": ""}) == [
+            "progress-file|src/a.py",
+        ]
+        assert run_hook("track-write.sh", {"content": "x"}) == []
+
+    def test_edit_hook_sums_old_and_new(self, run_hook):
+        """Test track-edit.sh sends old_string + new_string as the edit size."""
+        lines = run_hook(
+            "track-edit.sh",
+            {"file_path": "app.py", "old_string": "abc", "new_string": "abcdef"},
+        )
+
+        assert lines == ["progress-file|app.py", "track-write|app.py|9"]
+
+    def test_hooks_run_jq_once(self, tmp_path):
+        """Test each tracking hook starts jq once and reads stdin directly."""
+        init = Initializer(str(tmp_path))
+        init.config = HarnessConfig()
+        init._write_hooks()
+        hooks = tmp_path / ".claude-harness" / "hooks"
+
+        for name in ("check-git-safety.sh", "track-read.sh", "track-write.sh",
+                     "track-edit.sh", "log-activity.sh"):
+            script = (hooks / name).read_text()
+            assert script.count("jq -r") == 1, name
+            assert "INPUT_JSON" not in script, name
+
+
+    def test_hooks_contain_no_control_characters(self, tmp_path):
+        """Test the hooks spell the \\x1f separator out instead of embedding it."""
+        init = Initializer(str(tmp_path))
+        init.config = HarnessConfig()
+        init._write_hooks()
+
+        for hook in (tmp_path / ".claude-harness" / "hooks").iterdir():
+            script = hook.read_text()
+            assert not re.search(r"[\x00-\x08\x0b-\x1f]", script), hook.name
+        for name in ("track-write.sh", "track-edit.sh"):
+            script = (tmp_path / ".claude-harness" / "hooks" / name).read_text()
+            assert "IFS=$'\\x1f' read -r" in script
+            assert 'join("\\u001f")' in script
+            assert "< <(jq -r \\\n" in script
+
+
 class TestCheckSubtasksHook:
     """Tests for the check-subtasks.sh session end hook."""
 
@@ -991,3 +1800,901 @@ class TestCheckSubtasksHook:
         check_idx = hook_commands.index(".claude-harness/hooks/check-subtasks.sh")
         stop_idx = hook_commands.index(".claude-harness/hooks/session-stop.sh")
         assert check_idx < stop_idx, "check-subtasks should run before session-stop"
+
+
+class TestBufferedOutput:
+    """Tests for section-at-a-time console output."""
+
+    class CountingIO(io.StringIO):
+        """StringIO that counts non-empty write calls."""
+
+        writes = 0
+
+        def write(self, text):
+            if text:
+                self.writes += 1
+            return super().write(text)
+
+    def test_summary_written_once(self, tmp_path):
+        """Test that the summary section reaches the terminal in one write."""
+        init = Initializer(str(tmp_path))
+        buffer = self.CountingIO()
+
+        with patch(
+            "claude_harness.initializer._get_console",
+            return_value=Console(file=buffer, width=100),
+        ):
+            init._print_summary()
+
+        assert buffer.writes == 1
+        assert "Initialized Successfully" in buffer.getvalue()
+        assert "Next Steps" in buffer.getvalue()
+
+
+    def test_apply_defaults_written_once(self, tmp_path):
+        """Test that the non-interactive config summary is one write."""
+        init = Initializer(str(tmp_path), non_interactive=True)
+        buffer = self.CountingIO()
+
+        with patch(
+            "claude_harness.initializer._get_console",
+            return_value=Console(file=buffer, width=100),
+        ):
+            init._apply_defaults()
+
+        assert buffer.writes == 1
+        output = buffer.getvalue()
+        assert f"  Project: {tmp_path.name}\n" in output
+        assert "  Test Framework: pytest\n\n" in output
+
+class TestCachedRender:
+    """Tests for memoized script rendering."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Isolate the shared render cache."""
+        Initializer._render_cache.clear()
+        yield
+        Initializer._render_cache.clear()
+
+    def test_generate_files_serializes_config_once(self, tmp_path):
+        """Test that config.json and the render cache share one serialization."""
+        init = Initializer(str(tmp_path))
+        init.config = HarnessConfig(
+            project_name="demo", e2e_enabled=False, generate_powershell=True
+        )
+
+        with patch.object(
+            HarnessConfig, "to_json", autospec=True, side_effect=HarnessConfig.to_json
+        ) as to_json:
+            init._generate_files()
+
+        assert to_json.call_count == 1
+        assert init._config_snapshot is None
+        config_path = tmp_path / ".claude-harness" / "config.json"
+        assert config_path.read_bytes() == init.config.to_json()
+
+    def test_identical_config_reuses_render(self, tmp_path):
+        """Test that a second initializer with the same config skips the builder."""
+        build = MagicMock(return_value="script")
+        for name in ("a", "b"):
+            init = Initializer(str(tmp_path / name))
+            init.config = HarnessConfig(project_name="same", port=5000)
+            assert init._cached_render("init.ps1", build) == "script"
+
+        build.assert_called_once()
+
+    def test_changed_config_rebuilds(self, tmp_path):
+        """Test that a config change invalidates the cached render."""
+        init = Initializer(str(tmp_path))
+        first = init._cached_render("init.ps1", init._build_init_powershell)
+
+        init.config.port = 9999
+        second = init._cached_render("init.ps1", init._build_init_powershell)
+
+        assert first != second
+        assert "$port = 9999" in second
+
+    def test_disk_cache_survives_new_process(self, tmp_path):
+        """Test that a later run reads the render from .claude-harness/.cache."""
+        init = Initializer(str(tmp_path))
+        init.config = HarnessConfig(project_name="disk")
+        init._cached_render("init.sh", MagicMock(return_value="rendered\n"))
+
+        # A fresh process starts with an empty in-memory cache
+        Initializer._render_cache.clear()
+        build = MagicMock(return_value="other")
+        again = Initializer(str(tmp_path))
+        again.config = HarnessConfig(project_name="disk")
+
+        assert again._cached_render("init.sh", build) == "rendered\n"
+        build.assert_not_called()
+
+    def test_disk_cache_keeps_latest_entry(self, tmp_path):
+        """Test that a config change replaces the cached file for that script."""
+        init = Initializer(str(tmp_path))
+        init._cached_render("init.sh", lambda: "first")
+        init._cached_render("init.ps1", lambda: "ps")
+        init.config.port = 9999
+        init._cached_render("init.sh", lambda: "second")
+
+        cache_dir = tmp_path / ".claude-harness" / ".cache"
+        entries = sorted(p.suffix for p in cache_dir.iterdir())
+        assert entries == [".ps1", ".sh"]
+        assert next(cache_dir.glob("init-*.sh")).read_text() == "second"
+
+    def test_harness_section_cached_in_memory_only(self, tmp_path):
+        """Test that CLAUDE.md reuses its section per config without a disk entry."""
+        for name in ("a", "b"):
+            init = Initializer(str(tmp_path / name))
+            init.config = HarnessConfig(project_name="same")
+            with patch.object(
+                Initializer,
+                "_build_harness_section",
+                autospec=True,
+                side_effect=Initializer._build_harness_section,
+            ) as build:
+                init._update_claude_md()
+            assert build.call_count == (1 if name == "a" else 0)
+
+        content = (tmp_path / "b" / ".claude" / "CLAUDE.md").read_text()
+        assert "# CLAUDE HARNESS INTEGRATION" in content
+        assert not (tmp_path / "a" / ".claude-harness" / ".cache").exists()
+
+    def test_template_change_invalidates_disk_cache(self, tmp_path, monkeypatch):
+        """Test that a newer template is rendered instead of read from disk."""
+        from claude_harness import initializer
+
+        init = Initializer(str(tmp_path))
+        init._cached_render("init.sh", lambda: "old template")
+        Initializer._render_cache.clear()
+        monkeypatch.setattr(initializer, "_template_stamp", lambda name: "upgraded")
+
+        assert init._cached_render("init.sh", lambda: "new template") == "new template"
+
+
+class TestCompiledTemplates:
+    """Tests for ahead-of-time template compilation."""
+
+    def test_environment_built_once_across_threads(self, tmp_path, monkeypatch):
+        """Test that concurrent first uses share one Jinja2 environment."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        monkeypatch.setattr(Initializer, "_jinja_env", None)
+        instances = [Initializer(str(tmp_path)) for _ in range(8)]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            envs = list(executor.map(lambda init: init.jinja_env, instances))
+
+        assert all(env is envs[0] for env in envs)
+        assert Initializer(str(tmp_path))._env() is envs[0]
+
+    def test_compiled_templates_reused_across_instances(self, tmp_path):
+        """Test that templates are parsed once, not per Initializer."""
+        first = Initializer(str(tmp_path))._env().get_template("init.sh.j2")
+        second = Initializer(str(tmp_path))._env().get_template("init.sh.j2")
+
+        assert second is first
+
+    def test_compile_templates_writes_zip(self, tmp_path):
+        """Test that compile_templates writes a zip archive."""
+        import zipfile
+
+        from claude_harness.initializer import compile_templates
+
+        target = compile_templates(tmp_path / "compiled.zip")
+
+        assert target.exists()
+        assert zipfile.is_zipfile(target)
+
+    def test_env_compiles_zip_once_and_renders_identically(self, tmp_path, monkeypatch):
+        """Test that _env() compiles into the user cache and matches source renders."""
+        from jinja2 import ChoiceLoader
+
+        from claude_harness import initializer
+
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        init = Initializer(str(tmp_path))
+        init.config = HarnessConfig(project_name="demo", database="postgresql")
+
+        monkeypatch.setattr(initializer, "_ensure_compiled_templates", lambda: None)
+        monkeypatch.setattr(Initializer, "_jinja_env", None)
+        from_source = (init._build_init_script(), init._build_init_powershell())
+
+        monkeypatch.undo()
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        monkeypatch.setattr(Initializer, "_jinja_env", None)
+        from_zip = (init._build_init_script(), init._build_init_powershell())
+
+        assert isinstance(Initializer._env().loader, ChoiceLoader)
+        assert [p.name for p in (tmp_path / "cache" / "claude-harness").iterdir()] == [
+            initializer._compiled_templates_path().name
+        ]
+        assert from_zip == from_source
+
+    def test_zip_keyed_on_template_content(self, tmp_path, monkeypatch):
+        """Test that changed template content selects a new zip, whatever the mtimes."""
+        from types import MappingProxyType
+
+        from claude_harness import initializer
+
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        current = initializer._compiled_templates_path()
+        monkeypatch.setattr(
+            initializer,
+            "_template_digests",
+            lambda: MappingProxyType({"init.sh.j2": "edited"}),
+        )
+
+        assert initializer._compiled_templates_path() != current
+        assert initializer._compiled_templates_path().parent == current.parent
+
+    def test_unwritable_cache_falls_back_to_source(self, tmp_path, monkeypatch):
+        """Test that templates load from source when the zip cannot be written."""
+        from claude_harness import initializer
+
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        monkeypatch.setenv("XDG_CACHE_HOME", str(blocker))
+
+        assert initializer._ensure_compiled_templates() is None
+
+
+class TestInitScript:
+    """Tests for the rendered init.sh, including checks shared with init.ps1."""
+
+    def test_deep_db_probe_skips_app_import(self, tmp_path):
+        """Test the --deep database check connects with DATABASE_URL directly."""
+        init = Initializer(str(tmp_path))
+        init.config = HarnessConfig(database="postgresql")
+
+        for script in (init._build_init_script(), init._build_init_powershell()):
+            assert "from app import" not in script
+            assert "psycopg.connect(conninfo, connect_timeout=2)" in script
+            assert "sqlalchemy.create_engine(url).connect().close()" in script
+
+    def test_init_script_skips_dirty_check_on_huge_repo(self, tmp_path):
+        """Test the index-header file count gates the dirty check."""
+        init = Initializer(str(tmp_path))
+        init.config = HarnessConfig(git_huge_repo_threshold=2)
+        script = init._build_init_script()
+        start = script.index("check_git() {")
+        check_git = script[start:script.index("\n}\n", start) + 3]
+
+        subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+        for name in ("a", "b", "c"):
+            (tmp_path / name).write_text(name)
+        subprocess.run(["git", "add", "-A"], cwd=tmp_path, check=True)
+
+        def run_check(**env):
+            result = subprocess.run(
+                ["bash", "-c", f'set -eo pipefail\nHAVE_GIT=1\n{check_git}check_git'],
+                capture_output=True, text=True, cwd=tmp_path,
+                env={**os.environ, **env},
+            )
+            assert result.returncode == 0, result.stderr
+            return result.stdout
+
+        output = run_check()
+        assert "Huge repo (3 files) - skipping status" in output
+        assert "Uncommitted" not in output
+
+        output = run_check(CLAUDE_HARNESS_GIT_HUGE_THRESHOLD="0")
+        assert "Huge repo" not in output
+        assert "Uncommitted changes detected" in output
+
+    def test_init_scripts_avoid_full_git_status(self, tmp_path):
+        """Test both init scripts use early-exit dirty probes."""
+        init = Initializer(str(tmp_path))
+
+        for script in (init._build_init_script(), init._build_init_powershell()):
+            assert "git status --porcelain" not in script
+            assert "git --no-optional-locks diff --quiet HEAD --" in script
+            assert "ls-files --others --exclude-standard" in script
+
+    def test_init_script_probes_database_port(self, tmp_path):
+        """Test init.sh checks the database port before any Python probe."""
+        init = Initializer(str(tmp_path))
+
+        script = init._build_init_script()
+
+        assert "postgresql) DB_PORT=5432 ;;" in script
+        assert script.index("port_open") < script.index("python3 -c")
+        assert 'DEEP_DB="${CLAUDE_HARNESS_DEEP_DB:-}"' in script
+
+    def test_database_port_uses_detected_name(self, tmp_path):
+        """Test both scripts find the port for a detector-cased database name."""
+        from claude_harness.detector import detect_stack
+
+        (tmp_path / "requirements.txt").write_text("flask\npsycopg2\n")
+        (tmp_path / ".env").write_text("DATABASE_URL=postgresql://app@db/app\n")
+        init = Initializer(str(tmp_path))
+        init.detected = detect_stack(str(tmp_path))
+        init._apply_defaults()
+        assert init.config.database == "PostgreSQL"
+
+        assert "$dbPort = 5432\n" in init._build_init_powershell()
+
+        script = init._build_init_script()
+        functions = script[script.index("port_open() {"):]
+        functions = functions[:functions.index("\n}\n", functions.index("check_database() {")) + 3]
+        result = subprocess.run(
+            [
+                "bash", "-c",
+                f"DATABASE={init.config.database}\nENV_FILE=\n{functions}check_database",
+            ],
+            capture_output=True,
+            text=True,
+            env={k: v for k, v in os.environ.items() if k != "DATABASE_URL"},
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert "file-based" not in result.stdout
+        assert "PostgreSQL" in result.stdout and "localhost:5432" in result.stdout
+
+    def test_database_without_port_not_called_file_based(self, tmp_path):
+        """Test only SQLite is reported as file-based; other unknowns ask for a URL."""
+        init = Initializer(str(tmp_path))
+        script = init._build_init_script()
+        functions = script[script.index("port_open() {"):]
+        functions = functions[:functions.index("\n}\n", functions.index("check_database() {")) + 3]
+
+        def check(database):
+            result = subprocess.run(
+                ["bash", "-c", f"DATABASE={database}\nENV_FILE=\n{functions}check_database"],
+                capture_output=True,
+                text=True,
+                env={k: v for k, v in os.environ.items() if k != "DATABASE_URL"},
+            )
+            assert result.returncode == 0, result.stderr
+            return result.stdout
+
+        assert "SQLite is file-based" in check("SQLite")
+        for database in ("Prisma", "TypeORM"):
+            output = check(database)
+            assert "file-based" not in output
+            assert f"{database} port unknown - set DATABASE_URL" in output
+
+        for database, message in (
+            ("SQLite", '"  SQLite is file-based (no server to check)" "Green"'),
+            ("Prisma", '"  Prisma port unknown - set DATABASE_URL" "Yellow"'),
+        ):
+            init.config = HarnessConfig(database=database)
+            script = init._build_init_powershell()
+            assert message in script
+            assert "file-based" not in script or database == "SQLite"
+
+    def test_init_script_app_check_uses_dev_tcp(self, tmp_path):
+        """Test init.sh probes the app port in-shell before any curl."""
+        script = Initializer(str(tmp_path))._build_init_script()
+        check = script[script.index("app_running() {"):]
+        check = check[:check.index("\n}\n") + 3]
+
+        with socket.socket() as server:
+            server.bind(("127.0.0.1", 0))
+            server.listen()
+            port = server.getsockname()[1]
+            results = [
+                subprocess.run(
+                    ["bash", "-c", f"PORT={p}\nHEALTH_ENDPOINT=/\n{check}app_running"],
+                    capture_output=True,
+                ).returncode
+                for p in (port, port + 1 if port < 65535 else port - 1)
+            ]
+
+        assert results[0] == 0
+        assert results[1] != 0
+        assert script.index("/dev/tcp/localhost/$PORT") < script.index("curl -s")
+
+    @pytest.mark.skipif(not shutil.which("jq"), reason="jq not installed")
+    @pytest.mark.parametrize(
+        "features,expected,absent",
+        [
+            (
+                {"current_phase": "Phase 2", "features": [
+                    {"id": "F-1", "name": "Done", "status": "completed"},
+                    {"id": "F-2", "name": "Next", "status": "pending"},
+                    {"id": "F-3", "name": "Doing", "status": "in_progress"},
+                ]},
+                ["Current Phase: Phase 2", "In Progress: F-3: Doing"],
+                "Next Pending",
+            ),
+            (
+                {"current_phase": "Phase 1", "features": [
+                    {"id": "F-1", "name": "Later", "status": "pending"},
+                    {"id": "F-2", "name": "Last", "status": "pending"},
+                ]},
+                ["Next Pending: F-1: Later"],
+                "In Progress",
+            ),
+            ({"features": []}, ["Current Phase: "], "Pending"),
+        ],
+    )
+    def test_init_script_session_progress(self, tmp_path, features, expected, absent):
+        """Test the single jq pass over features.json in init.sh."""
+        harness_dir = tmp_path / ".claude-harness"
+        harness_dir.mkdir()
+        (harness_dir / "features.json").write_text(json.dumps(features))
+
+        output = self._run_session_progress(tmp_path)
+
+        for line in expected:
+            assert line in output
+        assert absent not in output
+
+    def test_init_script_last_session_summary(self, tmp_path):
+        """Test init.sh prints at most 25 lines of the Last Session section."""
+        harness_dir = tmp_path / ".claude-harness"
+        harness_dir.mkdir()
+        lines = [f"note {i}" for i in range(40)]
+        (harness_dir / "progress.md").write_text(
+            "# Log\n\n## Last Session: today\nfirst\n## Previous Sessions\nold\n"
+            "## Last Session: again\n" + "\n".join(lines) + "\n"
+        )
+
+        output = self._run_session_progress(tmp_path)
+
+        assert "first" in output and "## Previous Sessions" in output
+        assert "old" not in output and "# Log" not in output
+        assert "note 20\n" in output and "note 21\n" not in output
+
+    def test_init_script_prints_parallel_checks_in_order(self, tmp_path):
+        """Test that background checks are still reported in section order."""
+        init = Initializer(str(tmp_path))
+        init.config = HarnessConfig(database="sqlite", port=1)
+        init._write_file(".claude-harness/config.json", init.config.to_json())
+        init._write_file("scripts/init.sh", init._build_init_script(), mode=0o755)
+
+        result = subprocess.run(
+            ["bash", "scripts/init.sh"], input="n", capture_output=True,
+            text=True, cwd=tmp_path, timeout=60,
+        )
+
+        assert result.returncode == 0, result.stderr
+        headers = [f"[{i}/6]" for i in range(1, 7)]
+        positions = [result.stdout.index(header) for header in headers]
+        assert positions == sorted(positions)
+        assert "Git not available or not a repository" in result.stdout
+
+    @pytest.mark.skipif(not shutil.which("jq"), reason="jq not installed")
+    def test_init_script_reads_config_in_one_pass(self, tmp_path):
+        """Test init.sh reads all config values with one jq call, falling back to defaults."""
+        init = Initializer(str(tmp_path))
+        init.config = HarnessConfig(
+            project_name="demo app", port=5000, database=None,
+            protected_branches=["main", "release"], test_directory="spec",
+        )
+        script = init._build_init_script()
+        start = script.index("# Read config values")
+        block = script[start:script.index("\nfi\n", start) + 4]
+        assert block.count("jq -r") == 1
+
+        def read_config(config_text):
+            (tmp_path / "config.json").write_bytes(config_text)
+            result = subprocess.run(
+                ["bash", "-c", f'set -eo pipefail\nHAVE_JQ=1\nCONFIG=config.json\n{block}'
+                 'printf "%s|" "$PROJECT_NAME" "$PORT" "$DATABASE" "$TEST_DIR" "$PROTECTED"'],
+                capture_output=True, text=True, cwd=tmp_path,
+            )
+            assert result.returncode == 0, result.stderr
+            return result.stdout
+
+        assert read_config(init.config.to_json()) == "demo app|5000||spec|main release|"
+        assert read_config(b"not json") == "project|8000||tests|main master|"
+
+    @pytest.mark.skipif(not shutil.which("jq"), reason="jq not installed")
+    def test_init_script_caches_test_count(self, tmp_path):
+        """Test check_tests reuses the collected count until a test file changes."""
+        script = Initializer(str(tmp_path))._build_init_script()
+        start = script.index("check_tests() {")
+        check_tests = script[start:script.index("\n}\n", start) + 3]
+
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        fake = bin_dir / "pytest"
+        fake.write_text('#!/bin/bash\necho run >> pytest.log\necho "3 tests collected in 0.01s"\n')
+        fake.chmod(0o755)
+        tests_dir = tmp_path / "tests"
+        tests_dir.mkdir()
+        (tests_dir / "test_a.py").write_text("")
+        os.utime(tests_dir / "test_a.py", (1, 1))
+
+        def run_check():
+            result = subprocess.run(
+                ["bash", "-c", f'set -eo pipefail\nHAVE_PYTEST=1\nHAVE_JQ=1\nTEST_DIR=tests\n'
+                 f'{check_tests}check_tests'],
+                capture_output=True, text=True, cwd=tmp_path,
+                env={**os.environ, "PATH": f"{bin_dir}:{os.environ['PATH']}"},
+            )
+            assert result.returncode == 0, result.stderr
+            return result.stdout
+
+        log = tmp_path / "pytest.log"
+        assert "Found: 3 tests" in run_check()
+        assert "Found: 3 tests" in run_check()
+        assert log.read_text().count("run") == 1
+
+        (tests_dir / "test_b.py").write_text("")
+        os.utime(tmp_path / ".claude-harness" / ".cache" / "test-count", (2, 2))
+        run_check()
+        assert log.read_text().count("run") == 2
+
+        last_failed = tmp_path / ".pytest_cache" / "v" / "cache" / "lastfailed"
+        last_failed.parent.mkdir(parents=True)
+        last_failed.write_text('{"tests/test_a.py::test_x": true}')
+        assert "Last run: 1 failing" in run_check()
+        assert log.read_text().count("run") == 2
+
+    def test_init_script_reads_branch_from_head(self, tmp_path):
+        """Test check_git reads the branch from HEAD, including in worktrees."""
+        script = Initializer(str(tmp_path))._build_init_script()
+        start = script.index("check_git() {")
+        check_git = script[start:script.index("\n}\n", start) + 3]
+        assert "git branch --show-current" not in check_git
+
+        def branch_line(cwd):
+            result = subprocess.run(
+                ["bash", "-c", f'set -eo pipefail\nHAVE_GIT=1\nPROTECTED=main\n{check_git}check_git'],
+                capture_output=True, text=True, cwd=cwd,
+            )
+            assert result.returncode == 0, result.stderr
+            return result.stdout.splitlines()[1]
+
+        repo = tmp_path / "repo"
+        git = ["git", "-c", "user.name=t", "-c", "user.email=t@example.com"]
+        subprocess.run(["git", "init", "-q", "-b", "feat/x", str(repo)], check=True)
+        assert branch_line(repo) == "  Branch: feat/x"
+
+        subprocess.run(git + ["commit", "-q", "--allow-empty", "-m", "init"], cwd=repo, check=True)
+        worktree = tmp_path / "wt"
+        subprocess.run(["git", "worktree", "add", "-q", "-b", "main", str(worktree)], cwd=repo, check=True)
+        assert "protected branch 'main'" in branch_line(worktree)
+
+        subprocess.run(["git", "checkout", "-q", "--detach"], cwd=repo, check=True)
+        assert branch_line(repo) == "  Branch: (detached)"
+
+    def test_init_script_tunes_git_once(self, tmp_path):
+        """Test check_git enables the untracked cache once, keeping user settings."""
+        script = Initializer(str(tmp_path))._build_init_script()
+        start = script.index("check_git() {")
+        check_git = script[start:script.index("\n}\n", start) + 3]
+
+        def run_check():
+            result = subprocess.run(
+                ["bash", "-c", f'set -eo pipefail\nHAVE_GIT=1\n{check_git}check_git'],
+                capture_output=True, text=True, cwd=tmp_path,
+            )
+            assert result.returncode == 0, result.stderr
+
+        def untracked_cache():
+            return subprocess.run(
+                ["git", "config", "--get", "core.untrackedCache"],
+                capture_output=True, text=True, cwd=tmp_path,
+            ).stdout.strip()
+
+        subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+        run_check()
+        assert untracked_cache() == "true"
+        assert (tmp_path / ".claude-harness" / ".cache" / "git-tuned").exists()
+
+        # Tuned once: a later opt-out by the user stays put
+        subprocess.run(["git", "config", "core.untrackedCache", "false"], cwd=tmp_path, check=True)
+        run_check()
+        assert untracked_cache() == "false"
+
+        (tmp_path / ".claude-harness" / ".cache" / "git-tuned").unlink()
+        run_check()
+        assert untracked_cache() == "false"
+
+        init = Initializer(str(tmp_path))
+        init.config = HarnessConfig(git_auto_tune=False)
+        assert "core.untrackedCache" not in init._build_init_script()
+        assert "core.untrackedCache" not in init._build_init_powershell()
+
+    def test_init_script_git_dirty_probe(self, tmp_path):
+        """Test the early-exit dirty check matches what git status reports."""
+        init = Initializer(str(tmp_path))
+        init.config = HarnessConfig(git_auto_tune=False)
+        script = init._build_init_script()
+        start = script.index("check_git() {")
+        check_git = script[start:script.index("\n}\n", start) + 3]
+
+        def run_check():
+            result = subprocess.run(
+                ["bash", "-c", f'set -eo pipefail\nHAVE_GIT=1\n{check_git}check_git'],
+                capture_output=True, text=True, cwd=tmp_path,
+            )
+            assert result.returncode == 0, result.stderr
+            return "Uncommitted changes detected" in result.stdout
+
+        git = ["git", "-c", "user.name=t", "-c", "user.email=t@example.com"]
+        subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+        (tmp_path / "app.py").write_text("print('hi')\n")
+        (tmp_path / ".gitignore").write_text("*.log\n")
+        subprocess.run(git + ["add", "-A"], cwd=tmp_path, check=True)
+        subprocess.run(git + ["commit", "-qm", "init"], cwd=tmp_path, check=True)
+
+        (tmp_path / "debug.log").write_text("ignored\n")
+        os.utime(tmp_path / "app.py", (1, 1))
+        assert run_check() is False
+
+        (tmp_path / "app.py").write_text("print('bye')\n")
+        assert run_check() is True
+
+        subprocess.run(["git", "checkout", "-q", "app.py"], cwd=tmp_path, check=True)
+        (tmp_path / "new").mkdir()
+        (tmp_path / "new" / "module.py").write_text("")
+        assert run_check() is True
+
+    def test_init_script_sources_env_file(self, tmp_path):
+        """Test the env file is sourced with auto-export, keeping quoted values."""
+        script = Initializer(str(tmp_path))._build_init_script()
+        start = script.index('        if [[ -n "$ENV_FILE" ]] && [[ -f "$ENV_FILE" ]]; then\n            # Auto')
+        load_env = script[start:script.index("        fi\n", start) + 11]
+        assert "xargs" not in script
+
+        (tmp_path / ".env").write_text(
+            '# comment\nSECRET="a b"\nQUOTE=\'it "works"\'\nnot a valid line\nLAST=1\n'
+        )
+        result = subprocess.run(
+            ["bash", "-c", f'set -eo pipefail\nENV_FILE=.env\n{load_env}'
+             'bash -c \'printf "%s|%s|%s" "$SECRET" "$QUOTE" "$LAST"\''],
+            capture_output=True, text=True, cwd=tmp_path,
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout == 'a b|it "works"|1'
+
+    def test_init_script_banners_printed_once(self, tmp_path):
+        """Test the header and footer banners are single printfs with real colors."""
+        init = Initializer(str(tmp_path))
+        init.config = HarnessConfig(port=1)
+        init._write_file(".claude-harness/config.json", init.config.to_json())
+        script = init._build_init_script()
+        init._write_file("scripts/init.sh", script, mode=0o755)
+
+        assert 'echo -e "${BLUE}====' not in script
+        assert script.count("printf '%s\\n'") == 2
+
+        result = subprocess.run(
+            ["bash", "scripts/init.sh"], input="n", capture_output=True,
+            text=True, cwd=tmp_path, timeout=60,
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert "\x1b[0;34m  CLAUDE HARNESS - Session Initialization\x1b[0m" in result.stdout
+        assert "\x1b[0;32m  Ready to work!\x1b[0m" in result.stdout
+        assert "\\033" not in result.stdout
+
+    def test_init_script_probes_tools_once(self, tmp_path):
+        """Test init.sh looks each tool up once, up front."""
+        script = Initializer(str(tmp_path))._build_init_script()
+
+        assert "set -eo pipefail" in script
+        probed = [line for line in script.splitlines() if "command -v" in line]
+        assert len(probed) == 5
+        assert all(line.startswith("HAVE_") for line in probed)
+
+    def test_init_script_env_without_database_url(self, tmp_path):
+        """Test an .env without DATABASE_URL doesn't abort the DB check under pipefail."""
+        init = Initializer(str(tmp_path))
+        init.config = HarnessConfig(database="postgresql")
+        init._write_file(".claude-harness/config.json", init.config.to_json())
+        init._write_file(".env", "OTHER=1\n")
+        init._write_file("scripts/init.sh", init._build_init_script(), mode=0o755)
+
+        result = subprocess.run(
+            ["bash", "scripts/init.sh"], input="n", capture_output=True,
+            text=True, cwd=tmp_path, timeout=60,
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert "postgresql" in result.stdout.split("[4/6]")[1].split("[5/6]")[0]
+
+    def _run_session_progress(self, project_path) -> str:
+        script = Initializer(str(project_path))._build_init_script()
+        section = script[
+            script.index("# 6. Session Progress"):script.rindex("printf '%s\\n'")
+        ]
+        harness_dir = project_path / ".claude-harness"
+        result = subprocess.run(
+            ["bash", "-c", f'set -eo pipefail\nHAVE_JQ=1\nHARNESS_DIR="{harness_dir}"\n{section}'],
+            capture_output=True, text=True,
+        )
+        assert result.returncode == 0, result.stderr
+        return result.stdout
+
+
+class TestInitPowerShell:
+    """Tests for the rendered init.ps1."""
+
+    def test_init_powershell_backend_and_venv(self, tmp_path):
+        """Test init.ps1 rendering for a Python project in a backend directory."""
+        init = Initializer(str(tmp_path))
+        init.config = HarnessConfig(
+            project_name="demo",
+            backend_directory="backend",
+            venv_path="venv",
+            database="postgresql",
+            protected_branches=["main", "release"],
+        )
+
+        script = init._build_init_powershell()
+
+        assert '$venvActivate = "backend/venv/Scripts/Activate.ps1"' in script
+        assert '$protectedBranches = @("main", "release")' in script
+        assert script.count('Push-Location "backend"') == 2
+        assert script.count("Pop-Location") == 2
+        assert "[4/6] DATABASE (postgresql)" in script
+        assert script.endswith('Write-Host ""\n')
+
+    def test_init_powershell_non_python(self, tmp_path):
+        """Test init.ps1 rendering skips venv and the app DB check for other stacks."""
+        init = Initializer(str(tmp_path))
+        init.config = HarnessConfig(
+            language="javascript",
+            test_framework="jest",
+            unit_test_command="npm test",
+            database="postgresql",
+        )
+
+        script = init._build_init_powershell()
+
+        assert "No virtual environment needed" in script
+        # Port probe only; the login check runs on Python
+        assert "$dbPort = 5432" in script
+        assert "python -c" not in script
+        assert 'Write-ColorOutput "  Run: npm test" "Yellow"' in script
+        assert "Push-Location" not in script
+
+    def test_init_powershell_streams_progress(self, tmp_path):
+        """Test init.ps1 streams progress.md instead of reading it whole."""
+        script = Initializer(str(tmp_path))._build_init_powershell()
+
+        assert "switch -Regex -File $progressFile" in script
+        assert "Get-Content $progressFile" not in script
+
+    def test_init_powershell_reuses_http_client(self, tmp_path):
+        """Test init.ps1 health checks share one pooled HttpClient."""
+        script = Initializer(str(tmp_path))._build_init_powershell()
+
+        assert script.count("[System.Net.Http.HttpClient]::new(") == 1
+        assert script.count("Test-AppHealth") == 3
+        assert "Invoke-WebRequest" not in script
+
+    def test_init_powershell_port_check_before_http(self, tmp_path):
+        """Test init.ps1 skips the HTTP request when there is no health endpoint."""
+        init = Initializer(str(tmp_path))
+        script = init._build_init_powershell()
+        assert 'ConnectAsync("localhost", $port).Wait(500)' in script
+        assert "$httpClient.GetAsync($healthUrl)" in script
+
+        init.config = HarnessConfig(health_endpoint="/")
+        script = init._build_init_powershell()
+        assert 'ConnectAsync("localhost", $port).Wait(500)' in script
+        assert "$httpClient.GetAsync($healthUrl)" not in script
+
+    def test_init_powershell_runs_probes_as_jobs(self, tmp_path):
+        """Test init.ps1 runs git, database and tests as thread jobs."""
+        init = Initializer(str(tmp_path))
+        init.config = HarnessConfig(database="postgresql")
+
+        script = init._build_init_powershell()
+
+        assert script.count("Start-ThreadJob") == 3
+        assert script.count("Set-Location $using:projectRoot") == 3
+        assert "$using:Deep" in script
+        # Jobs are received in section order, around the interactive app check
+        assert (
+            script.index("$gitJob | Receive-Job -Wait")
+            < script.index("[3/6] APPLICATION")
+            < script.index("$dbJob, $testsJob | Receive-Job -Wait")
+            < script.index("[6/6] SESSION PROGRESS")
+        )
+        # The here-string body and terminator must stay at column 0
+        assert "\n'@\n" in script
+        assert "\ntry:\n" in script
+
+
+class TestReuseExistingConfig:
+    """Tests for reusing an existing config.json on re-init."""
+
+    def _write_config(self, path, **kwargs):
+        harness_dir = path / ".claude-harness"
+        harness_dir.mkdir()
+        config = HarnessConfig(**kwargs)
+        (harness_dir / "config.json").write_text(json.dumps(config.to_dict()))
+
+    def test_no_config_does_not_prompt(self, tmp_path):
+        """Test that a fresh project goes straight to the wizard."""
+        init = Initializer(str(tmp_path))
+
+        with patch("claude_harness.initializer.questionary") as mock_q:
+            assert init._reuse_existing_config() is False
+
+        mock_q.confirm.assert_not_called()
+        assert init.previous_config is None
+
+    def test_reuse_accepted_skips_questions(self, tmp_path):
+        """Test that accepting reuse skips the interactive questions."""
+        self._write_config(tmp_path, project_name="saved", port=4321)
+        init = Initializer(str(tmp_path))
+
+        with patch("claude_harness.initializer.questionary") as mock_q:
+            mock_q.confirm.return_value.ask.return_value = True
+            with patch.object(init, "_ask_questions") as mock_ask:
+                config = init.run()
+
+        mock_ask.assert_not_called()
+        assert config.project_name == "saved"
+        assert config.port == 4321
+
+    def test_reuse_declined_prefills_defaults(self, tmp_path):
+        """Test that declining reuse keeps saved values as prompt defaults."""
+        self._write_config(tmp_path, project_name="saved", port=4321)
+        init = Initializer(str(tmp_path))
+
+        with patch("claude_harness.initializer.questionary") as mock_q:
+            mock_q.confirm.return_value.ask.return_value = False
+            assert init._reuse_existing_config() is False
+
+        assert init._previous("project_name", "fallback") == "saved"
+        assert init._previous("port", 8000) == 4321
+        assert init._previous_choice(init.LANGUAGE_CHOICES, "language") == "Python"
+
+    def test_invalid_config_is_ignored(self, tmp_path):
+        """Test that an unreadable config.json falls back to the wizard."""
+        (tmp_path / ".claude-harness").mkdir()
+        (tmp_path / ".claude-harness" / "config.json").write_text("{not json")
+        init = Initializer(str(tmp_path))
+
+        assert init._reuse_existing_config() is False
+        assert init.previous_config is None
+
+
+class TestUpdateGitignore:
+    """Tests for _update_gitignore."""
+
+    BASELINE = (
+        "*.log\n"
+        "\n"
+        "# Claude Harness - session-specific files\n"
+        ".claude-harness/context_metrics.json\n"
+        ".claude-harness/session-history/\n"
+        ".claude-harness/discoveries.json\n"
+    )
+
+    def test_adds_new_entries_to_baseline_gitignore(self, tmp_path, capsys):
+        """Test that a gitignore from an older init gains only the missing entries."""
+        (tmp_path / ".gitignore").write_text(self.BASELINE)
+        init = Initializer(str(tmp_path))
+
+        init._update_gitignore()
+        content = (tmp_path / ".gitignore").read_text()
+
+        assert content.startswith(self.BASELINE)
+        assert content.count(".claude-harness/context_metrics.json") == 1
+        assert content.count("# Claude Harness - session-specific files") == 1
+        assert ".claude-harness/.cache/\n" in content
+        assert "Updated: .gitignore (added harness session files)" in capsys.readouterr().out
+
+        init._update_gitignore()
+        assert (tmp_path / ".gitignore").read_text() == content
+        assert "Preserved: .gitignore (harness entries exist)" in capsys.readouterr().out
+
+    def test_ignores_hook_queue_files_on_existing_projects(self, tmp_path):
+        """Test that re-init ignores the hook event queues in an older gitignore."""
+        subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+        (tmp_path / ".gitignore").write_text(self.BASELINE + ".claude-harness/.cache/\n")
+        harness = tmp_path / ".claude-harness"
+        harness.mkdir()
+        for name in (".pending-events", ".pending-events.123", ".pending-reads"):
+            (harness / name).write_text("track-read\tsrc/a.py\t12\n")
+
+        Initializer(str(tmp_path))._update_gitignore()
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=all"],
+            cwd=tmp_path, capture_output=True, text=True, check=True,
+        ).stdout
+
+        assert ".pending-" not in status
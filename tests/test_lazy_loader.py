@@ -5,6 +5,7 @@ based on task type and file importance, deferring non-critical files to
 save context tokens.
 """
 
+import os
 import pytest
 from pathlib import Path
 
@@ -126,6 +127,54 @@ class TestPrioritizeFiles:
         assert prioritized[0].priority == FilePriority.SKIP
 
 
+class TestPatternMatching:
+    """Tests for the precompiled classification patterns."""
+
+    @pytest.fixture
+    def loader(self):
+        """Create a LazyContextLoader instance."""
+        return LazyContextLoader()
+
+    def test_skip_reason_names_first_listed_pattern(self, loader):
+        """Test the skip reason follows list order, not match position."""
+        priority, reason = loader._classify_file("build/test_main.py")
+        assert priority == FilePriority.SKIP
+        assert reason == "Matches skip pattern: test_"
+
+    def test_test_task_keeps_test_files(self, loader):
+        """Test that test tasks drop only the test-file skip patterns."""
+        priority, _ = loader._classify_file("tests/test_orders.py", task_type="Testing")
+        assert priority == FilePriority.IMPORTANT
+
+        priority, reason = loader._classify_file("build/test_main.py", task_type="test")
+        assert priority == FilePriority.SKIP
+        assert reason == "Matches skip pattern: build"
+
+    def test_patterns_match_literally(self, loader):
+        """Test that regex metacharacters in patterns are matched literally."""
+        assert loader._match_patterns("MAIN.py", ["main."])
+        assert not loader._match_patterns("mainxpy", ["main."])
+        assert not loader._match_patterns("anything", [])
+
+
+    def test_classification_builds_no_paths(self, tmp_path, monkeypatch):
+        """Test that planning files works on plain strings, without Path objects."""
+        (tmp_path / "main.py").write_text("x" * 7)
+        loader = LazyContextLoader(str(tmp_path))
+
+        def no_paths(*args):
+            raise AssertionError("Path constructed")
+
+        monkeypatch.setattr("claude_harness.lazy_loader.Path", no_paths)
+        prioritized = loader.prioritize_files(["main.py", "src/Orders.GO", "notes"])
+
+        assert [(pf.filepath, pf.priority, pf.estimated_tokens) for pf in prioritized] == [
+            ("main.py", FilePriority.CRITICAL, 2),
+            ("src/Orders.GO", FilePriority.IMPORTANT, 0),
+            ("notes", FilePriority.REFERENCE, 0),
+        ]
+
+
 class TestTaskTypeAffectsPriority:
     """Tests for how task type affects file prioritization."""
 
@@ -192,6 +241,55 @@ class TestEstimateDeferredSavings:
         assert savings >= 0  # Should be non-negative
 
 
+class TestStatPrewarm:
+    """Tests for batching file stats per directory."""
+
+    def test_prewarm_scans_shared_directories(self, tmp_path, monkeypatch):
+        """Test that one directory listing supplies sizes for its files."""
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "a.py").write_text("x" * 35)
+        (src / "b.md").write_text("x" * 40)
+        (tmp_path / "lone.md").write_text("x" * 8)
+        loader = LazyContextLoader(str(tmp_path))
+        monkeypatch.setattr("claude_harness.lazy_loader.os.name", "nt")
+
+        loader._prewarm(["src/a.py", "src/b.md", "lone.md", "src/missing.py"])
+
+        assert sorted(os.path.basename(p) for p in loader._stat_cache) == ["a.py", "b.md"]
+        assert loader._estimate_file_tokens("src/a.py") == 10
+        assert loader._estimate_file_tokens("src/b.md") == 10
+        assert loader._estimate_file_tokens("lone.md") == 2
+        assert loader._estimate_file_tokens("src/missing.py") == 0
+
+    def test_prewarm_skipped_off_windows(self, tmp_path, monkeypatch):
+        """Test that no stats are collected where DirEntry.stat() is a syscall."""
+        (tmp_path / "a.py").write_text("x")
+        (tmp_path / "b.py").write_text("x")
+        loader = LazyContextLoader(str(tmp_path))
+        monkeypatch.setattr("claude_harness.lazy_loader.os.name", "posix")
+
+        loader._prewarm(["a.py", "b.py"])
+
+        assert loader._stat_cache == {}
+
+
+class TestEstimateFileTokens:
+    """Tests for _estimate_file_tokens."""
+
+    @pytest.mark.parametrize("size", [0, 3, 4, 7, 10, 349, 1000, 123457])
+    def test_matches_chars_per_token_ratios(self, tmp_path, size):
+        """Test the integer estimate equals truncated division by each ratio."""
+        from claude_harness.lazy_loader import CHARS_PER_TOKEN, CODE_CHARS_PER_TOKEN
+
+        (tmp_path / "code.PY").write_text("x" * size)
+        (tmp_path / "notes.txt").write_text("x" * size)
+        loader = LazyContextLoader(str(tmp_path))
+
+        assert loader._estimate_file_tokens("code.PY") == int(size / CODE_CHARS_PER_TOKEN)
+        assert loader._estimate_file_tokens("notes.txt") == int(size / CHARS_PER_TOKEN)
+
+
 class TestGenerateDeferralNote:
     """Tests for generate_deferral_note method."""
 
@@ -269,6 +367,33 @@ class TestGetLoadingPlan:
         assert "skipped_count" in summary
 
 
+    def test_plan_estimates_each_file_once(self, tmp_path, monkeypatch):
+        """Test the deferral note reuses token estimates instead of re-reading files."""
+        (tmp_path / "main.py").write_text("x" * 70)
+        (tmp_path / "README.md").write_text("x" * 400)
+        loader = LazyContextLoader(str(tmp_path))
+
+        estimated = []
+        original = loader._estimate_file_tokens
+        monkeypatch.setattr(
+            loader,
+            "_estimate_file_tokens",
+            lambda fp: estimated.append(fp) or original(fp),
+        )
+        plan = loader.get_loading_plan(["main.py", "README.md"])
+
+        assert sorted(estimated) == ["README.md", "main.py"]
+        assert plan["tokens_immediate"] == 20
+        assert "~100 tokens saved" in plan["deferral_note"]
+
+    def test_classification_memoized(self, loader, monkeypatch):
+        """Test that repeated planning reuses classifications."""
+        loader.get_loading_plan(["main.py"], task_type="test")
+        monkeypatch.setattr(loader, "_classify_uncached", None)
+
+        assert loader.should_load_now("main.py", task_type="test") is True
+
+
 class TestLoadingOrder:
     """Tests for file loading order logic."""
 
@@ -290,6 +415,22 @@ class TestLoadingOrder:
         assert prioritized[0].priority == FilePriority.CRITICAL
 
 
+    def test_order_stable_within_priority(self, loader):
+        """Test that files keep their input order within a priority level."""
+        files = ["docs/b.md", "models/z.py", "main.py", "README.md", "api.py", "app.py"]
+
+        prioritized = loader.prioritize_files(files)
+        plan = loader.get_loading_plan(files)
+
+        assert [pf.filepath for pf in prioritized] == [
+            "main.py", "app.py", "models/z.py", "api.py", "docs/b.md", "README.md",
+        ]
+        assert [f["filepath"] for f in plan["immediate"]] == [
+            "main.py", "app.py", "models/z.py", "api.py",
+        ]
+        assert [f["filepath"] for f in plan["deferred"]] == ["docs/b.md", "README.md"]
+
+
 class TestEdgeCases:
     """Tests for edge cases and boundary conditions."""
 